@@ -2,54 +2,103 @@
 from datetime import timezone, datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-
-from app.db import postgres
-from app.core.security import hash_password, verify_password, create_access_token
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from app.db import postgres_async
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.rate_limit import SlidingWindowLimiter
+from app.core.security import (
+    PasswordHashBusy,
+    hash_password_async,
+    verify_password_async,
+    create_access_token,
+)
 from app.schemas.user_schema import UserCreate, UserLogin, Token
-from app.dependencies.auth import get_current_user
+from app.dependencies.auth import get_current_user, client_ip
+from app.services import user_cache
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+_user_limiter = SlidingWindowLimiter(
+    settings.LOGIN_RATE_LIMIT_PER_USER, settings.LOGIN_RATE_WINDOW_SECONDS
+)
+_ip_limiter = SlidingWindowLimiter(
+    settings.LOGIN_RATE_LIMIT_PER_IP, settings.LOGIN_RATE_WINDOW_SECONDS
+)
+
+
+def _too_many(retry_after: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="요청이 너무 많습니다. 잠시 후 다시 시도하세요.",
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+def _throttle(request: Request, username: str | None = None) -> None:
+    """해싱 전에 IP/username 별 시도 횟수를 확인해서 초과 시 바로 429."""
+    ip = client_ip(request)
+    if not _ip_limiter.hit(ip):
+        metrics.inc("auth_throttled_total", scope="ip")
+        raise _too_many(_ip_limiter.retry_after(ip))
+    if username is not None and not _user_limiter.hit(username):
+        metrics.inc("auth_throttled_total", scope="user")
+        raise _too_many(_user_limiter.retry_after(username))
+
+
+async def _hash_or_429(coro):
+    try:
+        return await coro
+    except PasswordHashBusy:
+        raise _too_many(1)
+
 
 @router.post("/register", response_model=Token)
-def register_user(body: UserCreate):
+async def register_user(body: UserCreate, request: Request):
     """
     관리자/초기 설정용: 사용자 등록 + 바로 토큰 발급.
     - username 중복이면 덮어쓰기(비번/만료일 갱신)
     """
+    _throttle(request)
+
     # naive datetime이면 UTC로 가정
     expires_at = body.expires_at
     if expires_at.tzinfo is None:
         expires_at = expires_at.replace(tzinfo=timezone.utc)
 
-    password_hash = hash_password(body.password)
-    postgres.create_user(
+    # 해싱은 CPU 작업이므로 별도 프로세스 풀에서 실행
+    password_hash = await _hash_or_429(hash_password_async(body.password))
+    await postgres_async.create_user(
         username=body.username,
         password_hash=password_hash,
         expires_at=expires_at,
         is_active=True,
     )
+    # 이 워커의 캐시는 바로 비우고, 다른 워커는 NOTIFY 로 비운다
+    user_cache.invalidate(body.username)
 
     access_token = create_access_token({"sub": body.username})
     return Token(access_token=access_token)
 
 
 @router.post("/login", response_model=Token)
-def login(body: UserLogin):
+async def login(body: UserLogin, request: Request):
     """
     클라이언트에서 호출할 로그인 API.
     JSON 예:
       { "username": "test", "password": "1234" }
     """
-    user = postgres.get_user(body.username)
+    _throttle(request, body.username)
+
+    user = await postgres_async.get_user(body.username)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="잘못된 ID 또는 비밀번호입니다.",
         )
 
-    if not verify_password(body.password, user["password_hash"]):
+    if not await _hash_or_429(verify_password_async(body.password, user["password_hash"])):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="잘못된 ID 또는 비밀번호입니다.",
@@ -77,7 +126,7 @@ def login(body: UserLogin):
 
 
 @router.get("/me")
-def read_me(current_user: Annotated[dict, Depends(get_current_user)]):
+async def read_me(current_user: Annotated[dict, Depends(get_current_user)]):
     """
     토큰/만료일 잘 동작하는지 확인용.
     """
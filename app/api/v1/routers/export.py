@@ -0,0 +1,82 @@
+# app\api\v1\routers\export.py
+from datetime import datetime, timedelta, timezone
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.db.postgres_async import iter_export_rows
+from app.dependencies.auth import get_current_user
+from app.services.export_service import ndjson_stream
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+
+def _time_range(since: datetime | None, until: datetime | None) -> tuple[datetime, datetime]:
+    """기본값: 최근 24시간. naive datetime 이면 UTC 로 가정."""
+    until = until or datetime.now(timezone.utc)
+    since = since or until - timedelta(hours=24)
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if until.tzinfo is None:
+        until = until.replace(tzinfo=timezone.utc)
+    if since >= until:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="since 는 until 보다 이전이어야 합니다.",
+        )
+    return since, until
+
+
+def _split_categories(category: str | None) -> list[str] | None:
+    if not category:
+        return None
+    cats = [c.strip() for c in category.split("|") if c.strip()]
+    return cats or None
+
+
+def _export_response(table: str, rows, gzip: bool) -> StreamingResponse:
+    filename = f"{table}.ndjson" + (".gz" if gzip else "")
+    return StreamingResponse(
+        ndjson_stream(rows, gzip=gzip),
+        media_type="application/gzip" if gzip else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/naver-ranking-news", summary="네이버 랭킹뉴스 원본 내보내기(NDJSON)")
+async def export_naver_ranking_news(
+    current_user: Annotated[dict, Depends(get_current_user)],
+    since: datetime | None = Query(None, description="수집 시각 시작(포함). 기본: until - 24시간"),
+    until: datetime | None = Query(None, description="수집 시각 끝(미포함). 기본: 현재"),
+    category: str | None = Query(None, description="카테고리 (다중: 정치|경제)"),
+    press: str | None = Query(None, description="언론사 이름"),
+    gzip: bool = Query(False, description="gzip 압축(.ndjson.gz)으로 내려받기"),
+):
+    """
+    naver_ranking_news 행(raw_json 포함)을 서버 측 커서로 읽어 NDJSON 으로 스트리밍.
+    행 수와 무관하게 메모리 사용량이 일정하다.
+    """
+    since, until = _time_range(since, until)
+    rows = iter_export_rows(
+        "naver_ranking_news", since, until,
+        categories=_split_categories(category), press=press,
+    )
+    return _export_response("naver_ranking_news", rows, gzip)
+
+
+@router.get("/trending-keywords", summary="트렌드 키워드 원본 내보내기(NDJSON)")
+async def export_trending_keywords(
+    current_user: Annotated[dict, Depends(get_current_user)],
+    since: datetime | None = Query(None, description="수집 시각 시작(포함). 기본: until - 24시간"),
+    until: datetime | None = Query(None, description="수집 시각 끝(미포함). 기본: 현재"),
+    category: str | None = Query(None, description="카테고리 (다중: 정치|경제, 하나라도 포함)"),
+    gzip: bool = Query(False, description="gzip 압축(.ndjson.gz)으로 내려받기"),
+):
+    """trending_keywords 행(raw_json 포함)을 NDJSON 으로 스트리밍."""
+    since, until = _time_range(since, until)
+    rows = iter_export_rows(
+        "trending_keywords", since, until,
+        categories=_split_categories(category),
+    )
+    return _export_response("trending_keywords", rows, gzip)
@@ -0,0 +1,93 @@
+# app\api\v1\routers\feed.py
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.compression import available_encodings, encoded_etag, negotiate
+from app.db.postgres_async import list_feed_articles
+from app.dependencies.feed_format import feed_format
+from app.services.feed_service import (
+    cursor_headers,
+    decode_cursor,
+    feed_validators,
+    is_not_modified,
+    rendered_feed,
+    validator_headers,
+)
+from app.services.json_feed_service import JSON_FEED_MEDIA_TYPE, build_json_feed
+from app.services.rss_service import build_rss_xml
+
+router = APIRouter(prefix="/feed", tags=["feed"])
+
+
+def _cursor(name: str, value: str | None):
+    if not value:
+        return None
+    try:
+        return decode_cursor(value)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{name} 커서 형식이 올바르지 않습니다.",
+        )
+
+
+@router.get("", summary="게시된 글 피드 (RSS / JSON Feed, 조건부 GET, 압축 지원)")
+async def read_feed(
+    request: Request,
+    category: str | None = Query(None, description="카테고리 (예: 정치|경제). 없으면 전체"),
+    limit: int = Query(50, ge=1, le=200, description="최신 글 개수"),
+    since: str | None = Query(None, description="이 커서(X-Feed-Since)보다 새 글만. 폴링용"),
+    before: str | None = Query(None, description="이 커서(X-Feed-Before)보다 오래된 글만. 이전 페이지"),
+    fmt: str = Depends(feed_format),
+):
+    """
+    생성 경로에서 게시된 글을 최신순으로 반환. guid/pubDate 는 처음 게시될 때 값 그대로다.
+    ETag / Last-Modified 를 내려주며, If-None-Match / If-Modified-Since 가 맞으면 렌더링 없이 바로 304.
+    본문은 ETag 별로 한 번만 렌더링/압축해 두고 Accept-Encoding(br, gzip)에 맞는 것을 보낸다.
+
+    폴링: 응답 헤더 X-Feed-Since 를 다음 요청의 since 로 넘기면 그 뒤에 게시된 글만 받는다.
+    새 글이 limit 개를 넘으면 가장 오래된 것부터 limit 개가 오므로 빈 응답이 올 때까지 이어서 요청한다.
+    과거 글은 X-Feed-Before 를 before 로 넘겨 페이지 단위로 받는다. 항목은 항상 최신순.
+
+    format=json 또는 Accept: application/feed+json 이면 JSON Feed 1.1 (next_url 에 이전 페이지 주소).
+    """
+    rows = await list_feed_articles(category, limit, _cursor("since", since), _cursor("before", before))
+    etag, last_modified = feed_validators(rows, f"{fmt}|{request.url}")
+    cursors = cursor_headers(rows, since)
+
+    def render() -> bytes:
+        items = [{**r["article"], "guid": r["guid"], "published_at": r["published_at"]} for r in rows]
+        if fmt == "json":
+            next_url = None
+            if len(rows) == limit and "X-Feed-Before" in cursors:
+                next_url = str(request.url.remove_query_params("since").include_query_params(
+                    before=cursors["X-Feed-Before"]
+                ))
+            return build_json_feed([{"items": items}], next_url=next_url)
+        return build_rss_xml([{"items": items}])
+
+    headers = {"Vary": "Accept, Accept-Encoding", **cursors}
+    accept_encoding = request.headers.get("accept-encoding")
+
+    # 304 는 렌더링/압축 없이 바로 (캐시가 비어 있어도 폴링 비용이 DB 조회 하나로 끝나도록)
+    if is_not_modified(
+        request.headers.get("if-none-match"),
+        request.headers.get("if-modified-since"),
+        etag,
+        last_modified,
+    ):
+        encoding = negotiate(accept_encoding, available_encodings())
+        headers.update(validator_headers(encoded_etag(etag, encoding), last_modified))
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    variants = await run_in_threadpool(rendered_feed, etag, render)
+    encoding = negotiate(accept_encoding, [e for e in variants if e != "identity"])
+    headers.update(validator_headers(encoded_etag(etag, encoding), last_modified))
+
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(
+        content=variants[encoding],
+        media_type=JSON_FEED_MEDIA_TYPE if fmt == "json" else "application/rss+xml; charset=utf-8",
+        headers=headers,
+    )
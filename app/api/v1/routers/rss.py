@@ -1,23 +1,36 @@
 # app\api\v1\routers\rss.py
-from fastapi import APIRouter, Query, HTTPException, Response
-from app.db.postgres import get_top_news
+import asyncio
+import logging
+import uuid
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from app.core.singleflight import SingleFlightTimeout
+from app.db.postgres import maintain_partitions
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.postgres_async import get_top_news, get_pooled_article, create_rss_job, get_rss_job
 from app.services.llm_service import generate_rss_feed_by_gpt
-from app.services.rss_service import build_rss_xml
+from app.dependencies.feed_format import feed_format
+from app.services.feed_service import publish_async
+from app.services.json_feed_service import JSON_FEED_MEDIA_TYPE, build_json_feed
+from app.services.rss_service import build_rss_xml, iter_rss_xml
+from app.services.rss_generation_service import persona_inputs, persona_key, generation_events, FALLBACK_KEYWORD
+from app.services import rss_job_service
+from app.services.article_pool_service import POOL_PERSONA_KEY, refresh_article_pool
 
 from app.schemas.naver_ranking import NaverRankingCollectResult
+from app.schemas.rss_generation import MultiPersonaGenerateRequest
+from app.schemas.rss_job import RssJobCreated, RssJobStatus
 from app.services.naver_ranking_service import collect_and_save_naver_ranking
 
 router = APIRouter(prefix="/rss", tags=["rss"])
 
-from fastapi import APIRouter, Query, Response
+logger = logging.getLogger(__name__)
 
-from app.db.postgres import get_top_news
-from app.services.llm_service import generate_rss_feed_by_gpt
-from app.services.rss_service import build_rss_xml
 
-router = APIRouter(prefix="/rss", tags=["rss"])
-@router.post("/generate", summary="최신뉴스 기반 RSS 생성")
-def generate_rss(
+def generation_params(
     keyword: str | None = Query(
         None,
         description="키워드 (없으면 최신뉴스 제목 자동 사용)"
@@ -55,34 +68,210 @@ def generate_rss(
         '유쾌한',
         description="말투/톤"
     ),
+    no_cache: bool = Query(
+        False,
+        description="true 면 생성 캐시를 건너뛰고 새로 생성"
+    ),
+) -> dict:
+    """/generate 와 /jobs 가 공유하는 쿼리 파라미터."""
+    return {
+        "keyword": keyword,
+        "category": category,
+        "ages": ages,
+        "sex": sex,
+        "type": type,
+        "no_cache": no_cache,
+    }
+
+
+def _feed_response(raw_items: list, fmt: str) -> Response:
+    """fmt 에 맞춰 RSS 2.0 또는 JSON Feed 1.1 응답."""
+    if fmt == "json":
+        return Response(content=build_json_feed(raw_items), media_type=JSON_FEED_MEDIA_TYPE)
+    return Response(content=build_rss_xml(raw_items), media_type="application/rss+xml; charset=utf-8")
+
+
+@router.post("/generate", summary="최신뉴스 기반 RSS 생성")
+async def generate_rss(
+    params: dict = Depends(generation_params),
+    fmt: str = Depends(feed_format),
 ):
+    keyword = params["keyword"]
+
+    # 키워드 없이 기본 페르소나로 들어오면 미리 생성해 둔 기사 풀에서 바로 응답
+    if (
+        not keyword
+        and not params["no_cache"]
+        and settings.RSS_POOL_ENABLED
+        and persona_key(params["ages"], params["sex"], params["type"]) == POOL_PERSONA_KEY
+    ):
+        pooled = await get_pooled_article(params["category"], POOL_PERSONA_KEY)
+        metrics.inc("rss_pool_requests_total", result="hit" if pooled else "miss")
+        if pooled:
+            items = await publish_async(
+                {"items": [pooled["article"]]}, pooled["news_title"], pooled["category"], POOL_PERSONA_KEY
+            )
+            return _feed_response([items], fmt)
+
+    category = params["category"]
+    if not keyword:
+        row = await get_top_news(category)
+        keyword = row["title"] if row else FALLBACK_KEYWORD
+        category = row["category"] if row else category
+
+    # OpenAI 호출은 동기 클라이언트이므로 스레드풀에서 실행
+    try:
+        items = await run_in_threadpool(
+            generate_rss_feed_by_gpt,
+            keyword=keyword,
+            use_cache=not params["no_cache"],
+            **persona_inputs(params["ages"], params["sex"], params["type"]),
+        )
+    except SingleFlightTimeout:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="같은 요청의 생성이 아직 끝나지 않았습니다. 잠시 후 다시 시도해 주세요.",
+        )
+
+    items = await publish_async(
+        items, keyword, category, persona_key(params["ages"], params["sex"], params["type"])
+    )
+    return _feed_response([items], fmt)
+
+
+@router.post("/generate/personas", summary="한 뉴스로 여러 페르소나 RSS 생성")
+async def generate_rss_personas(
+    body: MultiPersonaGenerateRequest,
+    fmt: str = Depends(feed_format),
+):
+    """
+    뉴스는 한 번만 고르고(get_top_news) 페르소나마다 글을 생성해 <item> 하나씩 담은 RSS 한 건으로 반환.
+    생성은 최대 RSS_FANOUT_CONCURRENCY 개씩 동시에 실행되므로 전체 지연은 가장 느린 생성 하나에 가깝다.
+    일부 페르소나가 실패하면 그 항목만 빠지고, 전부 실패하면 502.
+    format=json 또는 Accept: application/feed+json 이면 JSON Feed 1.1 로 반환.
+    """
+    keyword, category = body.keyword, body.category
     if not keyword:
-        row = get_top_news(category)
-        keyword = row["title"] if row else "오늘의 주요 뉴스"
-
-    ages = ages or 30
-    contry_type = "대한민국"
-    sex = sex or "여성"
-    type = type or "신중한"
-
-    items = generate_rss_feed_by_gpt(
-        keyword=keyword,
-        ages=ages,
-        contry_type=contry_type,
-        sex=sex,
-        type=type,
+        row = await get_top_news(category)
+        keyword = row["title"] if row else FALLBACK_KEYWORD
+        category = row["category"] if row else category
+
+    limit = asyncio.Semaphore(settings.RSS_FANOUT_CONCURRENCY)
+
+    async def _one(persona):
+        async with limit:
+            result = await run_in_threadpool(
+                generate_rss_feed_by_gpt,
+                keyword=keyword,
+                use_cache=not body.no_cache,
+                **persona_inputs(persona.ages, persona.sex, persona.type),
+            )
+        return await publish_async(
+            result, keyword, category, persona_key(persona.ages, persona.sex, persona.type)
+        )
+
+    results = await asyncio.gather(*(_one(p) for p in body.personas), return_exceptions=True)
+
+    items = []
+    for persona, result in zip(body.personas, results):
+        if isinstance(result, Exception):
+            logger.warning("persona generation failed (%s): %r", persona, result)
+            metrics.inc("rss_fanout_items_total", outcome="failed")
+            continue
+        metrics.inc("rss_fanout_items_total", outcome="ok")
+        items.append(result)
+
+    if not items:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="모든 페르소나 생성에 실패했습니다.",
+        )
+
+    if fmt == "json":
+        return _feed_response(items, fmt)
+
+    # 항목이 여러 개라 한 번에 이어 붙이지 않고 <item> 단위로 흘려보낸다
+    return StreamingResponse(iter_rss_xml(items), media_type="application/rss+xml; charset=utf-8")
+
+
+@router.get("/generate/stream", summary="최신뉴스 기반 RSS 생성 (SSE 스트리밍)")
+async def generate_rss_stream(params: dict = Depends(generation_params)):
+    """
+    /generate 와 같은 생성을 Server-Sent Events 로 스트리밍한다.
+    title/summary/content/tags 가 생성되는 대로 delta 이벤트로 내려가고,
+    마지막 item 이벤트에 완성된 글과 RSS XML 이 담긴다. (브라우저 EventSource 로 받을 수 있도록 GET)
+    """
+    keyword, category = params["keyword"], params["category"]
+    if not keyword:
+        row = await get_top_news(category)
+        keyword = row["title"] if row else FALLBACK_KEYWORD
+        category = row["category"] if row else category
+
+    events = generation_events(
+        keyword,
+        category=category,
+        ages=params["ages"],
+        sex=params["sex"],
+        type=params["type"],
+        no_cache=params["no_cache"],
+    )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
-    xml_data = build_rss_xml([items])
-    return Response(content=xml_data, media_type="application/rss+xml; charset=utf-8")
+
+@router.post(
+    "/jobs",
+    response_model=RssJobCreated,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="RSS 생성 작업 등록 (비동기)",
+)
+async def create_generation_job(
+    request: Request,
+    params: dict = Depends(generation_params),
+) -> RssJobCreated:
+    """
+    /generate 와 같은 파라미터로 생성 작업을 등록하고 바로 job id 를 반환한다.
+    생성은 백그라운드 작업 풀에서 실행되며 GET /rss/jobs/{job_id} 로 상태/결과를 조회한다.
+    """
+    job_id = str(uuid.uuid4())
+    await create_rss_job(job_id, params)
+    rss_job_service.enqueue(job_id)
+    status_url = str(request.url_for("read_generation_job", job_id=job_id))
+    return RssJobCreated(job_id=job_id, status_url=status_url)
+
+
+@router.get("/jobs/{job_id}", response_model=RssJobStatus, summary="RSS 생성 작업 상태 조회")
+async def read_generation_job(job_id: uuid.UUID) -> RssJobStatus:
+    job = await get_rss_job(str(job_id))
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="작업을 찾을 수 없습니다.")
+
+    return RssJobStatus(
+        job_id=str(job["id"]),
+        status=job["status"],
+        params=job["params"],
+        attempts=job["attempts"],
+        created_at=job["created_at"],
+        updated_at=job["updated_at"],
+        finished_at=job["finished_at"],
+        error=job["error"],
+        rss_xml=job["result_xml"],
+    )
 
 
 
 @router.post("/naver/ranking/collect", response_model=NaverRankingCollectResult)
-def collect_naver_ranking_news() -> NaverRankingCollectResult:
+def collect_naver_ranking_news(background_tasks: BackgroundTasks) -> NaverRankingCollectResult:
     """
     네이버 랭킹뉴스(언론사별 많이 본 뉴스)를 스크래핑해서 DB에 저장하고,
     저장된 항목들을 그대로 반환하는 API.
+    응답 후 파티션 유지보수(미리 생성/보존 기간 지난 파티션 제거)와
+    기사 풀 갱신(카테고리별 상위 뉴스 기사 미리 생성)을 실행한다.
     """
     items = collect_and_save_naver_ranking()
+    background_tasks.add_task(maintain_partitions)
+    background_tasks.add_task(refresh_article_pool)
     return NaverRankingCollectResult(count=len(items), items=items)
@@ -0,0 +1,35 @@
+# app\api\v1\routers\usage.py
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from fastapi import APIRouter, Depends, Query
+
+from app.core.config import settings
+from app.db.postgres_async import get_llm_usage
+from app.dependencies.auth import require_job_token
+from app.schemas.llm_usage import LlmUsageResponse, LlmUsageRow
+from app.services.llm_usage import estimate_cost
+
+router = APIRouter(prefix="/usage", tags=["usage"], dependencies=[Depends(require_job_token)])
+
+
+@router.get("/llm", response_model=LlmUsageResponse, summary="LLM 호출 일별 사용량/지연/비용")
+async def read_llm_usage(
+    days: int = Query(7, ge=1, le=90, description="오늘 포함 최근 N일 (settings.TZ 기준 날짜)"),
+) -> LlmUsageResponse:
+    tz = ZoneInfo(settings.TZ)
+    today = datetime.now(tz).replace(hour=0, minute=0, second=0, microsecond=0)
+    since = today - timedelta(days=days - 1)
+
+    rows = await get_llm_usage(since, settings.TZ)
+    return LlmUsageResponse(
+        days=days,
+        timezone=settings.TZ,
+        rows=[
+            LlmUsageRow(
+                **r,
+                cost_usd=estimate_cost(r["prompt_tokens"], r["completion_tokens"]),
+            )
+            for r in rows
+        ],
+    )
@@ -0,0 +1,182 @@
+# app/core/compression.py
+"""
+응답 압축 (gzip + br). brotli 는 requirements.txt 에 포함돼 있고,
+패키지가 없는 환경에서는 br 만 빠지고 gzip 으로 동작한다.
+
+- negotiate: Accept-Encoding 의 q 값으로 br > gzip > identity 중 하나를 고른다.
+- encode_variants: 렌더링할 때 한 번만 압축해서 본문과 함께 캐시해 두는 용도 (GET /feed).
+- CompressionMiddleware: 나머지 JSON / RSS / JSON Feed 응답을 COMPRESSION_MIN_SIZE 이상일 때 응답마다 압축.
+  이미 Content-Encoding 이 있는 응답(미리 압축한 피드)과 Content-Length 가 없는 스트리밍 응답
+  (SSE, NDJSON 내보내기, /rss/generate/personas)은 그대로 흘려보낸다.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence
+import gzip
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+# 미들웨어가 압축하는 Content-Type
+COMPRESSIBLE_TYPES = ("application/json", "application/rss+xml", "application/feed+json")
+
+# 렌더링 시 한 번 압축(캐시됨) / 응답마다 압축할 때의 압축 수준
+PRECOMPRESS_LEVELS = {"gzip": 9, "br": 9}
+ONLINE_LEVELS = {"gzip": 6, "br": 4}
+
+
+def available_encodings() -> List[str]:
+    """서버 선호 순서대로 지원하는 인코딩."""
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def negotiate(accept_encoding: Optional[str], available: Optional[Sequence[str]] = None) -> str:
+    """available(선호 순서) 중 클라이언트가 q > 0 으로 허용한 첫 인코딩. 없으면 "identity"."""
+    if not accept_encoding:
+        return "identity"
+    if available is None:
+        available = available_encodings()
+
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        params = params.strip().replace(" ", "")
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name] = weight
+
+    best, best_weight = "identity", 0.0
+    for enc in available:
+        w = weights.get(enc, weights.get("*", 0.0))
+        if w > best_weight:
+            best, best_weight = enc, w
+    return best
+
+
+def compress(body: bytes, encoding: str, precompress: bool = False) -> bytes:
+    levels = PRECOMPRESS_LEVELS if precompress else ONLINE_LEVELS
+    if encoding == "gzip":
+        # mtime=0: 같은 본문이면 같은 바이트 (캐시/ETag 에 유리)
+        return gzip.compress(body, compresslevel=levels["gzip"], mtime=0)
+    if encoding == "br":
+        return brotli.compress(body, quality=levels["br"])
+    return body
+
+
+def encode_variants(body: bytes) -> Dict[str, bytes]:
+    """{"identity": 본문, "gzip": ..., "br": ...}. 작은 본문은 압축하지 않는다."""
+    variants = {"identity": body}
+    if len(body) >= settings.COMPRESSION_MIN_SIZE:
+        for enc in available_encodings():
+            variants[enc] = compress(body, enc, precompress=True)
+    return variants
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """인코딩별 표현은 바이트가 다르므로 강한 ETag 에 -gzip / -br 을 붙인다. ("abc" → "abc-gzip")"""
+    if encoding == "identity" or not etag.endswith('"') or etag.startswith("W/"):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def strip_encoding_suffix(etag: str) -> str:
+    """encoded_etag 의 역. If-None-Match 비교 전에 사용."""
+    for enc in ("gzip", "br"):
+        suffix = f'-{enc}"'
+        if etag.endswith(suffix):
+            return etag[: -len(suffix)] + '"'
+    return etag
+
+
+def _add_vary(headers: MutableHeaders) -> None:
+    vary = headers.get("vary")
+    if not vary:
+        headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding"
+
+
+class CompressionMiddleware:
+    """크기가 정해진 JSON / RSS / JSON Feed 응답을 Accept-Encoding 에 맞춰 압축하는 ASGI 미들웨어."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope.get("method") == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding == "identity":
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        passthrough = False
+
+        async def _send(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                if self._compressible(Headers(raw=message["headers"])):
+                    start = message
+                else:
+                    passthrough = True
+                    await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            compressed = compress(body, encoding)
+            headers = MutableHeaders(scope=start)
+            if len(compressed) < len(body):
+                metrics.inc("http_compressed_responses_total", encoding=encoding)
+                metrics.inc("http_compression_saved_bytes_total", len(body) - len(compressed))
+                body = compressed
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                if "etag" in headers:
+                    headers["ETag"] = encoded_etag(headers["etag"], encoding)
+            _add_vary(headers)
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, _send)
+
+    def _compressible(self, headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return False
+        length = headers.get("content-length")
+        if length is None or int(length) < self.minimum_size:
+            return False
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return content_type in COMPRESSIBLE_TYPES
+
+
+def setup_compression(app: FastAPI):
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
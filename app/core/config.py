@@ -11,9 +11,80 @@ class Settings(BaseSettings):
     SERPAPI_API_KEY: str = ""
     OPENAI_API_KEY: str = ""   # ChatGPT 호출용 (필요 시 .env 에서 설정)
     OPENAI_MODEL: str = "gpt-5-mini"
+    OPENAI_BASE_URL: str = ""                 # 비우면 OpenAI 기본값 (로컬 OpenAI 호환 서버 테스트용)
+    OPENAI_REQUEST_TIMEOUT_SECONDS: float = 60.0     # 시도 1회 timeout
+    OPENAI_GENERATION_DEADLINE_SECONDS: float = 120.0  # 기사 생성 1건 (재시도 포함)
+    OPENAI_CATEGORY_DEADLINE_SECONDS: float = 60.0     # 제목 분류 배치 1건 (재시도 포함)
+    OPENAI_GENERATION_HEDGE_SECONDS: float = 0.0     # > 0 이면 이 시간 안에 응답이 없을 때 같은 요청을 한 번 더 (0: 끔)
+    OPENAI_HEDGE_WORKERS: int = 16            # hedged 요청 동시 실행 수 (빈 자리가 없으면 hedging 없이 호출)
+    OPENAI_MAX_RETRIES: int = 3               # 429/5xx/연결 오류 재시도 횟수
+    OPENAI_RETRY_BASE_SECONDS: float = 1.0    # 지수 백오프 기준 (지터 포함)
+    OPENAI_BREAKER_FAILURES: int = 5          # 연속 실패가 이만큼이면 서킷 오픈
+    OPENAI_BREAKER_RESET_SECONDS: float = 30.0  # 오픈 후 시험 호출까지 대기
+    OPENAI_PRICE_INPUT_PER_1M: float = 0.0    # 모델 단가(USD / 100만 토큰), 사용량 API 의 비용 추정용 (0 이면 0)
+    OPENAI_PRICE_OUTPUT_PER_1M: float = 0.0
+    LLM_CALLS_RETENTION_DAYS: int = 90        # llm_calls 기록 보존 일수
 
     # DB
     DATABASE_URL: str = ""
+    DB_POOL_MAX_SIZE: int = 4            # 동기 풀(수집/배치 경로)
+    DB_ASYNC_POOL_MIN_SIZE: int = 1      # 비동기 풀(async 라우트)
+    DB_ASYNC_POOL_MAX_SIZE: int = 10
+    DB_AUTO_MIGRATE: bool = True         # False 면 시작 시 스키마가 뒤처져 있을 때 에러 (배포 전 CLI 로 적용)
+
+    # 파티션/보존 기간 (collected_at 기준 일 단위 파티션)
+    PARTITION_PREMAKE_DAYS: int = 3      # 오늘 + N일치 파티션을 미리 생성
+    NEWS_RETENTION_DAYS: int = 3         # naver_ranking_news 보존 일수
+    KEYWORDS_RETENTION_DAYS: int = 30    # trending_keywords 보존 일수
+
+    # 인증 사용자 캐시 (get_current_user)
+    USER_CACHE_TTL_SECONDS: float = 30.0   # 비활성화/만료일 변경이 반영되기까지 최대 지연
+    USER_CACHE_MAX_SIZE: int = 1024
+    USER_CACHE_NOTIFY: bool = True         # Postgres LISTEN/NOTIFY 로 워커 간 즉시 무효화
+
+    # 비밀번호 해싱 (별도 프로세스 풀) / 로그인 시도 제한
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 16     # 실행 중 + 대기 작업 상한, 넘으면 429
+    LOGIN_RATE_LIMIT_PER_USER: int = 10     # username 당 LOGIN_RATE_WINDOW_SECONDS 동안 허용 횟수
+    LOGIN_RATE_LIMIT_PER_IP: int = 30       # IP 당 LOGIN_RATE_WINDOW_SECONDS 동안 허용 횟수
+    LOGIN_RATE_WINDOW_SECONDS: float = 60.0
+    TRUST_PROXY_HEADERS: bool = False       # 프록시(Render 등) 뒤일 때만 켠다. X-Forwarded-For 를 신뢰
+    TRUSTED_PROXY_HOPS: int = 1             # 앞단 신뢰 프록시 수. 오른쪽에서 이 번째 X-Forwarded-For 주소 사용
+
+    # 비동기 RSS 생성 작업 (/rss/jobs)
+    RSS_JOB_WORKERS: int = 2                 # 동시에 실행하는 생성 작업 수
+    RSS_JOB_STALE_SECONDS: int = 900         # 이 시간 동안 갱신 없는 running 작업은 재시작 시 다시 실행
+    RSS_JOB_MAX_ATTEMPTS: int = 3
+
+    # LLM 생성 결과 캐시 (같은 모델/프롬프트면 재생성하지 않음)
+    GENERATION_CACHE_TTL_SECONDS: int = 6 * 60 * 60
+    GENERATION_CACHE_MEMORY_SIZE: int = 256     # 프로세스 내 LRU 항목 수
+    GENERATION_CACHE_MAX_ROWS: int = 5000       # Postgres 보관 최대 행 수 (최근 사용 순으로 유지)
+    GENERATION_COALESCE_TIMEOUT_SECONDS: float = 130.0  # 같은 생성 요청이 진행 중일 때 기다리는 최대 시간 (생성 deadline 보다 약간 길게)
+
+    # 여러 페르소나 동시 생성 (/rss/generate/personas)
+    RSS_FANOUT_CONCURRENCY: int = 4             # 요청 하나에서 동시에 실행하는 생성 수
+
+    # 미리 생성한 기사 풀 (랭킹뉴스 수집 후 기본 페르소나로 생성, /rss/generate 에서 바로 응답)
+    RSS_POOL_ENABLED: bool = True
+    RSS_POOL_PER_CATEGORY: int = 3              # 카테고리별로 미리 생성할 상위 뉴스 수
+    RSS_POOL_TTL_SECONDS: int = 24 * 60 * 60    # 뉴스 수집 후 24시간(get_top_news 기간)을 넘지 않음
+    RSS_POOL_CONCURRENCY: int = 2               # 동시에 생성하는 기사 수
+
+    # 뉴스 제목 카테고리 분류 (categorize_news_titles_by_gpt)
+    NEWS_CATEGORY_CONCURRENCY: int = 4          # 동시에 보내는 배치 수
+    NEWS_CATEGORY_MIN_BATCH: int = 2            # 적응형 배치 크기 하한/상한 (제목 개수)
+    NEWS_CATEGORY_MAX_BATCH: int = 20
+    NEWS_CATEGORY_BATCH_CHARS: int = 1500       # 배치당 제목 글자 수 합계 상한
+    NEWS_CATEGORY_MEMO_RETENTION_DAYS: int = 30  # 다시 보이지 않은 제목 메모 보존 기간
+    NEWS_CLASSIFIER_ENABLED: bool = True         # 로컬 분류기 먼저 사용 (모델은 news_classifier train 으로 생성)
+    NEWS_CLASSIFIER_MIN_CONFIDENCE: float = 0.95 # 이 값 미만이면 LLM 으로 분류
+    NEWS_CLASSIFIER_RELOAD_SECONDS: float = 600.0
+
+    # 응답 압축 (gzip, brotli 패키지가 있으면 br 도)
+    COMPRESSION_MIN_SIZE: int = 1024            # 이보다 작은 응답은 압축하지 않음 (bytes)
+    FEED_RENDER_CACHE_SIZE: int = 64            # 렌더링+압축해 둔 피드 본문 수 (ETag 별)
+    FEED_RENDER_CACHE_TTL_SECONDS: float = 600.0
 
     # 내부 작업 토큰(있다면 충돌 방지용으로 선언)
     JOB_TOKEN: str = ""        # .env 에 존재해도 에러 안 나도록 추가
@@ -0,0 +1,89 @@
+# app/core/metrics.py
+"""
+프로세스 내 간단한 메트릭 레지스트리 (/metrics 에서 JSON 으로 노출).
+
+- counter: 누적 값 (inc)
+- gauge:   현재 값 (set_gauge)
+- timing:  지연 시간 샘플 (observe). 최근 TIMING_WINDOW 개 샘플로 p50/p95 를 계산하고
+           count/sum 은 전체 누적.
+라벨은 키워드 인자로 넘기며 (name, 정렬된 라벨) 조합마다 따로 집계된다.
+"""
+from __future__ import annotations
+
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Tuple
+import threading
+
+TIMING_WINDOW = 1024
+
+_Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _key(name: str, labels: Dict[str, Any]) -> _Key:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+class _Timing:
+    __slots__ = ("count", "total", "samples")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.samples: Deque[float] = deque(maxlen=TIMING_WINDOW)
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[_Key, float] = defaultdict(float)
+        self._gauges: Dict[_Key, float] = {}
+        self._timings: Dict[_Key, _Timing] = defaultdict(_Timing)
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        with self._lock:
+            self._counters[_key(name, labels)] += value
+
+    def set_gauge(self, name: str, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._gauges[_key(name, labels)] = value
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        with self._lock:
+            t = self._timings[_key(name, labels)]
+            t.count += 1
+            t.total += seconds
+            t.samples.append(seconds)
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        with self._lock:
+            counters = [
+                {"name": n, "labels": dict(l), "value": v}
+                for (n, l), v in self._counters.items()
+            ]
+            gauges = [
+                {"name": n, "labels": dict(l), "value": v}
+                for (n, l), v in self._gauges.items()
+            ]
+            timings = []
+            for (n, l), t in self._timings.items():
+                values = sorted(t.samples)
+                timings.append({
+                    "name": n,
+                    "labels": dict(l),
+                    "count": t.count,
+                    "sum": t.total,
+                    "p50": _percentile(values, 0.50),
+                    "p95": _percentile(values, 0.95),
+                    "max": values[-1] if values else 0.0,
+                })
+        return {"counters": counters, "gauges": gauges, "timings": timings}
+
+
+metrics = Metrics()
@@ -0,0 +1,51 @@
+# app/core/rate_limit.py
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Dict, Hashable
+import threading
+import time
+
+
+class SlidingWindowLimiter:
+    """
+    키(username, IP 등)별로 최근 window 초 동안 limit 회까지만 허용하는 프로세스 내 제한기.
+    키가 max_keys 를 넘으면 창 밖으로 밀려난 키부터 정리해서 메모리를 제한한다.
+    """
+
+    def __init__(self, limit: int, window: float, max_keys: int = 10_000):
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self._hits: Dict[Hashable, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key: Hashable) -> bool:
+        """허용되면 기록 후 True, 한도를 넘었으면 기록 없이 False."""
+        now = time.monotonic()
+        cutoff = now - self.window
+        with self._lock:
+            q = self._hits.get(key)
+            if q is None:
+                if len(self._hits) >= self.max_keys:
+                    self._prune(cutoff)
+                q = self._hits[key] = deque()
+            while q and q[0] <= cutoff:
+                q.popleft()
+            if len(q) >= self.limit:
+                return False
+            q.append(now)
+            return True
+
+    def retry_after(self, key: Hashable) -> int:
+        """다음 시도가 허용되기까지 남은 초 (Retry-After 헤더용)."""
+        with self._lock:
+            q = self._hits.get(key)
+            if not q:
+                return 0
+            return max(1, int(q[0] + self.window - time.monotonic()) + 1)
+
+    def _prune(self, cutoff: float) -> None:
+        stale = [k for k, q in self._hits.items() if not q or q[-1] <= cutoff]
+        for k in stale:
+            del self._hits[k]
@@ -1,9 +1,15 @@
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Callable, Optional
+import asyncio
+import multiprocessing
+import time
 
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 
+from app.core.config import settings
+from app.core.metrics import metrics
 from app.schemas.user_schema import TokenData
 
 
@@ -23,6 +29,65 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# ---------------------------
+# 해싱 전용 프로세스 풀 + 대기열 제한
+# ---------------------------
+# pbkdf2 는 CPU 를 오래 쓰므로 요청 스레드/GIL 을 막지 않도록 별도 프로세스에서 실행한다.
+# 대기(실행 중 포함) 작업이 PASSWORD_HASH_MAX_PENDING 을 넘으면 큐에 쌓지 않고 바로 거절한다.
+
+class PasswordHashBusy(Exception):
+    """해싱 대기열이 가득 참 (라우터에서 429 로 변환)."""
+
+
+_hash_executor: ProcessPoolExecutor | None = None
+_hash_pending = 0
+
+
+def _get_hash_executor() -> ProcessPoolExecutor:
+    global _hash_executor
+    if _hash_executor is None:
+        # fork 는 스레드(리스너, 풀, 실행기)가 잡고 있던 락까지 복제해서 자식이 멈출 수 있으므로 spawn
+        _hash_executor = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _hash_executor
+
+
+async def _run_hash_job(op: str, fn: Callable[..., Any], *args: Any) -> Any:
+    global _hash_pending
+    if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        metrics.inc("password_hash_rejected_total", op=op)
+        raise PasswordHashBusy()
+
+    _hash_pending += 1
+    metrics.set_gauge("password_hash_queue_depth", _hash_pending)
+    start = time.perf_counter()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_hash_executor(), fn, *args)
+    finally:
+        _hash_pending -= 1
+        metrics.set_gauge("password_hash_queue_depth", _hash_pending)
+        # 대기 시간 포함 (사용자가 체감하는 지연)
+        metrics.observe("password_hash_seconds", time.perf_counter() - start, op=op)
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_hash_job("hash", hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_hash_job("verify", verify_password, plain_password, hashed_password)
+
+
+def shutdown_hash_pool() -> None:
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     now = datetime.now(timezone.utc)
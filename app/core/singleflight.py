@@ -0,0 +1,66 @@
+# app/core/singleflight.py
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import threading
+
+
+class SingleFlightTimeout(TimeoutError):
+    """진행 중인 호출을 기다리다 timeout 이 지난 경우."""
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 호출을 하나로 합치는 스레드용 single-flight.
+    - 처음 들어온 호출(leader)만 fn 을 실행하고, 나머지는 그 결과/예외를 그대로 공유한다.
+    - 기다리는 쪽만 timeout 을 가지며, timeout 이 지나도 leader 의 실행은 계속된다.
+    - 호출이 끝나면 키를 지우므로 결과를 보관하지 않는다. (보관은 캐시의 몫)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        timeout: Optional[float] = None,
+    ) -> Tuple[Any, bool]:
+        """(결과, 다른 호출의 결과를 공유했는지) 반환."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise SingleFlightTimeout(f"in-flight call did not finish within {timeout}s")
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,476 @@
+# app\db\migrations.py
+"""
+버전 관리되는 스키마 마이그레이션.
+
+- schema_version 테이블에 적용된 버전을 기록하고, MIGRATIONS 를 순서대로 한 번씩만 적용한다.
+- 앱 시작 시에는 current_version() 조회 한 번으로 최신 여부만 확인하고(fast path) DDL 은 건너뛴다.
+- 배포 전에 별도로 적용하려면:
+      python -m app.db.migrations upgrade   # 미적용 마이그레이션 적용 + 파티션 유지보수
+      python -m app.db.migrations status    # 현재/최신 버전, 미적용 목록
+"""
+from __future__ import annotations
+from typing import Callable, List, Tuple, Union
+from datetime import datetime, timezone, timedelta
+import argparse
+
+import psycopg
+from psycopg.sql import SQL, Identifier
+
+from app.core.config import settings
+from app.db import partitions
+
+
+# collected_at 기준 일(UTC) 단위 RANGE 파티션 테이블 → 보존 기간 지난 파티션은 통째로 DETACH/DROP
+# (파티션 테이블의 PK/UNIQUE 는 파티션 키를 포함해야 하므로 PK = (id, collected_at))
+DDL_CREATE = """
+CREATE TABLE IF NOT EXISTS trending_keywords (
+  id                  BIGSERIAL,
+  collected_at        TIMESTAMPTZ NOT NULL,
+  geo                 TEXT,
+  hl                  TEXT,
+  hours               INT,
+  title               TEXT NOT NULL,        -- = query(호환성을 위해 title 컬럼 유지)
+  link                TEXT,                 -- 기존 호환용 (없으면 NULL)
+  categories          TEXT,                 -- 카테고리 name들을 '|'로 합친 문자열
+  category_tags       TEXT[],               -- 카테고리 멤버십(소문자 정규화 배열, GIN 인덱스)
+  search_volume       INT,
+  increase_percentage INT,
+  active              BOOLEAN,
+  start_time          TIMESTAMPTZ,          -- start_timestamp(초) -> UTC 변환
+  trends_link         TEXT,                 -- serpapi_google_trends_link
+  news_page_token     TEXT,                 -- news_page_token
+  news_link           TEXT,                 -- serpapi_news_link
+  raw_json            JSONB,
+  PRIMARY KEY (id, collected_at)
+) PARTITION BY RANGE (collected_at);
+
+-- 미리 만들어 둔 파티션 범위를 벗어난 행을 받아주는 안전망
+CREATE TABLE IF NOT EXISTS trending_keywords_default PARTITION OF trending_keywords DEFAULT;
+
+-- 인덱스 (부모에 만들면 모든 파티션에 전파)
+CREATE INDEX IF NOT EXISTS idx_trending_keywords_collected_at ON trending_keywords (collected_at DESC);
+CREATE INDEX IF NOT EXISTS idx_trending_keywords_title        ON trending_keywords (title);
+CREATE INDEX IF NOT EXISTS idx_trending_keywords_category_tags ON trending_keywords USING GIN (category_tags);
+
+-- 네이버 랭킹뉴스 테이블
+-- 제목 UNIQUE 는 파티션 테이블에 걸 수 없으므로, 저장 시 advisory lock + NOT EXISTS 로 중복 제거
+CREATE TABLE IF NOT EXISTS naver_ranking_news (
+  id           BIGSERIAL,
+  collected_at TIMESTAMPTZ NOT NULL,
+  press        TEXT        NOT NULL,   -- 언론사 이름
+  category     TEXT,                   -- 섹션(정치/경제/사회 등), 없으면 NULL
+  rank         INT         NOT NULL,   -- 언론사별 랭킹 순위
+  title        TEXT        NOT NULL,   -- 기사 제목
+  link         TEXT        NOT NULL,   -- 기사 링크
+  raw_json     JSONB,                  -- 원본 전체 JSON
+  PRIMARY KEY (id, collected_at)
+) PARTITION BY RANGE (collected_at);
+
+CREATE TABLE IF NOT EXISTS naver_ranking_news_default PARTITION OF naver_ranking_news DEFAULT;
+
+CREATE INDEX IF NOT EXISTS idx_naver_ranking_collected_at ON naver_ranking_news (collected_at DESC);
+CREATE INDEX IF NOT EXISTS idx_naver_ranking_press        ON naver_ranking_news (press);
+CREATE INDEX IF NOT EXISTS idx_naver_ranking_title        ON naver_ranking_news (title);
+-- get_top_news 랜덤 샘플링(카테고리 + 24시간 범위, id 까지 인덱스 전용 스캔)
+CREATE INDEX IF NOT EXISTS idx_naver_ranking_category_collected_at
+  ON naver_ranking_news (category, collected_at) INCLUDE (id);
+
+-- 사용자 테이블
+CREATE TABLE IF NOT EXISTS users (
+  username      TEXT PRIMARY KEY,
+  password_hash TEXT        NOT NULL,
+  expires_at    TIMESTAMPTZ NOT NULL,
+  is_active     BOOLEAN     NOT NULL DEFAULT TRUE,
+  created_at    TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_users_expires_at ON users (expires_at);
+"""
+
+# category_tags 이전에 저장된 행 백필: 'A|B|C' → {a,b,c}
+SQL_BACKFILL_CATEGORY_TAGS = """
+UPDATE trending_keywords
+   SET category_tags = (
+         SELECT array_agg(DISTINCT lower(btrim(t)))
+           FROM unnest(string_to_array(categories, '|')) AS t
+          WHERE btrim(t) <> ''
+       )
+ WHERE category_tags IS NULL
+   AND categories IS NOT NULL;
+"""
+
+
+# ---------------------------
+# 파티션 도입 이전 테이블 이관
+# ---------------------------
+
+def _rename_legacy_table(cur: psycopg.Cursor, table: str) -> bool:
+    """
+    table 이 파티션 도입 이전의 일반 테이블이면 {table}_legacy 로 이름을 바꾼다.
+    인덱스/제약/시퀀스 이름은 스키마 전역이므로 새 테이블과 겹치지 않게 함께 바꾼다.
+    """
+    cur.execute(
+        "SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)",
+        (table,),
+    )
+    row = cur.fetchone()
+    if not row or row[0] != "r":
+        return False
+
+    legacy = f"{table}_legacy"
+    cur.execute(SQL("ALTER TABLE {} RENAME TO {}").format(
+        Identifier(table), Identifier(legacy)
+    ))
+
+    cur.execute(
+        """
+        SELECT ic.relname
+          FROM pg_index i
+          JOIN pg_class ic ON ic.oid = i.indexrelid
+         WHERE i.indrelid = %s::regclass
+        """,
+        (legacy,),
+    )
+    for (index_name,) in cur.fetchall():
+        # PK/UNIQUE 인덱스는 이름을 바꾸면 제약 이름도 같이 바뀐다
+        cur.execute(SQL("ALTER INDEX {} RENAME TO {}").format(
+            Identifier(index_name), Identifier(f"{index_name}_legacy")
+        ))
+
+    cur.execute("SELECT pg_get_serial_sequence(%s, 'id')", (legacy,))
+    seq = cur.fetchone()[0]
+    if seq:
+        cur.execute(SQL("ALTER SEQUENCE {} RENAME TO {}").format(
+            SQL(seq), Identifier(f"{legacy}_id_seq")
+        ))
+    return True
+
+
+
+def _migrate_legacy_rows(cur: psycopg.Cursor, table: str) -> None:
+    """{table}_legacy 의 보존 기간 내 행을 새 파티션 테이블로 옮기고 legacy 테이블을 지운다."""
+    legacy = f"{table}_legacy"
+    keep_from = datetime.now(timezone.utc).date() - timedelta(days=partitions.retention_days(table))
+    cutoff = partitions.day_bounds(keep_from)[0]
+
+    cur.execute(
+        f"SELECT min(collected_at), max(collected_at) FROM {legacy} WHERE collected_at >= %s",
+        (cutoff,),
+    )
+    lo, hi = cur.fetchone()
+    if lo is not None:
+        day = lo.astimezone(timezone.utc).date()
+        last = hi.astimezone(timezone.utc).date()
+        while day <= last:
+            partitions.create_partition(cur, table, day)
+            day += timedelta(days=1)
+
+        # legacy 에 없는 컬럼(예: category_tags)은 빼고 공통 컬럼만 복사
+        cur.execute(
+            """
+            SELECT column_name
+              FROM information_schema.columns
+             WHERE table_schema = current_schema() AND table_name = %s
+               AND column_name IN (
+                   SELECT column_name
+                     FROM information_schema.columns
+                    WHERE table_schema = current_schema() AND table_name = %s
+               )
+             ORDER BY ordinal_position
+            """,
+            (table, legacy),
+        )
+        cols = SQL(", ").join(Identifier(r[0]) for r in cur.fetchall())
+        cur.execute(
+            SQL("INSERT INTO {} ({}) SELECT {} FROM {} WHERE collected_at >= %s").format(
+                Identifier(table), cols, cols, Identifier(legacy)
+            ),
+            (cutoff,),
+        )
+        cur.execute(
+            SQL("SELECT setval(pg_get_serial_sequence(%s, 'id'), (SELECT max(id) FROM {}))").format(
+                Identifier(table)
+            ),
+            (table,),
+        )
+
+    cur.execute(SQL("DROP TABLE {}").format(Identifier(legacy)))
+
+# ---------------------------
+# 마이그레이션 레지스트리
+# ---------------------------
+
+def _initial_schema(cur: psycopg.Cursor) -> None:
+    """
+    v1: 파티션 스키마 + category_tags.
+    마이그레이션 도입 이전의 어떤 DB 상태(빈 DB / 일반 테이블 / 이미 파티션)에서도 동작하도록 멱등하게 작성.
+    """
+    # 파티션 도입 이전의 일반 테이블이면 *_legacy 로 옮겨 두고 새로 만든 뒤 이관
+    legacy = [t for t in partitions.PARTITIONED_TABLES if _rename_legacy_table(cur, t)]
+    cur.execute(DDL_CREATE)
+    for table in legacy:
+        _migrate_legacy_rows(cur, table)
+    cur.execute(SQL_BACKFILL_CATEGORY_TAGS)
+
+
+# v2: 비동기 RSS 생성 작업
+DDL_RSS_JOBS = """
+CREATE TABLE IF NOT EXISTS rss_jobs (
+  id          UUID        PRIMARY KEY,
+  status      TEXT        NOT NULL,             -- queued | running | done | failed
+  params      JSONB       NOT NULL,             -- keyword/category/ages/sex/type
+  result_xml  TEXT,                             -- 완료 시 build_rss_xml 결과
+  error       TEXT,
+  attempts    INT         NOT NULL DEFAULT 0,
+  created_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  updated_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  finished_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_rss_jobs_status_created_at ON rss_jobs (status, created_at);
+"""
+
+# v3: LLM 생성 결과 캐시 (모델 + 시스템 프롬프트 + 사용자 프롬프트 해시 → 생성된 글)
+DDL_LLM_GENERATION_CACHE = """
+CREATE TABLE IF NOT EXISTS llm_generation_cache (
+  cache_key   TEXT        PRIMARY KEY,          -- sha256(model, system prompt, user prompt)
+  model       TEXT        NOT NULL,
+  article     JSONB       NOT NULL,             -- {"title", "summary", "content", "tags"}
+  created_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  expires_at  TIMESTAMPTZ NOT NULL,
+  last_hit_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  hits        INT         NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_generation_cache_expires_at  ON llm_generation_cache (expires_at);
+CREATE INDEX IF NOT EXISTS idx_llm_generation_cache_last_hit_at ON llm_generation_cache (last_hit_at DESC);
+"""
+
+# v4: 뉴스 제목 → 카테고리 메모 (정규화한 제목의 해시 기준, LLM 재분류 방지)
+DDL_NEWS_CATEGORY_MEMO = """
+CREATE TABLE IF NOT EXISTS news_category_memo (
+  title_hash   TEXT        PRIMARY KEY,         -- sha256(정규화한 제목)
+  title        TEXT        NOT NULL,
+  category     TEXT        NOT NULL,
+  created_at   TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  last_seen_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_news_category_memo_last_seen_at ON news_category_memo (last_seen_at);
+"""
+
+# v5: 로컬 제목 분류기 모델 + 메모 항목의 출처(llm / local) 구분
+#     (분류기 학습에는 LLM 이 붙인 라벨만 쓰기 위함)
+DDL_NEWS_CATEGORY_MODELS = """
+ALTER TABLE news_category_memo ADD COLUMN IF NOT EXISTS source TEXT NOT NULL DEFAULT 'llm';
+
+CREATE TABLE IF NOT EXISTS news_category_models (
+  id          BIGSERIAL   PRIMARY KEY,
+  created_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  model       JSONB       NOT NULL,             -- NaiveBayesClassifier.to_dict()
+  evaluation  JSONB       NOT NULL              -- 학습 시 held-out 평가 결과
+);
+"""
+
+# v6: 미리 생성해 둔 기사 풀 (랭킹뉴스 수집 후 카테고리별 상위 뉴스 × 기본 페르소나)
+DDL_RSS_ARTICLE_POOL = """
+CREATE TABLE IF NOT EXISTS rss_article_pool (
+  id          BIGSERIAL   PRIMARY KEY,
+  category    TEXT        NOT NULL,
+  news_title  TEXT        NOT NULL,
+  persona     TEXT        NOT NULL,             -- "연령|성별|말투" (예: "30|남성|유쾌한")
+  article     JSONB       NOT NULL,             -- {"title", "summary", "content", "tags"}
+  created_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  expires_at  TIMESTAMPTZ NOT NULL,
+  UNIQUE (news_title, persona)
+);
+
+CREATE INDEX IF NOT EXISTS idx_rss_article_pool_persona_category_expires
+  ON rss_article_pool (persona, category, expires_at);
+"""
+
+# v7: LLM 호출 기록 (기능별 지연/토큰 사용량/결과)
+DDL_LLM_CALLS = """
+CREATE TABLE IF NOT EXISTS llm_calls (
+  id                BIGSERIAL   PRIMARY KEY,
+  created_at        TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  feature           TEXT        NOT NULL,       -- generation / generation_stream / categorization
+  model             TEXT        NOT NULL,
+  outcome           TEXT        NOT NULL,       -- ok 또는 예외 클래스 이름
+  latency_ms        INT         NOT NULL,
+  prompt_tokens     INT         NOT NULL DEFAULT 0,
+  completion_tokens INT         NOT NULL DEFAULT 0,
+  retries           INT         NOT NULL DEFAULT 0,   -- 이 시도의 재시도 순번 (0 = 첫 시도). 행 하나 = 시도 하나
+  error             TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_calls_created_at ON llm_calls (created_at);
+"""
+
+# v8: 게시된 글 저장소 (내용 기반 guid, 실제 게시 시각) → GET /api/v1/feed
+DDL_FEED_ARTICLES = """
+CREATE TABLE IF NOT EXISTS feed_articles (
+  id           BIGSERIAL   PRIMARY KEY,
+  guid         TEXT        NOT NULL UNIQUE,     -- feed_service.article_guid (같은 내용이면 같은 guid)
+  news_title   TEXT        NOT NULL,            -- 생성에 쓴 뉴스 제목/키워드
+  category     TEXT,
+  persona      TEXT        NOT NULL,            -- "연령|성별|말투"
+  article      JSONB       NOT NULL,            -- {"title", "summary", "content", "tags"}
+  published_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_feed_articles_category_published_at
+  ON feed_articles (category, published_at DESC);
+CREATE INDEX IF NOT EXISTS idx_feed_articles_published_at
+  ON feed_articles (published_at DESC);
+"""
+
+# v9: GET /feed 키셋 페이지네이션 ((published_at, id) 커서) 용 인덱스. v8 의 published_at 단독 인덱스를 대체.
+DDL_FEED_ARTICLES_KEYSET = """
+CREATE INDEX IF NOT EXISTS idx_feed_articles_published_id
+  ON feed_articles (published_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_feed_articles_category_published_id
+  ON feed_articles (category, published_at DESC, id DESC);
+
+DROP INDEX IF EXISTS idx_feed_articles_published_at;
+DROP INDEX IF EXISTS idx_feed_articles_category_published_at;
+"""
+
+# v10: hedged 요청(같은 시도의 두 번째 요청) 표시. 사용량 집계에서 논리 호출 수를 셀 때 제외한다.
+DDL_LLM_CALLS_HEDGE = """
+ALTER TABLE llm_calls ADD COLUMN IF NOT EXISTS hedge BOOLEAN NOT NULL DEFAULT FALSE;
+"""
+
+
+# (버전, 이름, SQL 문자열 또는 cursor 를 받는 함수). 버전은 1부터 빈틈없이 증가해야 한다.
+Migration = Tuple[int, str, Union[str, Callable[[psycopg.Cursor], None]]]
+
+MIGRATIONS: List[Migration] = [
+    (1, "initial_schema", _initial_schema),
+    (2, "rss_jobs", DDL_RSS_JOBS),
+    (3, "llm_generation_cache", DDL_LLM_GENERATION_CACHE),
+    (4, "news_category_memo", DDL_NEWS_CATEGORY_MEMO),
+    (5, "news_category_models", DDL_NEWS_CATEGORY_MODELS),
+    (6, "rss_article_pool", DDL_RSS_ARTICLE_POOL),
+    (7, "llm_calls", DDL_LLM_CALLS),
+    (8, "feed_articles", DDL_FEED_ARTICLES),
+    (9, "feed_articles_keyset", DDL_FEED_ARTICLES_KEYSET),
+    (10, "llm_calls_hedge", DDL_LLM_CALLS_HEDGE),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+DDL_SCHEMA_VERSION = """
+CREATE TABLE IF NOT EXISTS schema_version (
+  version    INT PRIMARY KEY,
+  name       TEXT        NOT NULL,
+  applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+"""
+
+# 여러 워커/CLI 가 동시에 마이그레이션하지 않도록 세션 단위 advisory lock
+SQL_LOCK_MIGRATIONS = "SELECT pg_advisory_lock(hashtext('postflow:migrations'))"
+SQL_UNLOCK_MIGRATIONS = "SELECT pg_advisory_unlock(hashtext('postflow:migrations'))"
+
+
+def current_version(conn: psycopg.Connection) -> int:
+    """적용된 최신 버전. schema_version 테이블이 없으면 0."""
+    row = conn.execute("SELECT to_regclass('schema_version')").fetchone()
+    if row[0] is None:
+        return 0
+    row = conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version").fetchone()
+    return row[0]
+
+
+def upgrade(conn: psycopg.Connection) -> List[int]:
+    """
+    미적용 마이그레이션을 버전 순서대로 적용한다. 각 버전은 자신의 트랜잭션에서
+    schema_version 기록과 함께 커밋된다. 반환값: 이번에 적용한 버전 목록
+    """
+    version = current_version(conn)
+    conn.commit()
+    if version >= LATEST_VERSION:
+        return []  # fast path: DDL/카탈로그 락 없음
+
+    applied: List[int] = []
+    conn.execute(SQL_LOCK_MIGRATIONS)
+    try:
+        conn.execute(DDL_SCHEMA_VERSION)
+        # 락을 기다리는 동안 다른 워커가 먼저 올렸을 수 있으므로 다시 확인
+        version = current_version(conn)
+        conn.commit()
+
+        for ver, name, step in MIGRATIONS:
+            if ver <= version:
+                continue
+            with conn.cursor() as cur:
+                if isinstance(step, str):
+                    cur.execute(step)
+                else:
+                    step(cur)
+                cur.execute(
+                    "INSERT INTO schema_version (version, name) VALUES (%s, %s)",
+                    (ver, name),
+                )
+            conn.commit()
+            applied.append(ver)
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.execute(SQL_UNLOCK_MIGRATIONS)
+        conn.commit()
+
+    return applied
+
+
+def ensure_schema(conn: psycopg.Connection) -> None:
+    """
+    앱 시작용. 최신이면 아무것도 하지 않고,
+    뒤처져 있으면 DB_AUTO_MIGRATE 설정에 따라 적용하거나 에러를 낸다.
+    """
+    if settings.DB_AUTO_MIGRATE:
+        upgrade(conn)
+        return
+
+    version = current_version(conn)
+    conn.commit()
+    if version < LATEST_VERSION:
+        raise RuntimeError(
+            f"DB schema is at version {version}, expected {LATEST_VERSION}. "
+            "Run: python -m app.db.migrations upgrade"
+        )
+
+
+# ---------------------------
+# CLI
+# ---------------------------
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PostFlow DB 스키마 마이그레이션")
+    parser.add_argument("command", choices=["upgrade", "status"], nargs="?", default="upgrade")
+    args = parser.parse_args()
+
+    if not settings.DATABASE_URL:
+        raise SystemExit("DATABASE_URL is empty")
+
+    with psycopg.connect(settings.DATABASE_URL) as conn:
+        if args.command == "status":
+            version = current_version(conn)
+            print(f"current: {version}, latest: {LATEST_VERSION}")
+            for ver, name, _ in MIGRATIONS:
+                if ver > version:
+                    print(f"  pending: {ver} {name}")
+            return
+
+        applied = upgrade(conn)
+        print(f"applied: {applied or 'none'} (now at {LATEST_VERSION})")
+
+        with conn.cursor() as cur:
+            result = partitions.maintain(cur)
+        conn.commit()
+        print(f"partitions: {result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# app\db\partitions.py
+"""
+collected_at 기준 일(UTC) 단위 RANGE 파티션 관리.
+
+- trending_keywords / naver_ranking_news 의 파티션을 미리 만들고,
+  보존 기간이 지난 파티션은 행 단위 DELETE 대신 통째로 DETACH/DROP 한다.
+- 커서 단위 헬퍼만 두고 연결/트랜잭션은 호출하는 쪽(postgres.py, migrations.py)이 관리한다.
+"""
+from __future__ import annotations
+from typing import Dict, Tuple
+from datetime import date, datetime, timezone, timedelta
+
+import psycopg
+from psycopg.sql import SQL, Identifier, Literal
+
+from app.core.config import settings
+
+# 파티션 테이블 → 보존 기간(일) 설정 이름
+PARTITIONED_TABLES = {
+    "trending_keywords": "KEYWORDS_RETENTION_DAYS",
+    "naver_ranking_news": "NEWS_RETENTION_DAYS",
+}
+
+# 파티션 DDL 은 여러 워커가 동시에 실행하지 않도록 직렬화
+SQL_LOCK_PARTITIONS = "SELECT pg_advisory_xact_lock(hashtext('postflow:partitions'))"
+
+
+def retention_days(table: str) -> int:
+    return getattr(settings, PARTITIONED_TABLES[table])
+
+
+def _partition_name(table: str, day: date) -> str:
+    return f"{table}_p{day:%Y%m%d}"
+
+
+def day_bounds(day: date) -> Tuple[datetime, datetime]:
+    lo = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    return lo, lo + timedelta(days=1)
+
+
+def create_partition(cur: psycopg.Cursor, table: str, day: date) -> bool:
+    """
+    table 의 day 파티션을 만든다. 이미 있으면 False.
+    DEFAULT 파티션에 해당 범위 행이 있으면 (파티션이 없던 동안 들어온 행)
+    먼저 빼 두었다가 새 파티션으로 다시 넣는다. (그대로 두면 CREATE 가 실패)
+    """
+    name = _partition_name(table, day)
+    cur.execute("SELECT to_regclass(%s)", (name,))
+    if cur.fetchone()[0] is not None:
+        return False
+
+    lo, hi = day_bounds(day)
+    default = f"{table}_default"
+    cur.execute(
+        f"SELECT EXISTS (SELECT 1 FROM {default} WHERE collected_at >= %s AND collected_at < %s)",
+        (lo, hi),
+    )
+    has_default_rows = cur.fetchone()[0]
+
+    if has_default_rows:
+        cur.execute(f"CREATE TEMP TABLE _moving_{table} (LIKE {table})")
+        cur.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM {default}
+                 WHERE collected_at >= %s AND collected_at < %s
+             RETURNING *
+            )
+            INSERT INTO _moving_{table} SELECT * FROM moved
+            """,
+            (lo, hi),
+        )
+
+    cur.execute(
+        SQL("CREATE TABLE {} PARTITION OF {} FOR VALUES FROM ({}) TO ({})").format(
+            Identifier(name), Identifier(table), Literal(lo), Literal(hi)
+        )
+    )
+
+    if has_default_rows:
+        cur.execute(f"INSERT INTO {table} SELECT * FROM _moving_{table}")
+        cur.execute(f"DROP TABLE _moving_{table}")
+    return True
+
+
+def drop_expired_partitions(cur: psycopg.Cursor, table: str, keep_from: date) -> int:
+    """keep_from 이전에 끝나는 일 파티션을 DETACH 후 DROP. 반환값: 삭제한 파티션 수"""
+    cur.execute(
+        """
+        SELECT c.relname
+          FROM pg_inherits i
+          JOIN pg_class c ON c.oid = i.inhrelid
+         WHERE i.inhparent = %s::regclass
+        """,
+        (table,),
+    )
+    prefix = f"{table}_p"
+    dropped = 0
+    for (name,) in cur.fetchall():
+        if not name.startswith(prefix):
+            continue  # DEFAULT 파티션 등
+        try:
+            day = datetime.strptime(name[len(prefix):], "%Y%m%d").date()
+        except ValueError:
+            continue
+        if day + timedelta(days=1) <= keep_from:
+            cur.execute(SQL("ALTER TABLE {} DETACH PARTITION {}").format(
+                Identifier(table), Identifier(name)
+            ))
+            cur.execute(SQL("DROP TABLE {}").format(Identifier(name)))
+            dropped += 1
+
+    # DEFAULT 파티션에 남은 오래된 행 (보통 비어 있음)
+    cur.execute(
+        f"DELETE FROM {table}_default WHERE collected_at < %s",
+        (day_bounds(keep_from)[0],),
+    )
+    return dropped
+
+
+def maintain(cur: psycopg.Cursor) -> Dict[str, Dict[str, int]]:
+    """
+    오늘 ~ PARTITION_PREMAKE_DAYS 일 뒤까지 파티션을 미리 만들고,
+    보존 기간(NEWS_RETENTION_DAYS / KEYWORDS_RETENTION_DAYS)이 지난 파티션을 제거한다.
+    반환값: {테이블: {"created": n, "dropped": m}}
+    """
+    today = datetime.now(timezone.utc).date()
+    result: Dict[str, Dict[str, int]] = {}
+
+    cur.execute(SQL_LOCK_PARTITIONS)
+    for table in PARTITIONED_TABLES:
+        created = 0
+        for offset in range(settings.PARTITION_PREMAKE_DAYS + 1):
+            created += create_partition(cur, table, today + timedelta(days=offset))
+        keep_from = today - timedelta(days=retention_days(table))
+        dropped = drop_expired_partitions(cur, table, keep_from)
+        result[table] = {"created": created, "dropped": dropped}
+
+    return result
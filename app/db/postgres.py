@@ -1,79 +1,29 @@
 # app\db\postgres.py
 from __future__ import annotations
-from typing import Iterable, Dict, Any, Optional
+from typing import Iterable, Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone, timedelta
-import re
-
 import psycopg
 from psycopg_pool import ConnectionPool
 from psycopg.types.json import Json
 from psycopg.rows import dict_row
 
 from app.core.config import settings
+from app.db import migrations, partitions
 
 pool: ConnectionPool | None = None
 
-DDL_CREATE = """
-CREATE TABLE IF NOT EXISTS trending_keywords (
-  id                  BIGSERIAL PRIMARY KEY,
-  collected_at        TIMESTAMPTZ NOT NULL,
-  geo                 TEXT,
-  hl                  TEXT,
-  hours               INT,
-  title               TEXT NOT NULL,        -- = query(호환성을 위해 title 컬럼 유지)
-  link                TEXT,                 -- 기존 호환용 (없으면 NULL)
-  categories          TEXT,                 -- 카테고리 name들을 '|'로 합친 문자열
-  search_volume       INT,
-  increase_percentage INT,
-  active              BOOLEAN,
-  start_time          TIMESTAMPTZ,          -- start_timestamp(초) -> UTC 변환
-  trends_link         TEXT,                 -- serpapi_google_trends_link
-  news_page_token     TEXT,                 -- news_page_token
-  news_link           TEXT,                 -- serpapi_news_link
-  raw_json            JSONB
-);
-
--- 인덱스
-CREATE INDEX IF NOT EXISTS idx_trending_keywords_collected_at ON trending_keywords (collected_at DESC);
-CREATE INDEX IF NOT EXISTS idx_trending_keywords_title        ON trending_keywords (title);
-
--- 네이버 랭킹뉴스 테이블
-CREATE TABLE IF NOT EXISTS naver_ranking_news (
-  id           BIGSERIAL PRIMARY KEY,
-  collected_at TIMESTAMPTZ NOT NULL,
-  press        TEXT        NOT NULL,   -- 언론사 이름
-  category     TEXT,                   -- 섹션(정치/경제/사회 등), 없으면 NULL
-  rank         INT         NOT NULL,   -- 언론사별 랭킹 순위
-  title        TEXT        NOT NULL,   -- 기사 제목
-  link         TEXT        NOT NULL,   -- 기사 링크
-  raw_json     JSONB                   -- 원본 전체 JSON
-);
-
-CREATE INDEX IF NOT EXISTS idx_naver_ranking_collected_at ON naver_ranking_news (collected_at DESC);
-CREATE INDEX IF NOT EXISTS idx_naver_ranking_press        ON naver_ranking_news (press);
-CREATE INDEX IF NOT EXISTS idx_naver_ranking_title        ON naver_ranking_news (title);
-
--- 사용자 테이블
-CREATE TABLE IF NOT EXISTS users (
-  username      TEXT PRIMARY KEY,
-  password_hash TEXT        NOT NULL,
-  expires_at    TIMESTAMPTZ NOT NULL,
-  is_active     BOOLEAN     NOT NULL DEFAULT TRUE,
-  created_at    TIMESTAMPTZ NOT NULL DEFAULT NOW()
-);
-
-CREATE INDEX IF NOT EXISTS idx_users_expires_at ON users (expires_at);
-"""
-
 def init_pool():
-    """Initialize the global connection pool and ensure DDL exists."""
+    """Initialize the global connection pool and make sure the schema is current."""
     global pool
     if pool is None:
         if not settings.DATABASE_URL:
             raise RuntimeError("DATABASE_URL is empty")
-        pool = ConnectionPool(settings.DATABASE_URL, min_size=1, max_size=4, open=True)
+        pool = ConnectionPool(
+            settings.DATABASE_URL, min_size=1, max_size=settings.DB_POOL_MAX_SIZE, open=True
+        )
+        # 최신 스키마면 버전 조회 한 번으로 끝 (DDL 실행 없음)
         with pool.connection() as conn:
-            conn.execute(DDL_CREATE)
+            migrations.ensure_schema(conn)
 
 def close_pool():
     global pool
@@ -81,6 +31,20 @@ def close_pool():
         pool.close()
         pool = None
 
+def maintain_partitions() -> Dict[str, Dict[str, int]]:
+    """
+    파티션 미리 생성 + 보존 기간 지난 파티션 제거 (app/db/partitions.py 참고).
+    저장 트랜잭션과 분리해서 수집 직후 백그라운드로 호출한다.
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            result = partitions.maintain(cur)
+        conn.commit()
+    return result
+
 def _epoch_to_ts(epoch: Optional[int]) -> Optional[datetime]:
     if epoch is None:
         return None
@@ -97,17 +61,35 @@ def _categories_pipe(item: Dict[str, Any]) -> Optional[str]:
             return "|".join(names)
     return None
 
+def _category_tags(item: Dict[str, Any]) -> Optional[List[str]]:
+    """
+    category_tags(TEXT[]) 컬럼용: 카테고리 name 을 trim + 소문자로 정규화, 중복 제거.
+    (기존 ~* 정규식 매칭과 같은 대소문자 무시 정확 매칭을 GIN 인덱스로 처리하기 위함)
+    """
+    cats = item.get("categories")
+    if isinstance(cats, list) and cats:
+        tags = sorted({
+            c["name"].strip().lower()
+            for c in cats
+            if isinstance(c, dict) and isinstance(c.get("name"), str) and c["name"].strip()
+        })
+        if tags:
+            return tags
+    return None
+
 def _normalize_item_for_insert(it: Dict[str, Any]) -> Dict[str, Any]:
     # SerpAPI data.trending_searches[] 표준 키들 매핑
     query = it.get("query") or it.get("title") or it.get("name")
     link = it.get("link") or it.get("explore_link")  # 호환용(없어도 무방)
     start_ts = _epoch_to_ts(it.get("start_timestamp"))
     categories = _categories_pipe(it)
+    category_tags = _category_tags(it)
 
     return {
         "title": query,  # DB 컬럼은 title 이름 유지
         "link": link,
         "categories": categories,
+        "category_tags": category_tags,
         "search_volume": it.get("search_volume"),
         "increase_percentage": it.get("increase_percentage"),
         "active": it.get("active"),
@@ -118,11 +100,25 @@ def _normalize_item_for_insert(it: Dict[str, Any]) -> Dict[str, Any]:
         "raw": it,
     }
 
-def save_keywords(geo: str, hl: str, hours: int, items: Iterable[Dict[str, Any]]) -> int:
-    """Bulk-insert trending keywords collected at the same time."""
-    if pool is None:
-        raise RuntimeError("Pool not initialized")
+SQL_INSERT_KEYWORD = """
+INSERT INTO trending_keywords (
+  collected_at, geo, hl, hours,
+  title, link,
+  categories, category_tags, search_volume, increase_percentage, active, start_time,
+  trends_link, news_page_token, news_link,
+  raw_json
+)
+VALUES (
+  %s,%s,%s,%s,
+  %s,%s,
+  %s,%s,%s,%s,%s,%s,
+  %s,%s,%s,
+  %s
+);
+"""
 
+def _keyword_rows(geo: str, hl: str, hours: int, items: Iterable[Dict[str, Any]]) -> List[tuple]:
+    """save_keywords(동기/비동기 공용)용 INSERT 파라미터 튜플 목록."""
     now = datetime.now(timezone.utc)
     rows = []
     for it in items:
@@ -132,33 +128,24 @@ def save_keywords(geo: str, hl: str, hours: int, items: Iterable[Dict[str, Any]]
         rows.append((
             now, geo, hl, hours,
             n["title"], n["link"],
-            n["categories"], n["search_volume"], n["increase_percentage"], n["active"], n["start_time"],
+            n["categories"], n["category_tags"], n["search_volume"], n["increase_percentage"], n["active"], n["start_time"],
             n["trends_link"], n["news_page_token"], n["news_link"],
             Json(n["raw"]),
         ))
+    return rows
 
+def save_keywords(geo: str, hl: str, hours: int, items: Iterable[Dict[str, Any]]) -> int:
+    """Bulk-insert trending keywords collected at the same time."""
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    rows = _keyword_rows(geo, hl, hours, items)
     if not rows:
         return 0
 
-    sql = """
-    INSERT INTO trending_keywords (
-      collected_at, geo, hl, hours,
-      title, link,
-      categories, search_volume, increase_percentage, active, start_time,
-      trends_link, news_page_token, news_link,
-      raw_json
-    )
-    VALUES (
-      %s,%s,%s,%s,
-      %s,%s,
-      %s,%s,%s,%s,%s,
-      %s,%s,%s,
-      %s
-    );
-    """
     with pool.connection() as conn:
         with conn.cursor() as cur:
-            cur.executemany(sql, rows)
+            cur.executemany(SQL_INSERT_KEYWORD, rows)
         conn.commit()
     return len(rows)
 
@@ -166,26 +153,8 @@ def save_keywords(geo: str, hl: str, hours: int, items: Iterable[Dict[str, Any]]
 # 신규: 상위 트렌드 키워드 조회
 # ---------------------------
 
-def _category_regex(category: str) -> str:
-    """
-    categories 컬럼이 'A|B|C' 형태일 때 정확한 토큰 매칭을 위한 정규식 패턴을 생성.
-    대소문자 무시(~* 사용).
-    """
-    safe = re.escape(category.strip())
-    # 경계: 시작/끝 또는 파이프(|)
-    return rf"(^|\|){safe}($|\|)"
-
-def get_top_trending_keyword(category: Optional[str] = None) -> Optional[Dict[str, Any]]:
-    """
-    최근 4시간 내(collected_at 기준), search_volume >= 500 조건에서
-    (선택) 카테고리 정확 매칭으로 필터하여 가장 높은 검색어 하나를 반환.
-    - category 가 주어졌는데 해당 범위에 데이터 없으면 None.
-    - category 가 없으면 전체에서 선택.
-    반환값: dict(컬럼 전부 포함) 또는 None
-    """
-    if pool is None:
-        raise RuntimeError("Pool not initialized")
-
+def _top_trending_keyword_query(category: Optional[str]) -> Tuple[str, List[Any]]:
+    """get_top_trending_keyword(동기/비동기 공용) SQL과 파라미터."""
     cutoff = datetime.now(timezone.utc) - timedelta(hours=4)
 
     sql_base = """
@@ -198,13 +167,12 @@ def get_top_trending_keyword(category: Optional[str] = None) -> Optional[Dict[st
           AND (search_volume IS NOT NULL AND search_volume >= 500)
     """
 
-    args = [cutoff]
+    args: List[Any] = [cutoff]
 
     if category and category.strip():
-        # 정확 매칭 정규식 (~* : case-insensitive)
-        pattern = _category_regex(category)
-        sql = sql_base + " AND categories IS NOT NULL AND categories ~* %s "
-        args.append(pattern)
+        # 정확 매칭(대소문자 무시): 소문자 정규화된 category_tags 배열 포함 여부 → GIN 인덱스
+        sql = sql_base + " AND category_tags @> ARRAY[%s]::text[] "
+        args.append(category.strip().lower())
     else:
         sql = sql_base
 
@@ -216,6 +184,20 @@ def get_top_trending_keyword(category: Optional[str] = None) -> Optional[Dict[st
             collected_at DESC
         LIMIT 1
     """
+    return sql, args
+
+def get_top_trending_keyword(category: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    최근 4시간 내(collected_at 기준), search_volume >= 500 조건에서
+    (선택) 카테고리 정확 매칭으로 필터하여 가장 높은 검색어 하나를 반환.
+    - category 가 주어졌는데 해당 범위에 데이터 없으면 None.
+    - category 가 없으면 전체에서 선택.
+    반환값: dict(컬럼 전부 포함) 또는 None
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    sql, args = _top_trending_keyword_query(category)
 
     with pool.connection() as conn:
         with conn.cursor(row_factory=dict_row) as cur:
@@ -228,16 +210,28 @@ def get_top_trending_keyword(category: Optional[str] = None) -> Optional[Dict[st
 # 신규: 네이버 랭킹뉴스 저장
 # ---------------------------
 
-def save_naver_ranking_news(items: Iterable[Dict[str, Any]]) -> int:
-    """
-    네이버 랭킹뉴스 목록을 naver_ranking_news 테이블에 저장.
-    - 제목(title) 기준으로 UNIQUE.
-    - 이미 같은 제목이 있으면 500 에러 대신 그냥 무시(삽입 안 함).
-    - 저장 시점에 기준으로 3일 이전 데이터는 먼저 삭제.
-    """
-    if pool is None:
-        raise RuntimeError("Pool not initialized")
+# 제목 중복은 무시(삽입 안 함). 파티션 테이블이라 UNIQUE(title) 대신 NOT EXISTS 로 판정하고,
+# 동시에 저장하는 요청끼리는 SQL_LOCK_NAVER_NEWS_INGEST 로 직렬화한다.
+SQL_INSERT_NAVER_NEWS = """
+INSERT INTO naver_ranking_news (
+  collected_at,
+  press,
+  category,
+  rank,
+  title,
+  link,
+  raw_json
+)
+SELECT v.*
+  FROM (VALUES (%s::timestamptz, %s::text, %s::text, %s::int, %s::text, %s::text, %s::jsonb))
+       AS v (collected_at, press, category, rank, title, link, raw_json)
+ WHERE NOT EXISTS (SELECT 1 FROM naver_ranking_news n WHERE n.title = v.title);
+"""
+
+SQL_LOCK_NAVER_NEWS_INGEST = "SELECT pg_advisory_xact_lock(hashtext('postflow:naver_ranking_news'))"
 
+def _naver_news_rows(items: Iterable[Dict[str, Any]]) -> List[tuple]:
+    """save_naver_ranking_news(동기/비동기 공용)용 INSERT 파라미터 튜플 목록."""
     now = datetime.now(timezone.utc)
     rows = []
 
@@ -259,77 +253,196 @@ def save_naver_ranking_news(items: Iterable[Dict[str, Any]]) -> int:
         rows.append(
             (now, press, category, rank_int, title, link, Json(it))
         )
+    return rows
 
+def save_naver_ranking_news(items: Iterable[Dict[str, Any]]) -> int:
+    """
+    네이버 랭킹뉴스 목록을 naver_ranking_news 테이블에 저장.
+    - 제목(title) 기준으로 UNIQUE.
+    - 이미 같은 제목이 있으면 500 에러 대신 그냥 무시(삽입 안 함).
+    - 오래된 데이터 정리는 maintain_partitions() 가 파티션 단위로 처리 (여기서 DELETE 하지 않음).
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    rows = _naver_news_rows(items)
     if not rows:
         return 0
 
-    sql = """
-    INSERT INTO naver_ranking_news (
-      collected_at,
-      press,
-      category,
-      rank,
-      title,
-      link,
-      raw_json
-    )
-    VALUES (%s,%s,%s,%s,%s,%s,%s)
-    ON CONFLICT (title) DO NOTHING;
-    """
-
     with pool.connection() as conn:
         with conn.cursor() as cur:
-            # 🔹 먼저 3일 이전 데이터 삭제
-            cur.execute(
-                """
-                DELETE FROM naver_ranking_news
-                 WHERE collected_at < NOW() - INTERVAL '3 days'
-                """
-            )
-            # 🔹 그 다음 새 데이터 삽입
-            cur.executemany(sql, rows)
+            cur.execute(SQL_LOCK_NAVER_NEWS_INGEST)
+            cur.executemany(SQL_INSERT_NAVER_NEWS, rows)
         conn.commit()
 
     return len(rows)
 
-def get_top_news(category: str | None = None) -> Optional[Dict[str, Any]]:
-    """
-    24시간 내 최신뉴스 중 랜덤 1개 추출.
-    category 다중 입력 가능: "정치|경제|사회"
+def _top_news_query(category: str | None) -> Tuple[str, List[Any]]:
     """
-    if pool is None:
-        raise RuntimeError("Pool not initialized")
+    get_top_news(동기/비동기 공용) SQL과 파라미터.
 
-    # 기본 SQL
-    base_sql = """
-        SELECT id, press, rank, title
-          FROM naver_ranking_news
-         WHERE collected_at >= NOW() - INTERVAL '24 hours'
+    ORDER BY RANDOM() 은 후보 전체를 읽고 정렬하므로, 대신
+      1) 후보 수 n 을 세고 (idx_naver_ranking_category_collected_at 인덱스 전용 스캔)
+      2) [0, n) 의 난수 오프셋 위치의 id 하나만 고른 뒤
+      3) PK 로 해당 행을 읽는다.
+    count 와 오프셋 선택이 한 문장(같은 스냅샷)에서 실행되므로 후보 집합이 같고,
+    후보 간 균등 확률이 유지된다. (후보 순서와 무관)
     """
-
-    params = []
+    where = " collected_at >= NOW() - INTERVAL '24 hours' "
+    params: List[Any] = []
 
     # 다중 카테고리 처리
     if category:
         cats = [c.strip() for c in category.split("|") if c.strip()]
         if cats:
-            placeholders = ",".join(["%s"] * len(cats))
-            base_sql += f" AND category IN ({placeholders})"
-            params.extend(cats)
+            where += " AND category = ANY(%s) "
+            params.append(cats)
 
-    # 랜덤 순서
-    base_sql += """
-         ORDER BY RANDOM()
-         LIMIT 1;
+    sql = f"""
+        SELECT id, press, category, rank, title
+          FROM naver_ranking_news
+         WHERE collected_at >= NOW() - INTERVAL '24 hours'
+           AND id = (
+                SELECT id
+                  FROM naver_ranking_news
+                 WHERE {where}
+                OFFSET floor(random() * (
+                        SELECT count(*) FROM naver_ranking_news WHERE {where}
+                       ))::bigint
+                 LIMIT 1
+               );
     """
+    # WHERE 절이 두 번 쓰이므로 파라미터도 두 번
+    return sql, params + params
+
+def get_top_news(category: str | None = None) -> Optional[Dict[str, Any]]:
+    """
+    24시간 내 최신뉴스 중 랜덤 1개 추출.
+    category 다중 입력 가능: "정치|경제|사회"
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    sql, params = _top_news_query(category)
 
     with pool.connection() as conn:
         with conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(base_sql, params)
+            cur.execute(sql, params)
             row = cur.fetchone()
 
     return dict(row) if row else None
 
+# ---------------------------
+# 벌크 적재: COPY → 스테이징 테이블 → 본 테이블 병합
+# ---------------------------
+
+KEYWORD_COLUMNS = (
+    "collected_at, geo, hl, hours, title, link, "
+    "categories, category_tags, search_volume, increase_percentage, active, start_time, "
+    "trends_link, news_page_token, news_link, raw_json"
+)
+
+NAVER_NEWS_COLUMNS = "collected_at, press, category, rank, title, link, raw_json"
+
+def _copy_into_staging(cur: psycopg.Cursor, table: str, columns: str, rows: List[tuple]) -> str:
+    """
+    본 테이블과 같은 컬럼 타입의 임시 테이블(ON COMMIT DROP)을 만들고 COPY 로 rows 를 적재.
+    반환값: 스테이징 테이블 이름
+    """
+    staging = f"_stage_{table}"
+    cur.execute(
+        f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+        f"SELECT {columns} FROM {table} WITH NO DATA"
+    )
+    with cur.copy(f"COPY {staging} ({columns}) FROM STDIN") as copy:
+        for row in rows:
+            copy.write_row(row)
+    return staging
+
+def copy_keywords(geo: str, hl: str, hours: int, items: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    save_keywords 의 벌크 버전(백필/다중 geo 수집용).
+    COPY 로 스테이징 테이블에 올린 뒤 INSERT ... SELECT 한 번으로 병합한다.
+    반환값: {"inserted": 저장 건수, "skipped": 병합 시 제외된 건수, "invalid": 제목 없어 버린 건수}
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    items = list(items)
+    rows = _keyword_rows(geo, hl, hours, items)
+    result = {"inserted": 0, "skipped": 0, "invalid": len(items) - len(rows)}
+    if not rows:
+        return result
+
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            staging = _copy_into_staging(cur, "trending_keywords", KEYWORD_COLUMNS, rows)
+            cur.execute(
+                f"INSERT INTO trending_keywords ({KEYWORD_COLUMNS}) "
+                f"SELECT {KEYWORD_COLUMNS} FROM {staging}"
+            )
+            inserted = cur.rowcount
+        conn.commit()
+
+    result["inserted"] = inserted
+    result["skipped"] = len(rows) - inserted
+    return result
+
+def copy_naver_ranking_news(items: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    save_naver_ranking_news 의 벌크 버전.
+    - 스킵/중복 규칙은 동일: 이미 저장된 제목은 무시
+      (같은 배치 안의 중복 제목도 첫 행만 저장)
+    반환값: {"inserted": 저장 건수, "skipped": 중복으로 제외된 건수, "invalid": 필수값 누락으로 버린 건수}
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    items = list(items)
+    rows = _naver_news_rows(items)
+    result = {"inserted": 0, "skipped": 0, "invalid": len(items) - len(rows)}
+    if not rows:
+        return result
+
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(SQL_LOCK_NAVER_NEWS_INGEST)
+            staging = _copy_into_staging(cur, "naver_ranking_news", NAVER_NEWS_COLUMNS, rows)
+            # 새로 COPY 한 임시 테이블의 ctid 순서 = 입력 순서 → 배치 내 중복은 첫 행 유지
+            cur.execute(
+                f"INSERT INTO naver_ranking_news ({NAVER_NEWS_COLUMNS}) "
+                f"SELECT {NAVER_NEWS_COLUMNS} FROM ("
+                f"  SELECT DISTINCT ON (title) * FROM {staging} ORDER BY title, ctid"
+                f") s "
+                "WHERE NOT EXISTS (SELECT 1 FROM naver_ranking_news n WHERE n.title = s.title)"
+            )
+            inserted = cur.rowcount
+        conn.commit()
+
+    result["inserted"] = inserted
+    result["skipped"] = len(rows) - inserted
+    return result
+
+SQL_UPSERT_USER = """
+INSERT INTO users (username, password_hash, expires_at, is_active)
+VALUES (%s, %s, %s, %s)
+ON CONFLICT (username) DO UPDATE
+  SET password_hash = EXCLUDED.password_hash,
+      expires_at    = EXCLUDED.expires_at,
+      is_active     = EXCLUDED.is_active;
+"""
+
+# 사용자 변경 알림 채널 (다른 워커의 사용자 캐시 무효화용, payload = username)
+USER_CHANGED_CHANNEL = "postflow_user_changed"
+
+SQL_NOTIFY_USER_CHANGED = f"SELECT pg_notify('{USER_CHANGED_CHANNEL}', %s)"
+
+SQL_GET_USER = """
+SELECT username, password_hash, expires_at, is_active, created_at
+  FROM users
+ WHERE username = %s
+"""
+
 def create_user(
     username: str,
     password_hash: str,
@@ -345,17 +458,11 @@ def create_user(
     if pool is None:
         raise RuntimeError("Pool not initialized")
 
-    sql = """
-    INSERT INTO users (username, password_hash, expires_at, is_active)
-    VALUES (%s, %s, %s, %s)
-    ON CONFLICT (username) DO UPDATE
-      SET password_hash = EXCLUDED.password_hash,
-          expires_at    = EXCLUDED.expires_at,
-          is_active     = EXCLUDED.is_active;
-    """
     with pool.connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(sql, (username, password_hash, expires_at, is_active))
+            cur.execute(SQL_UPSERT_USER, (username, password_hash, expires_at, is_active))
+            # 다른 워커의 사용자 캐시 무효화 (NOTIFY 는 커밋 시점에 전달됨)
+            cur.execute(SQL_NOTIFY_USER_CHANGED, (username,))
         conn.commit()
 
 
@@ -367,14 +474,564 @@ def get_user(username: str) -> Optional[Dict[str, Any]]:
     if pool is None:
         raise RuntimeError("Pool not initialized")
 
+    with pool.connection() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(SQL_GET_USER, (username,))
+            row = cur.fetchone()
+
+    return dict(row) if row else None
+
+# ---------------------------
+# 비동기 RSS 생성 작업 (rss_jobs)
+# ---------------------------
+
+RSS_JOB_COLUMNS = "id, status, params, result_xml, error, attempts, created_at, updated_at, finished_at"
+
+SQL_CREATE_RSS_JOB = """
+INSERT INTO rss_jobs (id, status, params) VALUES (%s, 'queued', %s)
+"""
+
+SQL_GET_RSS_JOB = f"SELECT {RSS_JOB_COLUMNS} FROM rss_jobs WHERE id = %s"
+
+def claim_rss_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    queued 상태인 작업을 running 으로 바꾸고 반환.
+    다른 워커(프로세스)가 먼저 가져갔거나 이미 끝났으면 None.
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    sql = f"""
+    UPDATE rss_jobs
+       SET status = 'running', attempts = attempts + 1, updated_at = NOW()
+     WHERE id = %s AND status = 'queued'
+    RETURNING {RSS_JOB_COLUMNS}
+    """
+    with pool.connection() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(sql, (job_id,))
+            row = cur.fetchone()
+        conn.commit()
+
+    return dict(row) if row else None
+
+def finish_rss_job(job_id: str, result_xml: str) -> None:
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
     sql = """
-    SELECT username, password_hash, expires_at, is_active, created_at
-      FROM users
-     WHERE username = %s
+    UPDATE rss_jobs
+       SET status = 'done', result_xml = %s, error = NULL,
+           updated_at = NOW(), finished_at = NOW()
+     WHERE id = %s
     """
+    with pool.connection() as conn:
+        conn.execute(sql, (result_xml, job_id))
+        conn.commit()
+
+def fail_rss_job(job_id: str, error: str) -> None:
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    sql = """
+    UPDATE rss_jobs
+       SET status = 'failed', error = %s,
+           updated_at = NOW(), finished_at = NOW()
+     WHERE id = %s
+    """
+    with pool.connection() as conn:
+        conn.execute(sql, (error, job_id))
+        conn.commit()
+
+def recover_rss_jobs(stale_after: timedelta, max_attempts: int) -> List[str]:
+    """
+    워커 재시작 후 복구용.
+    - stale_after 동안 갱신이 없는 running 작업(이전 프로세스가 죽음)은 다시 queued 로
+      (단, 시도 횟수가 max_attempts 에 도달했으면 failed)
+    - 다시 실행할 queued 작업 id 목록을 오래된 순으로 반환
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    cutoff = datetime.now(timezone.utc) - stale_after
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE rss_jobs
+                   SET status = CASE WHEN attempts >= %s THEN 'failed' ELSE 'queued' END,
+                       error = CASE WHEN attempts >= %s THEN 'worker restarted too many times' ELSE error END,
+                       finished_at = CASE WHEN attempts >= %s THEN NOW() ELSE finished_at END,
+                       updated_at = NOW()
+                 WHERE status = 'running' AND updated_at < %s
+                """,
+                (max_attempts, max_attempts, max_attempts, cutoff),
+            )
+            cur.execute("SELECT id FROM rss_jobs WHERE status = 'queued' ORDER BY created_at")
+            ids = [str(r[0]) for r in cur.fetchall()]
+        conn.commit()
+    return ids
+
+
+# ---------------------------
+# LLM 생성 결과 캐시 (llm_generation_cache)
+# ---------------------------
+
+def get_cached_generation(cache_key: str) -> Optional[Dict[str, Any]]:
+    """
+    만료되지 않은 캐시 항목을 반환하면서 hits/last_hit_at 갱신 (한 번의 UPDATE ... RETURNING).
+    반환값: {"article": dict, "expires_at": datetime} 또는 None
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    sql = """
+    UPDATE llm_generation_cache
+       SET hits = hits + 1, last_hit_at = NOW()
+     WHERE cache_key = %s AND expires_at > NOW()
+    RETURNING article, expires_at
+    """
+    with pool.connection() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(sql, (cache_key,))
+            row = cur.fetchone()
+        conn.commit()
+
+    return dict(row) if row else None
+
+def touch_cached_generations(hits: Dict[str, int]) -> None:
+    """
+    프로세스 내 LRU 에서 적중한 키들의 hits/last_hit_at 을 한 번에 반영.
+    (메모리 적중도 반영해야 put_cached_generation 의 last_hit_at 기준 정리가 자주 쓰는 키를 지우지 않는다)
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+    if not hits:
+        return
+
+    sql = """
+    UPDATE llm_generation_cache AS c
+       SET hits = c.hits + v.n, last_hit_at = NOW()
+      FROM unnest(%s::text[], %s::int[]) AS v(cache_key, n)
+     WHERE c.cache_key = v.cache_key
+    """
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, (list(hits.keys()), list(hits.values())))
+        conn.commit()
+
+def put_cached_generation(
+    cache_key: str,
+    model: str,
+    article: Dict[str, Any],
+    ttl: timedelta,
+    max_rows: int,
+) -> None:
+    """
+    캐시 저장(같은 키면 덮어쓰기) 후 정리:
+    만료된 항목과, 최근 사용 순으로 max_rows 를 넘는 항목을 삭제.
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    expires_at = datetime.now(timezone.utc) + ttl
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO llm_generation_cache (cache_key, model, article, expires_at)
+                VALUES (%s, %s, %s, %s)
+                ON CONFLICT (cache_key) DO UPDATE
+                  SET model = EXCLUDED.model,
+                      article = EXCLUDED.article,
+                      created_at = NOW(),
+                      expires_at = EXCLUDED.expires_at,
+                      last_hit_at = NOW()
+                """,
+                (cache_key, model, Json(article), expires_at),
+            )
+            cur.execute(
+                """
+                DELETE FROM llm_generation_cache
+                 WHERE expires_at <= NOW()
+                    OR cache_key IN (
+                        SELECT cache_key FROM llm_generation_cache
+                         ORDER BY last_hit_at DESC
+                        OFFSET %s
+                    )
+                """,
+                (max_rows,),
+            )
+        conn.commit()
+
+
+# ---------------------------
+# 뉴스 제목 → 카테고리 메모 (news_category_memo)
+# ---------------------------
+
+def lookup_category_memo(title_hashes: List[str]) -> Dict[str, str]:
+    """
+    title_hash 목록을 한 번의 쿼리로 조회해 {title_hash: category} 반환.
+    찾은 항목은 last_seen_at 을 갱신한다. (보존 기간 정리 기준)
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+    if not title_hashes:
+        return {}
+
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE news_category_memo
+                   SET last_seen_at = NOW()
+                 WHERE title_hash = ANY(%s)
+                RETURNING title_hash, category
+                """,
+                (title_hashes,),
+            )
+            rows = cur.fetchall()
+        conn.commit()
+
+    return {h: c for h, c in rows}
+
+def save_category_memo(entries: Iterable[Tuple[str, str, str, str]], retention: timedelta) -> int:
+    """
+    (title_hash, title, category, source) 를 저장(같은 해시면 카테고리/출처 갱신)하고
+    retention 동안 다시 보이지 않은 항목은 삭제한다. source: 'llm' 또는 'local'(로컬 분류기)
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    rows = list(entries)
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            if rows:
+                cur.executemany(
+                    """
+                    INSERT INTO news_category_memo (title_hash, title, category, source)
+                    VALUES (%s, %s, %s, %s)
+                    ON CONFLICT (title_hash) DO UPDATE
+                      SET category = EXCLUDED.category,
+                          source = EXCLUDED.source,
+                          last_seen_at = NOW()
+                    """,
+                    rows,
+                )
+            cur.execute(
+                "DELETE FROM news_category_memo WHERE last_seen_at < %s",
+                (datetime.now(timezone.utc) - retention,),
+            )
+        conn.commit()
+
+    return len(rows)
+
+
+# ---------------------------
+# 로컬 제목 분류기 (news_category_models)
+# ---------------------------
+
+# 최신 모델 외에 남겨 둘 이전 모델 수 (되돌리기용)
+CLASSIFIER_MODELS_KEEP = 5
+
+def fetch_category_training_rows(categories: List[str]) -> Dict[str, List[Tuple[Any, ...]]]:
+    """
+    분류기 학습 데이터 원본.
+      memo: news_category_memo 의 (title_hash, title, category, source)
+      news: naver_ranking_news 의 (title, category) 중 category 가 categories 에 속하는 행
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT title_hash, title, category, source FROM news_category_memo WHERE category = ANY(%s)",
+                (categories,),
+            )
+            memo = cur.fetchall()
+            cur.execute(
+                "SELECT title, category FROM naver_ranking_news WHERE category = ANY(%s)",
+                (categories,),
+            )
+            news = cur.fetchall()
+
+    return {"memo": memo, "news": news}
+
+def save_category_model(model: Dict[str, Any], evaluation: Dict[str, Any]) -> int:
+    """새 모델을 저장하고 CLASSIFIER_MODELS_KEEP 개보다 오래된 모델은 삭제. 새 id 반환."""
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "INSERT INTO news_category_models (model, evaluation) VALUES (%s, %s) RETURNING id",
+                (Json(model), Json(evaluation)),
+            )
+            model_id = cur.fetchone()[0]
+            cur.execute(
+                """
+                DELETE FROM news_category_models
+                 WHERE id NOT IN (SELECT id FROM news_category_models ORDER BY id DESC LIMIT %s)
+                """,
+                (CLASSIFIER_MODELS_KEEP,),
+            )
+        conn.commit()
+
+    return model_id
+
+def load_latest_category_model() -> Optional[Dict[str, Any]]:
+    """가장 최근 모델 {"id", "created_at", "model", "evaluation"} 또는 None."""
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
     with pool.connection() as conn:
         with conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(sql, (username,))
+            cur.execute(
+                "SELECT id, created_at, model, evaluation FROM news_category_models ORDER BY id DESC LIMIT 1"
+            )
             row = cur.fetchone()
 
-    return dict(row) if row else None
\ No newline at end of file
+    return dict(row) if row else None
+
+
+# ---------------------------
+# 미리 생성한 기사 풀 (rss_article_pool)
+# ---------------------------
+
+# 24시간 내 뉴스의 카테고리별 순위 (rank, 최신순). 후보 선정과 정리가 같은 기준을 쓰도록 공유
+SQL_POOL_RANKING = """
+SELECT category, title, collected_at,
+       row_number() OVER (PARTITION BY category ORDER BY rank, collected_at DESC, id DESC) AS rn
+  FROM naver_ranking_news
+ WHERE collected_at >= NOW() - INTERVAL '24 hours'
+   AND category IS NOT NULL AND category <> ''
+"""
+
+def pool_article_candidates(per_category: int, persona: str) -> List[Dict[str, Any]]:
+    """
+    24시간 내 뉴스 중 카테고리별 상위 per_category 개(rank, 최신순) 가운데
+    아직 풀에 (만료되지 않은) 기사가 없는 것. get_top_news 와 같은 24시간 기준.
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    sql = f"""
+    SELECT t.category, t.title, t.collected_at
+      FROM ({SQL_POOL_RANKING}) t
+     WHERE t.rn <= %s
+       AND NOT EXISTS (
+            SELECT 1 FROM rss_article_pool p
+             WHERE p.news_title = t.title AND p.persona = %s AND p.expires_at > NOW()
+       )
+     ORDER BY t.category, t.rn
+    """
+    with pool.connection() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(sql, (per_category, persona))
+            return [dict(r) for r in cur.fetchall()]
+
+def save_pooled_article(
+    category: str,
+    news_title: str,
+    persona: str,
+    article: Dict[str, Any],
+    expires_at: datetime,
+) -> None:
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    with pool.connection() as conn:
+        conn.execute(
+            """
+            INSERT INTO rss_article_pool (category, news_title, persona, article, expires_at)
+            VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT (news_title, persona) DO UPDATE
+              SET category = EXCLUDED.category,
+                  article = EXCLUDED.article,
+                  created_at = NOW(),
+                  expires_at = EXCLUDED.expires_at
+            """,
+            (category, news_title, persona, Json(article), expires_at),
+        )
+        conn.commit()
+
+def prune_article_pool(per_category: int) -> int:
+    """
+    만료된 기사와, 지금 카테고리별 상위 per_category 개(pool_article_candidates 와 같은 순위)에
+    들지 않는 뉴스의 기사 삭제. 순위에 남아 있는 기사는 오래됐어도 지우지 않는다. (다시 생성하지 않도록)
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                DELETE FROM rss_article_pool p
+                 WHERE p.expires_at <= NOW()
+                    OR NOT EXISTS (
+                        SELECT 1 FROM ({SQL_POOL_RANKING}) t
+                         WHERE t.rn <= %s AND t.category = p.category AND t.title = p.news_title
+                    )
+                """,
+                (per_category,),
+            )
+            deleted = cur.rowcount
+        conn.commit()
+    return deleted
+
+def _pooled_article_query(category: str | None, persona: str) -> Tuple[str, List[Any]]:
+    """
+    풀에서 임의의 기사 하나 (get_pooled_article 동기/비동기 공용).
+    풀은 (카테고리 수 × RSS_POOL_PER_CATEGORY) 행 정도라 ORDER BY random() 으로 충분하다.
+    category 는 get_top_news 와 같이 "정치|경제" 다중 입력 가능.
+    """
+    where = "persona = %s AND expires_at > NOW()"
+    params: List[Any] = [persona]
+
+    if category:
+        cats = [c.strip() for c in category.split("|") if c.strip()]
+        if cats:
+            where += " AND category = ANY(%s)"
+            params.append(cats)
+
+    sql = f"""
+        SELECT id, category, news_title, article, created_at
+          FROM rss_article_pool
+         WHERE {where}
+         ORDER BY random()
+         LIMIT 1
+    """
+    return sql, params
+
+
+# ---------------------------
+# LLM 호출 기록 (llm_calls)
+# ---------------------------
+
+SQL_INSERT_LLM_CALL = """
+INSERT INTO llm_calls (feature, model, outcome, latency_ms, prompt_tokens, completion_tokens, retries, hedge, error)
+VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+# llm_calls 의 행 하나는 시도(attempt) 하나다. (retries = 그 시도의 재시도 순번)
+# - calls:    논리 호출 수 = 첫 시도(retries = 0)이면서 hedge 가 아닌 행
+# - attempts: 실제로 보낸 요청 수 (재시도, hedge 포함)
+# - retries:  재시도로 보낸 요청 수 (hedge 제외)
+# - errors:   실패한 시도 수 (클라이언트가 끊은 스트림 'cancelled' 제외)
+
+SQL_LLM_USAGE = """
+SELECT (created_at AT TIME ZONE %s)::date AS day,
+       feature,
+       model,
+       count(*) FILTER (WHERE retries = 0 AND NOT hedge) AS calls,
+       count(*)                                   AS attempts,
+       count(*) FILTER (WHERE outcome NOT IN ('ok', 'cancelled')) AS errors,
+       coalesce(sum(prompt_tokens), 0)::bigint     AS prompt_tokens,
+       coalesce(sum(completion_tokens), 0)::bigint AS completion_tokens,
+       count(*) FILTER (WHERE retries > 0 AND NOT hedge) AS retries,
+       percentile_cont(0.5)  WITHIN GROUP (ORDER BY latency_ms) AS p50_ms,
+       percentile_cont(0.95) WITHIN GROUP (ORDER BY latency_ms) AS p95_ms
+  FROM llm_calls
+ WHERE created_at >= %s
+ GROUP BY 1, 2, 3
+ ORDER BY 1 DESC, 2, 3
+"""
+
+def record_llm_call(row: tuple, retention: timedelta, prune: bool = False) -> None:
+    """llm_calls 에 한 행 기록. prune=True 면 retention 지난 기록도 삭제."""
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(SQL_INSERT_LLM_CALL, row)
+            if prune:
+                cur.execute(
+                    "DELETE FROM llm_calls WHERE created_at < %s",
+                    (datetime.now(timezone.utc) - retention,),
+                )
+        conn.commit()
+
+
+# ---------------------------
+# 게시된 글 (feed_articles)
+# ---------------------------
+
+# 게시를 직렬화해서 (published_at, id) 순서 = 커밋 순서가 되게 한다. (since 커서가 늦게 커밋된 글을 건너뛰지 않도록)
+# published_at 은 트랜잭션 시작 시각인 NOW() 가 아니라 락을 잡은 뒤의 clock_timestamp() 로 넣는다.
+SQL_LOCK_FEED_PUBLISH = "SELECT pg_advisory_xact_lock(hashtext('postflow:feed_articles'))"
+
+SQL_INSERT_FEED_ARTICLE = """
+INSERT INTO feed_articles (guid, news_title, category, persona, article, published_at)
+VALUES (%s, %s, %s, %s, %s, clock_timestamp())
+ON CONFLICT (guid) DO NOTHING
+"""
+
+# 이미 있던 guid 는 처음 게시 시각을 그대로 돌려준다
+SQL_FEED_PUBLISHED_AT = "SELECT guid, published_at FROM feed_articles WHERE guid = ANY(%s)"
+
+def _feed_article_rows(rows: Iterable[Tuple[str, str, Optional[str], str, Dict[str, Any]]]) -> List[tuple]:
+    return [(guid, news_title, category, persona, Json(article)) for guid, news_title, category, persona, article in rows]
+
+def save_feed_articles(rows: Iterable[Tuple[str, str, Optional[str], str, Dict[str, Any]]]) -> Dict[str, datetime]:
+    """
+    (guid, news_title, category, persona, article) 저장 (같은 guid 는 무시).
+    반환: {guid: published_at}
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    params = _feed_article_rows(rows)
+    if not params:
+        return {}
+
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(SQL_LOCK_FEED_PUBLISH)
+            cur.executemany(SQL_INSERT_FEED_ARTICLE, params)
+            cur.execute(SQL_FEED_PUBLISHED_AT, ([p[0] for p in params],))
+            published = {guid: ts for guid, ts in cur.fetchall()}
+        conn.commit()
+    return published
+
+def _feed_query(
+    category: str | None,
+    limit: int,
+    since: Optional[Tuple[datetime, int]] = None,
+    before: Optional[Tuple[datetime, int]] = None,
+) -> Tuple[str, List[Any]]:
+    """
+    GET /feed 용 글 목록. (published_at, id) 키셋 페이지네이션 (idx_feed_articles_published_id 사용).
+    - before: 그보다 오래된 글을 최신순으로 (과거 페이지)
+    - since: 그보다 새 글을 오래된 순으로 limit 개 (폴링; 새 글이 limit 보다 많으면 이어서 다시 요청)
+      save_feed_articles 가 게시를 직렬화하므로 커서 뒤에 늦게 커밋된 글이 끼어들지 않는다.
+    category 는 "정치|경제" 다중 입력 가능.
+    """
+    conds: List[str] = []
+    params: List[Any] = []
+
+    if category:
+        cats = [c.strip() for c in category.split("|") if c.strip()]
+        if cats:
+            conds.append("category = ANY(%s)")
+            params.append(cats)
+    if since is not None:
+        conds.append("(published_at, id) > (%s, %s)")
+        params.extend(since)
+    if before is not None:
+        conds.append("(published_at, id) < (%s, %s)")
+        params.extend(before)
+
+    where = " AND ".join(conds) or "TRUE"
+    order = "ASC" if since is not None else "DESC"
+    sql = f"""
+        SELECT id, guid, news_title, category, persona, article, published_at
+          FROM feed_articles
+         WHERE {where}
+         ORDER BY published_at {order}, id {order}
+         LIMIT %s
+    """
+    return sql, params + [limit]
@@ -0,0 +1,322 @@
+# app\db\postgres_async.py
+"""
+app/db/postgres.py 의 비동기(AsyncConnectionPool) 버전.
+
+- SQL/파라미터 생성은 postgres.py 의 헬퍼를 그대로 공유한다. (두 모듈의 쿼리가 어긋나지 않도록)
+- 스키마 마이그레이션은 동기 init_pool() 이 처리하므로 여기서는 풀만 연다.
+- async def 라우트에서 스레드풀을 점유하지 않고 작은 풀을 여러 요청이 공유하도록 하기 위함.
+"""
+from __future__ import annotations
+from typing import AsyncIterator, Iterable, Dict, Any, List, Optional, Tuple
+from datetime import datetime
+
+from psycopg_pool import AsyncConnectionPool
+from psycopg.rows import dict_row
+from psycopg.types.json import Json
+
+from app.core.config import settings
+from app.db.postgres import (
+    SQL_INSERT_KEYWORD,
+    SQL_INSERT_NAVER_NEWS,
+    SQL_LOCK_NAVER_NEWS_INGEST,
+    SQL_UPSERT_USER,
+    SQL_GET_USER,
+    SQL_NOTIFY_USER_CHANGED,
+    SQL_CREATE_RSS_JOB,
+    SQL_GET_RSS_JOB,
+    SQL_LLM_USAGE,
+    SQL_INSERT_FEED_ARTICLE,
+    SQL_LOCK_FEED_PUBLISH,
+    SQL_FEED_PUBLISHED_AT,
+    _feed_article_rows,
+    _feed_query,
+    _keyword_rows,
+    _naver_news_rows,
+    _top_trending_keyword_query,
+    _top_news_query,
+    _pooled_article_query,
+)
+
+pool: AsyncConnectionPool | None = None
+
+
+async def init_pool():
+    """Open the global async connection pool (schema is handled by postgres.init_pool)."""
+    global pool
+    if pool is None:
+        if not settings.DATABASE_URL:
+            raise RuntimeError("DATABASE_URL is empty")
+        pool = AsyncConnectionPool(
+            settings.DATABASE_URL,
+            min_size=settings.DB_ASYNC_POOL_MIN_SIZE,
+            max_size=settings.DB_ASYNC_POOL_MAX_SIZE,
+            open=False,
+        )
+        await pool.open()
+
+
+async def close_pool():
+    global pool
+    if pool:
+        await pool.close()
+        pool = None
+
+
+async def save_keywords(geo: str, hl: str, hours: int, items: Iterable[Dict[str, Any]]) -> int:
+    """Bulk-insert trending keywords collected at the same time."""
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    rows = _keyword_rows(geo, hl, hours, items)
+    if not rows:
+        return 0
+
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.executemany(SQL_INSERT_KEYWORD, rows)
+        await conn.commit()
+    return len(rows)
+
+
+async def get_top_trending_keyword(category: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """postgres.get_top_trending_keyword 의 비동기 버전."""
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    sql, args = _top_trending_keyword_query(category)
+
+    async with pool.connection() as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(sql, args)
+            row = await cur.fetchone()
+
+    return dict(row) if row else None
+
+
+async def save_naver_ranking_news(items: Iterable[Dict[str, Any]]) -> int:
+    """postgres.save_naver_ranking_news 의 비동기 버전."""
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    rows = _naver_news_rows(items)
+    if not rows:
+        return 0
+
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(SQL_LOCK_NAVER_NEWS_INGEST)
+            await cur.executemany(SQL_INSERT_NAVER_NEWS, rows)
+        await conn.commit()
+
+    return len(rows)
+
+
+async def get_top_news(category: str | None = None) -> Optional[Dict[str, Any]]:
+    """postgres.get_top_news 의 비동기 버전."""
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    sql, params = _top_news_query(category)
+
+    async with pool.connection() as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(sql, params)
+            row = await cur.fetchone()
+
+    return dict(row) if row else None
+
+
+async def create_user(
+    username: str,
+    password_hash: str,
+    expires_at: datetime,
+    is_active: bool = True,
+) -> None:
+    """postgres.create_user 의 비동기 버전."""
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(SQL_UPSERT_USER, (username, password_hash, expires_at, is_active))
+            await cur.execute(SQL_NOTIFY_USER_CHANGED, (username,))
+        await conn.commit()
+
+
+async def get_user(username: str) -> Optional[Dict[str, Any]]:
+    """postgres.get_user 의 비동기 버전."""
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    async with pool.connection() as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(SQL_GET_USER, (username,))
+            row = await cur.fetchone()
+
+    return dict(row) if row else None
+
+
+async def create_rss_job(job_id: str, params: Dict[str, Any]) -> None:
+    """rss_jobs 에 queued 상태로 작업 등록."""
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    async with pool.connection() as conn:
+        await conn.execute(SQL_CREATE_RSS_JOB, (job_id, Json(params)))
+        await conn.commit()
+
+
+async def get_rss_job(job_id: str) -> Optional[Dict[str, Any]]:
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    async with pool.connection() as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(SQL_GET_RSS_JOB, (job_id,))
+            row = await cur.fetchone()
+
+    return dict(row) if row else None
+
+
+async def get_pooled_article(category: str | None, persona: str) -> Optional[Dict[str, Any]]:
+    """미리 생성된 기사 풀에서 (만료되지 않은) 기사 하나. 없으면 None."""
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    sql, params = _pooled_article_query(category, persona)
+
+    async with pool.connection() as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(sql, params)
+            row = await cur.fetchone()
+
+    return dict(row) if row else None
+
+
+async def get_llm_usage(since: datetime, tz: str) -> List[Dict[str, Any]]:
+    """since 이후 LLM 호출을 (tz 기준 날짜, 기능, 모델)별로 집계."""
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    async with pool.connection() as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(SQL_LLM_USAGE, (tz, since))
+            rows = await cur.fetchall()
+
+    return [dict(r) for r in rows]
+
+
+async def save_feed_articles(rows: Iterable[Tuple[str, str, Optional[str], str, Dict[str, Any]]]) -> Dict[str, datetime]:
+    """postgres.save_feed_articles 의 비동기 버전."""
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    params = _feed_article_rows(rows)
+    if not params:
+        return {}
+
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(SQL_LOCK_FEED_PUBLISH)
+            await cur.executemany(SQL_INSERT_FEED_ARTICLE, params)
+            await cur.execute(SQL_FEED_PUBLISHED_AT, ([p[0] for p in params],))
+            published = {guid: ts for guid, ts in await cur.fetchall()}
+        await conn.commit()
+    return published
+
+
+async def list_feed_articles(
+    category: str | None,
+    limit: int,
+    since: Optional[Tuple[datetime, int]] = None,
+    before: Optional[Tuple[datetime, int]] = None,
+) -> List[Dict[str, Any]]:
+    """게시된 글 limit 개, 항상 최신순으로 반환 (since/before 는 (published_at, id) 커서)."""
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+
+    sql, params = _feed_query(category, limit, since, before)
+
+    async with pool.connection() as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(sql, params)
+            rows = await cur.fetchall()
+
+    rows = [dict(r) for r in rows]
+    if since is not None:
+        rows.reverse()
+    return rows
+
+
+# ---------------------------
+# 대용량 내보내기 (서버 측 named cursor)
+# ---------------------------
+
+EXPORT_COLUMNS = {
+    "naver_ranking_news": "id, collected_at, press, category, rank, title, link, raw_json",
+    "trending_keywords": (
+        "id, collected_at, geo, hl, hours, title, link, categories, category_tags, "
+        "search_volume, increase_percentage, active, start_time, "
+        "trends_link, news_page_token, news_link, raw_json"
+    ),
+}
+
+
+def _export_query(
+    table: str,
+    since: datetime,
+    until: datetime,
+    categories: Optional[List[str]] = None,
+    press: Optional[str] = None,
+) -> Tuple[str, List[Any]]:
+    """iter_export_rows 용 SQL. collected_at 범위 조건으로 파티션 프루닝."""
+    where = ["collected_at >= %s", "collected_at < %s"]
+    params: List[Any] = [since, until]
+
+    if categories:
+        if table == "trending_keywords":
+            where.append("category_tags && %s::text[]")
+            params.append([c.lower() for c in categories])
+        else:
+            where.append("category = ANY(%s)")
+            params.append(categories)
+
+    if press and table == "naver_ranking_news":
+        where.append("press = %s")
+        params.append(press)
+
+    sql = (
+        f"SELECT {EXPORT_COLUMNS[table]} FROM {table} "
+        f"WHERE {' AND '.join(where)} "
+        "ORDER BY collected_at, id"
+    )
+    return sql, params
+
+
+async def iter_export_rows(
+    table: str,
+    since: datetime,
+    until: datetime,
+    categories: Optional[List[str]] = None,
+    press: Optional[str] = None,
+    batch_size: int = 1000,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    naver_ranking_news / trending_keywords 행을 서버 측 named cursor 로 batch_size 씩 가져와 하나씩 yield.
+    전체 결과를 메모리에 올리지 않으므로 내보내는 행 수와 무관하게 메모리 사용량이 일정하다.
+    """
+    if pool is None:
+        raise RuntimeError("Pool not initialized")
+    if table not in EXPORT_COLUMNS:
+        raise ValueError(f"unknown export table: {table}")
+
+    sql, params = _export_query(table, since, until, categories, press)
+
+    async with pool.connection() as conn:
+        # named cursor 는 트랜잭션 안에서만 유효
+        async with conn.transaction():
+            async with conn.cursor(name=f"export_{table}", row_factory=dict_row) as cur:
+                cur.itersize = batch_size
+                await cur.execute(sql, params)
+                async for row in cur:
+                    yield row
@@ -1,18 +1,19 @@
 # app/dependencies/auth.py
 from datetime import datetime, timezone
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 
-from app.db import postgres
+from app.core.config import settings
+from app.services import user_cache
 from app.core.security import decode_access_token
 from app.schemas.user_schema import TokenData
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
-def get_current_user(
+async def get_current_user(
     token: str = Depends(oauth2_scheme),
 ) -> dict:
     """
@@ -34,7 +35,8 @@ def get_current_user(
     if not token_data.username:
         raise credentials_exc
 
-    user = postgres.get_user(token_data.username)
+    # 공통 경로: 프로세스 내 캐시에서 바로 반환 (DB 왕복 없음)
+    user = await user_cache.get_user(token_data.username)
     if not user:
         raise credentials_exc
 
@@ -56,3 +58,31 @@ def get_current_user(
         )
 
     return user  # dict(username, password_hash, expires_at, is_active, created_at)
+
+
+def client_ip(request: Request) -> str:
+    """
+    요청 IP. TRUST_PROXY_HEADERS 면 X-Forwarded-For 의 오른쪽에서 TRUSTED_PROXY_HOPS 번째 주소
+    (신뢰하는 프록시가 덧붙인 주소). 왼쪽 항목은 클라이언트가 마음대로 넣을 수 있으므로 쓰지 않는다.
+    """
+    if settings.TRUST_PROXY_HEADERS:
+        forwarded = [p.strip() for p in request.headers.get("x-forwarded-for", "").split(",") if p.strip()]
+        hops = max(1, settings.TRUSTED_PROXY_HOPS)
+        if len(forwarded) >= hops:
+            return forwarded[-hops]
+    return request.client.host if request.client else "unknown"
+
+
+def require_job_token(request: Request) -> None:
+    """
+    내부 작업/운영용 엔드포인트 보호. JOB_TOKEN 이 설정된 경우에만 검사한다.
+    (collect 워크플로와 같은 x_job_token 헤더. 프록시가 '_' 헤더를 버리는 경우를 위해 x-job-token 도 허용)
+    """
+    if not settings.JOB_TOKEN:
+        return
+    token = request.headers.get("x_job_token") or request.headers.get("x-job-token")
+    if token != settings.JOB_TOKEN:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="작업 토큰이 유효하지 않습니다.",
+        )
@@ -0,0 +1,17 @@
+# app/dependencies/feed_format.py
+from typing import Literal
+
+from fastapi import Query, Request
+
+from app.services.json_feed_service import response_format
+
+
+def feed_format(
+    request: Request,
+    format: Literal["rss", "json"] | None = Query(
+        None,
+        description="응답 형식 (rss: RSS 2.0, json: JSON Feed 1.1). 없으면 Accept 헤더로 결정 (기본 rss)",
+    ),
+) -> str:
+    """피드 응답 형식: format 쿼리 > Accept(application/feed+json) > rss."""
+    return response_format(format, request.headers.get("accept"))
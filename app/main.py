@@ -1,26 +1,54 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from app.core.cors import setup_cors
+from app.core.compression import setup_compression
 from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.security import shutdown_hash_pool
+from app.dependencies.auth import require_job_token
 from app.api.v1.routers import rss as rss_router
 from app.api.v1.routers import auth as auth_router
+from app.api.v1.routers import export as export_router
+from app.api.v1.routers import usage as usage_router
+from app.api.v1.routers import feed as feed_router
 
 from app.db.postgres import init_pool, close_pool
+from app.db import postgres_async
+from app.services import user_cache, rss_job_service, generation_cache
 
 app = FastAPI(title=settings.APP_NAME, version="1.0.0")
 setup_cors(app)
+setup_compression(app)
 
 @app.on_event("startup")
-def _startup():
+async def _startup():
+    # 스키마 버전 확인/마이그레이션은 동기 풀 초기화에서 한 번만 실행
     init_pool()
+    await postgres_async.init_pool()
+    user_cache.start_listener()
+    rss_job_service.start_workers()
 
 @app.on_event("shutdown")
-def _shutdown():
+async def _shutdown():
+    rss_job_service.shutdown_workers()
+    await user_cache.stop_listener()
+    await postgres_async.close_pool()
     close_pool()
+    shutdown_hash_pool()
 
 # API v1
 app.include_router(rss_router.router, prefix="/api/v1")
+app.include_router(export_router.router, prefix="/api/v1")
+app.include_router(usage_router.router, prefix="/api/v1")
+app.include_router(feed_router.router, prefix="/api/v1")
 app.include_router(auth_router.router)
 
 @app.get("/health")
 def health():
     return {"ok": True, "app": settings.APP_NAME}
+
+
+@app.get("/metrics", dependencies=[Depends(require_job_token)])
+def read_metrics():
+    """프로세스 내 메트릭(카운터/게이지/지연 p50·p95). 워커별 값이다."""
+    metrics.set_gauge("generation_cache_memory_entries", generation_cache.stats()["size"])
+    return metrics.snapshot()
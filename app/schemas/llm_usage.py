@@ -0,0 +1,27 @@
+# app/schemas/llm_usage.py
+from __future__ import annotations
+
+from datetime import date
+from typing import List
+from pydantic import BaseModel
+
+
+class LlmUsageRow(BaseModel):
+    day: date
+    feature: str                 # generation / generation_stream / categorization
+    model: str
+    calls: int                   # 논리 호출 수 (첫 시도)
+    attempts: int                # 실제 요청 수 (재시도, hedge 포함)
+    errors: int                  # 실패한 시도 수 (cancelled 제외)
+    retries: int                 # 재시도 요청 수
+    prompt_tokens: int
+    completion_tokens: int
+    cost_usd: float              # OPENAI_PRICE_*_PER_1M 기준 추정치
+    p50_ms: float
+    p95_ms: float
+
+
+class LlmUsageResponse(BaseModel):
+    days: int
+    timezone: str
+    rows: List[LlmUsageRow]
@@ -0,0 +1,18 @@
+# app/schemas/rss_generation.py
+from __future__ import annotations
+
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class Persona(BaseModel):
+    ages: Optional[int] = 30
+    sex: Optional[str] = "남성"
+    type: Optional[str] = "유쾌한"
+
+
+class MultiPersonaGenerateRequest(BaseModel):
+    keyword: Optional[str] = None       # 없으면 최신뉴스 제목 한 번만 골라 모든 페르소나에 사용
+    category: Optional[str] = None      # 예: "정치|경제"
+    no_cache: bool = False
+    personas: List[Persona] = Field(..., min_length=1, max_length=10)
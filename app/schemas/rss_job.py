@@ -0,0 +1,24 @@
+# app/schemas/rss_job.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, Literal, Optional
+from pydantic import BaseModel
+
+
+class RssJobCreated(BaseModel):
+    job_id: str
+    status: Literal["queued"] = "queued"
+    status_url: str
+
+
+class RssJobStatus(BaseModel):
+    job_id: str
+    status: Literal["queued", "running", "done", "failed"]
+    params: Dict[str, Any]
+    attempts: int
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    rss_xml: Optional[str] = None      # status == "done" 일 때 build_rss_xml 결과
@@ -0,0 +1,92 @@
+# app/services/article_pool_service.py
+"""
+미리 생성한 기사 풀.
+
+- 랭킹뉴스 수집(/rss/naver/ranking/collect) 후 백그라운드에서 refresh_article_pool() 실행:
+  24시간 내 카테고리별 상위 RSS_POOL_PER_CATEGORY 개 뉴스를 기본 페르소나(30대/남성/유쾌한)로 생성해 저장.
+- 키워드 없이 기본 페르소나로 들어온 /rss/generate 는 풀에서 바로 응답한다.
+- 만료 시각 = min(뉴스 수집 시각 + 24시간, 생성 시각 + RSS_POOL_TTL_SECONDS)
+  → get_top_news 가 더 이상 고르지 않을 뉴스의 기사는 풀에서도 빠진다.
+- 정리: 만료됐거나 지금 카테고리별 상위 RSS_POOL_PER_CATEGORY 에서 빠진 뉴스의 기사만 삭제.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+import logging
+import threading
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db import postgres
+from app.services.llm_service import generate_rss_feed_by_gpt
+from app.services.feed_service import publish
+from app.services.rss_generation_service import persona_inputs, persona_key
+
+logger = logging.getLogger(__name__)
+
+POOL_PERSONA = {"ages": 30, "sex": "남성", "type": "유쾌한"}
+
+# get_top_news 의 후보 기간
+NEWS_WINDOW = timedelta(hours=24)
+
+# 수집이 연달아 호출돼도 한 번에 하나만 채운다
+_refresh_lock = threading.Lock()
+
+
+POOL_PERSONA_KEY = persona_key(**POOL_PERSONA)
+
+
+def _fill(candidate: Dict[str, Any]) -> bool:
+    """후보 뉴스로 기사를 생성해 풀에 저장. 생성 결과에 글이 없으면 False."""
+    result = generate_rss_feed_by_gpt(keyword=candidate["title"], **persona_inputs(**POOL_PERSONA))
+    article = (result.get("items") or [None])[0]
+    if not article:
+        return False
+
+    now = datetime.now(timezone.utc)
+    expires_at = min(
+        candidate["collected_at"] + NEWS_WINDOW,
+        now + timedelta(seconds=settings.RSS_POOL_TTL_SECONDS),
+    )
+    postgres.save_pooled_article(
+        candidate["category"], candidate["title"], POOL_PERSONA_KEY, article, expires_at
+    )
+    publish(result, candidate["title"], candidate["category"], POOL_PERSONA_KEY)
+    return True
+
+
+def refresh_article_pool() -> Dict[str, int]:
+    """풀에 없는 상위 뉴스의 기사를 생성하고, 만료/초과 기사를 정리."""
+    result = {"generated": 0, "failed": 0, "pruned": 0}
+    if not settings.RSS_POOL_ENABLED:
+        return result
+    if not _refresh_lock.acquire(blocking=False):
+        logger.info("article pool refresh already running, skipped")
+        return result
+
+    try:
+        candidates = postgres.pool_article_candidates(settings.RSS_POOL_PER_CATEGORY, POOL_PERSONA_KEY)
+        with ThreadPoolExecutor(
+            max_workers=settings.RSS_POOL_CONCURRENCY, thread_name_prefix="article-pool"
+        ) as executor:
+            futures = [(c, executor.submit(_fill, c)) for c in candidates]
+            for candidate, future in futures:
+                try:
+                    if future.result():
+                        result["generated"] += 1
+                    else:
+                        logger.warning("article pool generation returned no item: %s", candidate["title"])
+                        result["failed"] += 1
+                except Exception:
+                    logger.exception("article pool generation failed: %s", candidate["title"])
+                    result["failed"] += 1
+
+        result["pruned"] = postgres.prune_article_pool(settings.RSS_POOL_PER_CATEGORY)
+    finally:
+        _refresh_lock.release()
+
+    metrics.inc("rss_pool_generated_total", result["generated"])
+    logger.info("article pool refreshed: %s", result)
+    return result
@@ -0,0 +1,38 @@
+# app/services/export_service.py
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Dict
+import zlib
+
+import orjson
+
+# 한 번에 내보내는 바이트 묶음 크기 (행마다 yield 하면 전송 오버헤드가 큼)
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+
+async def ndjson_stream(
+    rows: AsyncIterator[Dict[str, Any]],
+    gzip: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    행 dict 를 NDJSON(한 줄에 JSON 하나)으로 직렬화해 EXPORT_CHUNK_BYTES 단위로 yield.
+    gzip=True 면 스트리밍 gzip(zlib wbits=31)으로 압축해서 내보낸다.
+    버퍼는 청크 하나 크기로 고정이라 전체 행 수와 무관하게 메모리 사용량이 일정하다.
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if gzip else None
+    buf = bytearray()
+
+    async for row in rows:
+        # datetime/dict(raw_json) 는 orjson 이 그대로 직렬화
+        buf += orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE)
+        if len(buf) >= EXPORT_CHUNK_BYTES:
+            chunk = compressor.compress(bytes(buf)) if compressor else bytes(buf)
+            buf.clear()
+            if chunk:
+                yield chunk
+
+    tail = bytes(buf)
+    if compressor:
+        tail = compressor.compress(tail) + compressor.flush()
+    if tail:
+        yield tail
@@ -0,0 +1,187 @@
+# app/services/feed_service.py
+"""
+생성된 글 게시(feed_articles)와 피드 조건부 응답.
+
+- guid: 글 내용(title/summary/content/tags)의 해시 → 같은 글이 다시 생성/캐시 적중돼도 guid 와
+  처음 게시 시각(published_at)이 그대로라 RSS 리더가 새 글로 보지 않는다.
+- 생성 경로(/rss/generate, /rss/generate/personas, /rss/generate/stream, /rss/jobs, 기사 풀)는
+  생성 직후 publish / publish_async 로 저장하고, 반환된 guid/published_at 을 RSS 에 그대로 쓴다.
+- GET /api/v1/feed 는 ETag / Last-Modified 를 내려주고 If-None-Match / If-Modified-Since 에 304 로 응답한다.
+  since / before 커서((published_at, id) 키셋)로 새 글만 / 이전 페이지를 받을 수 있다.
+  렌더링한 본문은 gzip/br 로 한 번만 압축해서 ETag 별로 캐시해 두고 Accept-Encoding 에 맞춰 내보낸다.
+저장 실패는 생성 응답을 막지 않는다. (guid 만 붙여서 반환)
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import base64
+import hashlib
+import logging
+
+import orjson
+
+from app.core.cache import TTLCache
+from app.core.compression import encode_variants, strip_encoding_suffix
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db import postgres, postgres_async
+
+logger = logging.getLogger(__name__)
+
+# ETag → {"identity": 본문, "gzip": ..., "br": ...}
+_rendered = TTLCache(max_size=settings.FEED_RENDER_CACHE_SIZE, ttl=settings.FEED_RENDER_CACHE_TTL_SECONDS)
+
+
+def article_guid(article: Dict[str, Any]) -> str:
+    """
+    생성된 그대로의 값으로 해시한다. tags 도 split_tags 결과가 아닌 원본(문자열 또는 리스트)을 쓰므로
+    표시용 태그 파싱 규칙이 바뀌어도 guid 는 바뀌지 않는다.
+    """
+    canonical = orjson.dumps(
+        {
+            "title": str(article.get("title") or ""),
+            "summary": str(article.get("summary") or ""),
+            "content": str(article.get("content") or ""),
+            "tags": article.get("tags") or "",
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return "urn:postflow:article:" + hashlib.sha256(canonical).hexdigest()[:32]
+
+
+def _articles(items: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """generate_rss_feed_by_gpt 결과({"items": [...]})에서 글 dict 만."""
+    return [a for a in items.get("items") or [] if isinstance(a, dict)]
+
+
+def _rows(articles: List[Dict[str, Any]], news_title: str, category: Optional[str], persona: str):
+    return [(article_guid(a), news_title, category, persona, a) for a in articles]
+
+
+def _attach(rows, published: Dict[str, datetime]) -> Dict[str, Any]:
+    return {
+        "items": [
+            {**article, "guid": guid, "published_at": published.get(guid)}
+            for guid, _, _, _, article in rows
+        ]
+    }
+
+
+def publish(items: Dict[str, Any], news_title: str, category: Optional[str], persona: str) -> Dict[str, Any]:
+    """생성 결과를 feed_articles 에 저장하고 guid/published_at 을 붙인 결과를 반환 (동기)."""
+    rows = _rows(_articles(items), news_title, category, persona)
+    try:
+        published = postgres.save_feed_articles(rows)
+    except Exception as e:
+        logger.warning("feed publish failed: %s", e)
+        published = {}
+    return _attach(rows, published)
+
+
+async def publish_async(
+    items: Dict[str, Any], news_title: str, category: Optional[str], persona: str
+) -> Dict[str, Any]:
+    """publish 의 비동기 버전 (async 라우트용)."""
+    rows = _rows(_articles(items), news_title, category, persona)
+    try:
+        published = await postgres_async.save_feed_articles(rows)
+    except Exception as e:
+        logger.warning("feed publish failed: %s", e)
+        published = {}
+    return _attach(rows, published)
+
+
+# ---------------------------
+# 커서 (published_at, id)
+# ---------------------------
+
+def encode_cursor(row: Dict[str, Any]) -> str:
+    raw = f"{row['published_at'].isoformat()}|{row['id']}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """encode_cursor 의 역. 형식이 잘못되면 ValueError."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        published_at, _, id_ = raw.partition("|")
+        return datetime.fromisoformat(published_at), int(id_)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"invalid cursor: {cursor!r}") from e
+
+
+def cursor_headers(rows: List[Dict[str, Any]], since: Optional[str]) -> Dict[str, str]:
+    """
+    X-Feed-Since: 다음 폴링에 since 로 넘길 값 (가장 새 글, 새 글이 없으면 받은 since 그대로)
+    X-Feed-Before: 이전 페이지를 받을 때 before 로 넘길 값 (가장 오래된 글)
+    rows 는 최신순.
+    """
+    headers: Dict[str, str] = {}
+    if rows:
+        headers["X-Feed-Since"] = encode_cursor(rows[0])
+        headers["X-Feed-Before"] = encode_cursor(rows[-1])
+    elif since:
+        headers["X-Feed-Since"] = since
+    return headers
+
+
+# ---------------------------
+# 조건부 GET (ETag / Last-Modified)
+# ---------------------------
+
+def feed_validators(rows: List[Dict[str, Any]], variant: str) -> Tuple[str, Optional[datetime]]:
+    """
+    (ETag, Last-Modified). ETag 는 목록에 든 글(guid, 게시 시각)과 variant(쿼리 조건)로 만든다.
+    """
+    h = hashlib.sha256(variant.encode("utf-8"))
+    for r in rows:
+        h.update(r["guid"].encode("utf-8"))
+        h.update(r["published_at"].isoformat().encode("ascii"))
+    last_modified = max((r["published_at"] for r in rows), default=None)
+    return f'"{h.hexdigest()[:32]}"', last_modified
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+
+def is_not_modified(
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str],
+    etag: str,
+    last_modified: Optional[datetime],
+) -> bool:
+    """If-None-Match 가 있으면 그것만 보고, 없을 때만 If-Modified-Since 를 본다. (RFC 9110)"""
+    if if_none_match:
+        candidates = [strip_encoding_suffix(t.strip().removeprefix("W/")) for t in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates
+
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP 날짜는 초 단위
+        return last_modified.replace(microsecond=0) <= since
+
+    return False
+
+
+def rendered_feed(etag: str, render: Callable[[], bytes]) -> Dict[str, bytes]:
+    """
+    ETag 에 해당하는 본문과 압축본. 없으면 render() 후 압축까지 해서 캐시한다.
+    ETag 가 같으면 본문도 같으므로 만료 전까지 다시 렌더링/압축하지 않는다. (CPU 작업이라 스레드풀에서 호출)
+    """
+    variants = _rendered.get(etag)
+    metrics.inc("feed_render_cache_requests_total", result="hit" if variants else "miss")
+    if variants is None:
+        variants = encode_variants(render())
+        _rendered.set(etag, variants)
+    return variants
@@ -0,0 +1,110 @@
+# app/services/generation_cache.py
+"""
+generate_rss_feed_by_gpt 결과 캐시.
+
+- 키: sha256(모델, 시스템 프롬프트, 사용자 프롬프트) → 입력이 같으면 같은 키 (content-addressed)
+- 1차: 프로세스 내 LRU(TTLCache), 2차: Postgres llm_generation_cache (워커/재시작 간 공유)
+- TTL(GENERATION_CACHE_TTL_SECONDS) + 크기(GENERATION_CACHE_MEMORY_SIZE / GENERATION_CACHE_MAX_ROWS) 기반 제거
+- 메모리 적중도 TOUCH_INTERVAL_SECONDS 마다 모아서 DB last_hit_at 에 반영한다. (DB 정리가 LRU 기준이므로)
+- 캐시 저장소 장애는 생성 자체를 막지 않도록 경고만 남긴다.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+import hashlib
+import logging
+import threading
+import time
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db import postgres
+
+logger = logging.getLogger(__name__)
+
+# 메모리 적중을 DB last_hit_at 에 반영하는 최소 간격
+TOUCH_INTERVAL_SECONDS = 60
+
+_memory = TTLCache(
+    max_size=settings.GENERATION_CACHE_MEMORY_SIZE,
+    ttl=settings.GENERATION_CACHE_TTL_SECONDS,
+)
+
+_touch_lock = threading.Lock()
+_pending_hits: Dict[str, int] = {}
+_last_touch = 0.0
+
+
+def cache_key(model: str, system_prompt: str, user_prompt: str) -> str:
+    h = hashlib.sha256()
+    for part in (model, system_prompt, user_prompt):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _record_memory_hit(key: str) -> None:
+    """메모리 적중을 모아 두었다가 TOUCH_INTERVAL_SECONDS 마다 한 번에 DB 에 반영."""
+    global _pending_hits, _last_touch
+    now = time.monotonic()
+    with _touch_lock:
+        _pending_hits[key] = _pending_hits.get(key, 0) + 1
+        if now - _last_touch < TOUCH_INTERVAL_SECONDS:
+            return
+        hits, _pending_hits = _pending_hits, {}
+        _last_touch = now
+
+    try:
+        postgres.touch_cached_generations(hits)
+    except Exception as e:
+        logger.warning("generation cache touch failed: %s", e)
+
+
+def get(key: str) -> Optional[Dict[str, Any]]:
+    """메모리 → Postgres 순서로 조회. 없으면 None."""
+    article = _memory.get(key)
+    if article is not None:
+        metrics.inc("generation_cache_requests_total", result="hit_memory")
+        _record_memory_hit(key)
+        return article
+
+    try:
+        row = postgres.get_cached_generation(key)
+    except Exception as e:
+        logger.warning("generation cache lookup failed: %s", e)
+        row = None
+
+    if row is None:
+        metrics.inc("generation_cache_requests_total", result="miss")
+        return None
+
+    # 메모리 항목이 DB 항목보다 오래 살지 않도록 남은 시간만큼만 보관
+    remaining = (row["expires_at"] - datetime.now(timezone.utc)).total_seconds()
+    _memory.set(key, row["article"], ttl=min(remaining, settings.GENERATION_CACHE_TTL_SECONDS))
+    metrics.inc("generation_cache_requests_total", result="hit_db")
+    return row["article"]
+
+
+def put(key: str, model: str, article: Dict[str, Any]) -> None:
+    _memory.set(key, article)
+    try:
+        postgres.put_cached_generation(
+            key,
+            model,
+            article,
+            ttl=timedelta(seconds=settings.GENERATION_CACHE_TTL_SECONDS),
+            max_rows=settings.GENERATION_CACHE_MAX_ROWS,
+        )
+    except Exception as e:
+        logger.warning("generation cache store failed: %s", e)
+
+
+def record_bypass() -> None:
+    metrics.inc("generation_cache_requests_total", result="bypass")
+
+
+def stats():
+    """프로세스 내 LRU 상태 (크기/히트/미스)."""
+    return _memory.stats()
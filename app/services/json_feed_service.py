@@ -0,0 +1,94 @@
+# app/services/json_feed_service.py
+"""
+JSON Feed 1.1 (https://jsonfeed.org/version/1.1) 출력.
+
+build_rss_xml 과 같은 입력을 받고, 글 정규화(title/summary/content/tags, guid, 게시 시각)는
+rss_service.normalize_article 을 그대로 써서 두 형식의 내용이 어긋나지 않게 한다.
+직렬화는 orjson (datetime 은 RFC 3339 로 바로 나간다).
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+from app.services.rss_service import (
+    FEED_DESCRIPTION,
+    FEED_LINK,
+    FEED_TITLE,
+    flatten_articles,
+    normalize_article,
+)
+
+JSON_FEED_VERSION = "https://jsonfeed.org/version/1.1"
+JSON_FEED_MEDIA_TYPE = "application/feed+json"
+RSS_MEDIA_TYPE = "application/rss+xml"
+
+
+def _item(art: Dict[str, Any], idx: int, now: datetime) -> Dict[str, Any]:
+    a = normalize_article(art, idx, now)
+    item: Dict[str, Any] = {
+        "id": a["id"],
+        "title": a["title"],
+        "content_text": a["content"],
+        "date_published": a["published_at"],
+    }
+    if a["summary"]:
+        item["summary"] = a["summary"]
+    if a["tags"]:
+        item["tags"] = a["tags"]
+    return item
+
+
+def build_json_feed(
+    raw_items: List[Dict[str, Any]],
+    feed_title: str = FEED_TITLE,
+    feed_link: str = FEED_LINK,
+    feed_description: str = FEED_DESCRIPTION,
+    feed_url: Optional[str] = None,
+    next_url: Optional[str] = None,
+) -> bytes:
+    """raw_items 형식은 build_rss_xml 과 동일. next_url 은 다음(이전 글) 페이지 주소."""
+    now = datetime.now(timezone.utc)
+    feed: Dict[str, Any] = {
+        "version": JSON_FEED_VERSION,
+        "title": feed_title,
+        "home_page_url": feed_link,
+        "description": feed_description,
+    }
+    if feed_url:
+        feed["feed_url"] = feed_url
+    if next_url:
+        feed["next_url"] = next_url
+    feed["items"] = [_item(art, idx, now) for idx, art in enumerate(flatten_articles(raw_items), start=1)]
+    return orjson.dumps(feed)
+
+
+def response_format(format: Optional[str], accept: Optional[str]) -> str:
+    """
+    "json" 또는 "rss". format 쿼리 파라미터가 우선이고, 없으면 Accept 에서
+    application/feed+json / application/json 이 RSS/XML 보다 높은 q 로 요청됐을 때만 json.
+    """
+    if format:
+        return format
+    if not accept:
+        return "rss"
+
+    json_q = rss_q = 0.0
+    for part in accept.split(","):
+        media, _, params = part.partition(";")
+        media = media.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media in (JSON_FEED_MEDIA_TYPE, "application/json"):
+            json_q = max(json_q, q)
+        elif media in (RSS_MEDIA_TYPE, "application/xml", "text/xml", "*/*", "application/*"):
+            rss_q = max(rss_q, q)
+    return "json" if json_q > rss_q else "rss"
@@ -0,0 +1,140 @@
+# app/services/json_stream.py
+"""
+스트리밍 LLM 응답(JSON 객체)을 조각 단위로 읽으면서 최상위 필드의 문자열 값을 바로 꺼내는 파서.
+
+    {"title": "...", "summary": "...", "content": "...", "tags": "..." 또는 ["...", ...]}
+
+- 최상위 키의 문자열 값 → (field, None, 텍스트 조각)
+- 최상위 키의 배열 안 문자열 → (field, 배열 내 순번, 텍스트 조각)
+- 그보다 깊은 값, 숫자/불리언 등은 무시한다. (완성된 전체 값은 최종 orjson.loads 로 얻는다)
+- 이스케이프(\\n, \\uXXXX, 서로게이트 쌍)가 조각 경계에서 끊겨도 올바르게 이어 붙인다.
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+Delta = Tuple[str, Optional[int], str]
+
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class JsonFieldStream:
+    def __init__(self) -> None:
+        self._stack: List[str] = []       # 열린 '{' / '['
+        self._in_string = False
+        self._escape = False
+        self._unicode: Optional[str] = None   # \u 뒤에 모으는 16진수
+        self._high_surrogate: Optional[int] = None
+        self._expect_key = False           # 최상위 객체에서 다음 문자열이 키인지
+        self._reading_key = False
+        self._key_chars: List[str] = []
+        self._field: Optional[str] = None  # 현재 값이 속한 최상위 키
+        self._emit: Optional[Tuple[str, Optional[int]]] = None
+        self._index = -1                   # 최상위 배열 안 문자열 순번
+
+    def feed(self, chunk: str) -> List[Delta]:
+        """chunk 를 읽고 새로 확정된 텍스트 조각을 (field, index, text) 목록으로 반환."""
+        out: List[Delta] = []
+        buf: List[str] = []
+
+        def flush() -> None:
+            if buf and self._emit is not None:
+                field, index = self._emit
+                if out and out[-1][0] == field and out[-1][1] == index:
+                    out[-1] = (field, index, out[-1][2] + "".join(buf))
+                else:
+                    out.append((field, index, "".join(buf)))
+            buf.clear()
+
+        for ch in chunk:
+            if self._in_string:
+                text = self._string_char(ch)
+                if text is None:
+                    continue
+                if text == "":   # 문자열 끝
+                    flush()
+                    self._end_string()
+                    continue
+                if self._reading_key:
+                    self._key_chars.append(text)
+                elif self._emit is not None:
+                    buf.append(text)
+                continue
+
+            if ch == '"':
+                self._start_string()
+            elif ch in "{[":
+                self._stack.append(ch)
+                if len(self._stack) == 1 and ch == "{":
+                    self._expect_key = True
+                elif len(self._stack) == 2 and ch == "[":
+                    self._index = -1
+            elif ch in "}]":
+                if self._stack:
+                    self._stack.pop()
+                if len(self._stack) == 1:
+                    self._field = None
+            elif ch == "," and len(self._stack) == 1:
+                self._expect_key = True
+                self._field = None
+
+        flush()
+        return out
+
+    # ---------------------------
+    # 내부 상태 전이
+    # ---------------------------
+
+    def _start_string(self) -> None:
+        self._in_string = True
+        depth = len(self._stack)
+        self._emit = None
+        self._reading_key = False
+
+        if depth == 1 and self._stack[0] == "{":
+            if self._expect_key:
+                self._reading_key = True
+                self._key_chars = []
+            elif self._field is not None:
+                self._emit = (self._field, None)
+        elif depth == 2 and self._stack == ["{", "["] and self._field is not None:
+            self._index += 1
+            self._emit = (self._field, self._index)
+
+    def _end_string(self) -> None:
+        self._in_string = False
+        if self._reading_key:
+            self._field = "".join(self._key_chars)
+            self._expect_key = False
+            self._reading_key = False
+        self._emit = None
+
+    def _string_char(self, ch: str) -> Optional[str]:
+        """문자열 안의 한 글자 처리. 출력할 텍스트, 대기 중이면 None, 문자열 끝이면 ""."""
+        if self._unicode is not None:
+            self._unicode += ch
+            if len(self._unicode) < 4:
+                return None
+            code = int(self._unicode, 16)
+            self._unicode = None
+            if 0xD800 <= code <= 0xDBFF:
+                self._high_surrogate = code
+                return None
+            if 0xDC00 <= code <= 0xDFFF and self._high_surrogate is not None:
+                code = 0x10000 + ((self._high_surrogate - 0xD800) << 10) + (code - 0xDC00)
+            self._high_surrogate = None
+            return chr(code)
+
+        if self._escape:
+            self._escape = False
+            if ch == "u":
+                self._unicode = ""
+                return None
+            return _ESCAPES.get(ch, ch)
+
+        if ch == "\\":
+            self._escape = True
+            return None
+        if ch == '"':
+            return ""
+        return ch
@@ -1,14 +1,31 @@
 # app/services/llm_service.py
 from __future__ import annotations
 
-from typing import List, Dict, Any, Union
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict, Any, Tuple, Union
+import logging
 import orjson
 import re  # extract_json_block에서 사용
+import threading
 
-from app.core.config import settings
+from openai import APIStatusError
 
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.singleflight import SingleFlight
+from app.services import generation_cache
+from app.services.json_stream import JsonFieldStream
+from app.services.openai_client import (
+    RETRYABLE_ERRORS,
+    CircuitOpenError,
+    DeadlineExceeded,
+    chat_completion,
+)
+
+logger = logging.getLogger(__name__)
+
+# 동시에 들어온 같은 프롬프트의 생성 요청을 하나로 합침 (키: generation_cache.cache_key)
+_generation_flights = SingleFlight()
 
 SYSTEM_PROMPT = """
 너의 역할은 ‘콘텐츠 생성기’이다.
@@ -102,7 +119,41 @@ def _build_user_prompt_from_records(title, ages, contry_type, sex, type) -> str:
     return "\n".join(lines)
 
 
-def generate_rss_feed_by_gpt(keyword, ages, contry_type, sex, type):
+def _generate_article(key: str, user_prompt: str) -> dict:
+    resp = chat_completion(
+        "generation",
+        deadline=settings.OPENAI_GENERATION_DEADLINE_SECONDS,
+        hedge_after=settings.OPENAI_GENERATION_HEDGE_SECONDS or None,
+        max_completion_tokens=4096,
+        response_format={"type": "json_object"},
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ],
+    )
+    data = _parse_article_text(resp.choices[0].message.content)
+    generation_cache.put(key, settings.OPENAI_MODEL, data)
+    return data
+
+
+def _parse_article_text(text: str) -> dict:
+    text = text.strip()
+
+    # 혹시라도 fence가 섞이면 제거
+    if text.startswith("```"):
+        text = text.strip("` \n")
+        if text.lower().startswith("json"):
+            text = text[4:].strip()
+
+    return orjson.loads(text)
+
+
+def generate_rss_feed_by_gpt(keyword, ages, contry_type, sex, type, use_cache: bool = True):
+    """
+    use_cache=False 면 캐시 조회를 건너뛰고 새로 생성한다. (결과는 캐시에 덮어씀)
+    같은 입력으로 동시에 들어온 생성 요청은 하나의 OpenAI 호출을 공유한다.
+    기다리다 GENERATION_COALESCE_TIMEOUT_SECONDS 가 지나면 SingleFlightTimeout.
+    """
     if not keyword:
         return {"items": []}
 
@@ -110,28 +161,80 @@ def generate_rss_feed_by_gpt(keyword, ages, contry_type, sex, type):
         keyword, ages, contry_type, sex, type
     )
 
-    try:
-        resp = client.chat.completions.create(
-            model=settings.OPENAI_MODEL,
-            max_completion_tokens=4096,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt},
-            ],
-        )
-        text = resp.choices[0].message.content.strip()
-
-        # 혹시라도 fence가 섞이면 제거
-        if text.startswith("```"):
-            text = text.strip("` \n")
-            if text.lower().startswith("json"):
-                text = text[4:].strip()
-
-        data = orjson.loads(text)
-        return {"items": [data]}
-    except Exception:
-        raise
+    key = generation_cache.cache_key(settings.OPENAI_MODEL, SYSTEM_PROMPT, user_prompt)
+    if use_cache:
+        cached = generation_cache.get(key)
+        if cached is not None:
+            return {"items": [cached]}
+    else:
+        generation_cache.record_bypass()
+
+    data, shared = _generation_flights.do(
+        key,
+        lambda: _generate_article(key, user_prompt),
+        timeout=settings.GENERATION_COALESCE_TIMEOUT_SECONDS,
+    )
+    if shared:
+        metrics.inc("generation_coalesced_total")
+    return {"items": [data]}
+
+
+def stream_rss_feed_by_gpt(
+    keyword, ages, contry_type, sex, type, use_cache: bool = True
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    generate_rss_feed_by_gpt 의 스트리밍 버전 (OpenAI stream=True).
+    - ("delta", {"field", "index", "text"}): title/summary/content/tags 문자열이 도착하는 대로
+    - ("item", 완성된 글 dict): 마지막 한 번. 생성 캐시에도 저장된다.
+    캐시 적중이면 delta 없이 item 만 나온다. 클라이언트마다 진행 상황을 보여줘야 하므로 single-flight 는 쓰지 않는다.
+    """
+    if not keyword:
+        return
+
+    user_prompt = _build_user_prompt_from_records(
+        keyword, ages, contry_type, sex, type
+    )
+
+    key = generation_cache.cache_key(settings.OPENAI_MODEL, SYSTEM_PROMPT, user_prompt)
+    if use_cache:
+        cached = generation_cache.get(key)
+        if cached is not None:
+            yield "item", cached
+            return
+    else:
+        generation_cache.record_bypass()
+
+    parser = JsonFieldStream()
+    parts: List[str] = []
+    # 기록은 openai_client 가 한다: 연결 실패한 시도는 시도마다, 연결된 스트림은 닫힐 때 한 번 (usage 포함)
+    stream = chat_completion(
+        "generation_stream",
+        deadline=settings.OPENAI_GENERATION_DEADLINE_SECONDS,
+        max_completion_tokens=4096,
+        response_format={"type": "json_object"},
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ],
+        stream=True,
+        stream_options={"include_usage": True},  # 마지막 청크에 usage 포함
+    )
+
+    # 클라이언트가 끊어서 generator 가 닫히면 OpenAI 스트림도 닫힌다 (cancelled 로 기록)
+    with stream:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            text = chunk.choices[0].delta.content
+            if not text:
+                continue
+            parts.append(text)
+            for field, index, delta in parser.feed(text):
+                yield "delta", {"field": field, "index": index, "text": delta}
+
+    data = _parse_article_text("".join(parts))
+    generation_cache.put(key, settings.OPENAI_MODEL, data)
+    yield "item", data
 
 
 NEWS_CATEGORY_SYSTEM_PROMPT = """
@@ -184,78 +287,150 @@ NEWS_CATEGORY_SYSTEM_PROMPT = """
 - 따옴표, 콤마, 대괄호, 중괄호 등 JSON 문법을 엄격하게 지켜라.
 """
 
-# 한 번에 보내는 최대 제목 개수
+# 배치 크기: 제목 개수 상한(적응형, NEWS_CATEGORY_MIN_BATCH ~ NEWS_CATEGORY_MAX_BATCH)과
+# 배치당 글자 수 상한(NEWS_CATEGORY_BATCH_CHARS) 중 먼저 닿는 쪽에서 자른다.
 NEWS_CATEGORY_BATCH_SIZE = 5
 
 
-def _categorize_news_titles_batch(titles: List[str]) -> List[str]:
+class _AdaptiveBatchSize:
     """
-    뉴스 제목 리스트(부분 리스트)를 GPT로 한 번 보내 카테고리 리스트를 받는다.
-    길이 안 맞거나 에러면 해당 batch 길이만큼 "기타" 리턴.
+    최근 배치 결과로 제목 개수 상한을 조절 (AIMD).
+    성공하면 1 씩 늘리고, 형식 오류/길이 불일치가 나면 절반으로 줄인다.
     """
-    if not titles:
-        return []
 
+    def __init__(self, initial: int) -> None:
+        self._lock = threading.Lock()
+        self.value = initial
+
+    def success(self) -> None:
+        with self._lock:
+            self.value = min(settings.NEWS_CATEGORY_MAX_BATCH, self.value + 1)
+
+    def failure(self) -> None:
+        with self._lock:
+            self.value = max(settings.NEWS_CATEGORY_MIN_BATCH, self.value // 2)
+
+
+_category_batch_size = _AdaptiveBatchSize(NEWS_CATEGORY_BATCH_SIZE)
+
+
+def _make_category_batches(titles: List[str]) -> List[Tuple[int, List[str]]]:
+    """(시작 인덱스, 제목들) 배치 목록. 긴 제목이 많으면 배치가 작아진다."""
+    limit = _category_batch_size.value
+    budget = settings.NEWS_CATEGORY_BATCH_CHARS
+
+    batches: List[Tuple[int, List[str]]] = []
+    start, chars = 0, 0
+    for i, title in enumerate(titles):
+        size = len(title)
+        if i > start and (i - start >= limit or chars + size > budget):
+            batches.append((start, titles[start:i]))
+            start, chars = i, 0
+        chars += size
+    batches.append((start, titles[start:]))
+    return batches
+
+
+def _request_categories(titles: List[str]) -> List[str]:
+    """한 번의 분류 호출. 응답 형식/길이가 맞지 않으면 ValueError (orjson.JSONDecodeError 포함)."""
     user_content = orjson.dumps({"titles": titles}).decode("utf-8")
 
-    try:
-        resp = client.chat.completions.create(
-            model=settings.OPENAI_MODEL,
-            messages=[
-                {"role": "system", "content": NEWS_CATEGORY_SYSTEM_PROMPT},
-                {"role": "user", "content": user_content},
-            ],
-        )
-        text = resp.choices[0].message.content.strip()
+    resp = chat_completion(
+        "categorization",
+        deadline=settings.OPENAI_CATEGORY_DEADLINE_SECONDS,
+        messages=[
+            {"role": "system", "content": NEWS_CATEGORY_SYSTEM_PROMPT},
+            {"role": "user", "content": user_content},
+        ],
+    )
+    text = (resp.choices[0].message.content or "").strip()
 
-        # 혹시 ```json ``` 감싸져 있으면 제거
-        if text.startswith("```"):
-            text = text.strip("` \n")
-            if text.lower().startswith("json"):
-                text = text[4:].strip()
+    # 혹시 ```json ``` 감싸져 있으면 제거
+    if text.startswith("```"):
+        text = text.strip("` \n")
+        if text.lower().startswith("json"):
+            text = text[4:].strip()
 
-        clean = extract_json_block(text)
+    clean = extract_json_block(text)
 
-        data = orjson.loads(clean)
-        cats = data.get("categories") or []
+    data = orjson.loads(clean)
+    if not isinstance(data, dict):
+        raise ValueError(f"expected a JSON object, got {clean[:200]!r}")
+    cats = data.get("categories") or []
 
-        # 길이 안 맞으면 fallback
-        if not isinstance(cats, list) or len(cats) != len(titles):
-            return ["기타"] * len(titles)
+    if not isinstance(cats, list) or len(cats) != len(titles):
+        raise ValueError(f"expected {len(titles)} categories, got {cats!r}")
 
-        # 전부 str 캐스팅 + None 방지
-        return [str(c or "기타") for c in cats]
+    # 전부 str 캐스팅 + None 방지
+    return [str(c or "기타") for c in cats]
 
+
+def _categorize_news_titles_batch(titles: List[str]) -> List[str]:
+    """
+    뉴스 제목 리스트(부분 리스트)를 GPT로 보내 카테고리 리스트를 받는다.
+    - 429/5xx/타임아웃 재시도는 openai_client 가 deadline 안에서 처리.
+      그래도 실패하거나 서킷이 열려 있으면 배치 전체 "기타"
+    - 400/401/404 등 재시도해도 소용없는 API 오류도 배치 전체 "기타" (나눠서 다시 보내지 않음)
+    - 응답 형식 오류/길이 불일치(ValueError)만 배치를 반으로 나눠 다시 시도 (한 건짜리도 실패하면 "기타")
+    항상 titles 와 같은 길이를 반환한다.
+    """
+    if not titles:
+        return []
+
+    try:
+        cats = _request_categories(titles)
+    except (*RETRYABLE_ERRORS, DeadlineExceeded, CircuitOpenError) as e:
+        logger.warning("categorization batch of %d unavailable: %s", len(titles), e)
+        metrics.inc("news_category_batches_total", outcome="unavailable")
+        return ["기타"] * len(titles)
+    except APIStatusError as e:
+        logger.warning("categorization batch of %d rejected: %s", len(titles), e)
+        metrics.inc("news_category_batches_total", outcome="rejected")
+        return ["기타"] * len(titles)
+    except ValueError as e:
+        logger.warning("categorization batch of %d invalid: %s", len(titles), e)
+        _category_batch_size.failure()
+        metrics.inc("news_category_batches_total", outcome="invalid")
+        if len(titles) == 1:
+            return ["기타"]
+        mid = len(titles) // 2
+        return _categorize_news_titles_batch(titles[:mid]) + _categorize_news_titles_batch(titles[mid:])
     except Exception as e:
-        print("Error in _categorize_news_titles_batch:", e)
-        # 문제 생기면 이 batch 전체를 기타로
+        logger.warning("categorization batch of %d failed: %s", len(titles), e)
+        metrics.inc("news_category_batches_total", outcome="failed")
         return ["기타"] * len(titles)
 
+    _category_batch_size.success()
+    metrics.inc("news_category_batches_total", outcome="ok")
+    return cats
+
 
 def categorize_news_titles_by_gpt(titles: List[str]) -> List[str]:
     """
-    전체 뉴스 제목 리스트를 BATCH_SIZE(예: 30개) 단위로 잘라서
-    GPT에 여러 번 보내고, 결과를 순서대로 합친다.
-    titles와 반환 리스트의 순서는 동일하게 유지해야 한다.
+    전체 뉴스 제목 리스트를 배치로 잘라 최대 NEWS_CATEGORY_CONCURRENCY 개씩 동시에 GPT에 보내고,
+    결과를 원래 순서대로 합친다.
+    titles와 반환 리스트의 순서/길이는 동일하게 유지해야 한다.
     """
     if not titles:
         return []
 
-    all_cats: List[str] = []
-
-    for i in range(0, len(titles), NEWS_CATEGORY_BATCH_SIZE):
-        batch = titles[i : i + NEWS_CATEGORY_BATCH_SIZE]
-        batch_cats = _categorize_news_titles_batch(batch)
+    batches = _make_category_batches(titles)
+    all_cats: List[str] = ["기타"] * len(titles)
 
-        # 혹시라도 길이 또 틀어지면 강제로 맞춰줌
-        if len(batch_cats) != len(batch):
-            batch_cats = ["기타"] * len(batch)
+    workers = max(1, min(settings.NEWS_CATEGORY_CONCURRENCY, len(batches)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="categorize") as executor:
+        futures = {
+            executor.submit(_categorize_news_titles_batch, batch): (start, batch)
+            for start, batch in batches
+        }
+        for future, (start, batch) in futures.items():
+            batch_cats = future.result()
 
-        all_cats.extend(batch_cats)
+            # 혹시라도 길이 또 틀어지면 강제로 맞춰줌
+            if len(batch_cats) != len(batch):
+                batch_cats = ["기타"] * len(batch)
 
-    # 최종 길이 검증
-    if len(all_cats) != len(titles):
-        return ["기타"] * len(titles)
+            all_cats[start : start + len(batch)] = batch_cats
 
     return all_cats
 
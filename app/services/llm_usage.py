@@ -0,0 +1,99 @@
+# app/services/llm_usage.py
+"""
+LLM 호출 계측.
+
+openai_client 가 chat.completions 요청(시도) 하나가 끝날 때마다 record() 로
+기능(generation / generation_stream / categorization), 모델, 지연, 토큰 수, 재시도 순번, hedge 여부, 결과를 남긴다.
+- /metrics: llm_call_seconds (p50/p95), llm_calls_total, llm_tokens_total
+- Postgres llm_calls: 행 하나 = 시도 하나. 일별 사용량/비용 집계 (GET /api/v1/usage/llm) 에서
+  논리 호출 수(첫 시도)와 재시도/hedge 요청 수를 나눠 센다.
+기록 실패는 호출 결과에 영향을 주지 않는다.
+"""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any, Optional
+import logging
+import threading
+import time
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db import postgres
+
+logger = logging.getLogger(__name__)
+
+# 오래된 기록 정리는 이 간격마다 한 번만
+PRUNE_INTERVAL_SECONDS = 3600
+
+_prune_lock = threading.Lock()
+_last_prune = 0.0
+
+
+def _should_prune() -> bool:
+    global _last_prune
+    now = time.monotonic()
+    with _prune_lock:
+        if now - _last_prune < PRUNE_INTERVAL_SECONDS:
+            return False
+        _last_prune = now
+        return True
+
+
+def record(
+    feature: str,
+    model: str,
+    seconds: float,
+    usage: Any = None,
+    error: Optional[BaseException] = None,
+    retries: int = 0,
+    hedge: bool = False,
+) -> None:
+    """
+    시도(요청) 하나를 기록. usage 는 OpenAI 응답의 usage 객체 (prompt_tokens / completion_tokens).
+    retries 는 이 시도의 재시도 순번, hedge 는 hedged 두 번째 요청 여부.
+    클라이언트가 끊어서 닫힌 스트림(GeneratorExit)은 오류가 아니라 "cancelled" 로 남긴다.
+    """
+    if error is None:
+        outcome = "ok"
+    elif isinstance(error, GeneratorExit):
+        outcome = "cancelled"
+    else:
+        outcome = type(error).__name__
+    prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+    completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+
+    metrics.observe("llm_call_seconds", seconds, feature=feature)
+    metrics.inc("llm_calls_total", feature=feature, outcome=outcome)
+    if prompt_tokens:
+        metrics.inc("llm_tokens_total", prompt_tokens, feature=feature, kind="prompt")
+    if completion_tokens:
+        metrics.inc("llm_tokens_total", completion_tokens, feature=feature, kind="completion")
+
+    try:
+        postgres.record_llm_call(
+            (
+                feature,
+                model,
+                outcome,
+                int(seconds * 1000),
+                prompt_tokens,
+                completion_tokens,
+                retries,
+                hedge,
+                str(error)[:500] if error is not None and outcome != "cancelled" else None,
+            ),
+            retention=timedelta(days=settings.LLM_CALLS_RETENTION_DAYS),
+            prune=_should_prune(),
+        )
+    except Exception as e:
+        logger.warning("llm call record failed: %s", e)
+
+
+def estimate_cost(prompt_tokens: int, completion_tokens: int) -> float:
+    """설정된 단가로 USD 비용 추정."""
+    return round(
+        prompt_tokens / 1_000_000 * settings.OPENAI_PRICE_INPUT_PER_1M
+        + completion_tokens / 1_000_000 * settings.OPENAI_PRICE_OUTPUT_PER_1M,
+        6,
+    )
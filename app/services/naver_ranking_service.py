@@ -9,7 +9,7 @@ from bs4 import BeautifulSoup
 
 from app.schemas.naver_ranking import NaverRankingNewsItem
 from app.db.postgres import save_naver_ranking_news
-from app.services.llm_service import categorize_news_titles_by_gpt
+from app.services.news_category_service import categorize_titles
 
 # 네이버 랭킹뉴스(많이 본 뉴스) 페이지
 NAVER_RANKING_URL = "https://news.naver.com/main/ranking/popularDay.naver"
@@ -134,7 +134,7 @@ def save_naver_ranking_to_db(items: List[NaverRankingNewsItem]) -> int:
     파싱된 랭킹뉴스를 PostgreSQL에 저장.
     1) rank == 1만 대상으로 필터
     2) 제목 기준으로 in-memory 중복 제거
-    3) category가 비어 있는 항목들에 대해 GPT로 카테고리 분류
+    3) category가 비어 있는 항목들에 대해 카테고리 분류 (제목 메모 → 새 제목만 GPT)
     4) DB 저장
     """
     if not items:
@@ -148,7 +148,7 @@ def save_naver_ranking_to_db(items: List[NaverRankingNewsItem]) -> int:
     # 2) 제목 기준 dedup
     items = _dedup_by_title(items)
 
-    # 3) GPT로 카테고리 채우기 (category == None 이나 빈 값만 대상으로)
+    # 3) 카테고리 채우기 (category == None 이나 빈 값만 대상으로)
     idx_list: list[int] = []
     titles_for_gpt: list[str] = []
 
@@ -158,7 +158,7 @@ def save_naver_ranking_to_db(items: List[NaverRankingNewsItem]) -> int:
             titles_for_gpt.append(it.title)
 
     if titles_for_gpt:
-        cats = categorize_news_titles_by_gpt(titles_for_gpt)
+        cats, _ = categorize_titles(titles_for_gpt)
         for idx, cat in zip(idx_list, cats):
             items[idx].category = cat
 
@@ -0,0 +1,132 @@
+# app/services/news_category_service.py
+"""
+랭킹뉴스 제목 카테고리 분류.
+
+1) 정규화한 제목의 해시로 news_category_memo 를 한 번에 조회 (이전 수집에서 이미 분류된 제목)
+2) 메모에 없는 제목은 로컬 분류기(news_classifier)로 먼저 분류, confidence 가 낮은 제목만
+   categorize_news_titles_by_gpt 로 분류
+3) 결과를 출처(local / llm)와 함께 메모에 저장 ("기타" fallback 은 실패 결과이므로 저장하지 않음)
+
+메모 저장소 장애 시에는 전부 LLM 으로 분류한다.
+"""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import logging
+import re
+import unicodedata
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db import postgres
+from app.services.llm_service import categorize_news_titles_by_gpt
+from app.services.news_classifier import NaiveBayesClassifier
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_CATEGORY = "기타"
+
+_WS_RE = re.compile(r"\s+")
+
+# 최신 분류기 모델 (NEWS_CLASSIFIER_RELOAD_SECONDS 마다 다시 읽어 새로 학습한 모델 반영)
+_model_cache = TTLCache(max_size=1, ttl=settings.NEWS_CLASSIFIER_RELOAD_SECONDS)
+_NO_MODEL = object()
+
+
+def normalize_title(title: str) -> str:
+    """NFKC + 소문자 + 공백 정리. (전각/반각, 줄바꿈 차이로 같은 제목이 다시 분류되지 않도록)"""
+    return _WS_RE.sub(" ", unicodedata.normalize("NFKC", title)).strip().lower()
+
+
+def title_hash(title: str) -> str:
+    return hashlib.sha256(normalize_title(title).encode("utf-8")).hexdigest()
+
+
+def _classifier() -> Optional[NaiveBayesClassifier]:
+    if not settings.NEWS_CLASSIFIER_ENABLED:
+        return None
+
+    model = _model_cache.get("model")
+    if model is None:
+        try:
+            row = postgres.load_latest_category_model()
+            model = NaiveBayesClassifier.from_dict(row["model"]) if row else _NO_MODEL
+        except Exception as e:
+            logger.warning("category model load failed: %s", e)
+            model = _NO_MODEL
+        _model_cache.set("model", model)
+
+    return None if model is _NO_MODEL else model
+
+
+def categorize_titles(titles: List[str]) -> Tuple[List[str], Dict[str, int]]:
+    """
+    titles 와 같은 순서/길이의 카테고리 목록과 이번 실행의 카운터를 반환.
+    카운터: {"memo": 메모 적중, "local": 로컬 분류기, "llm": LLM 분류, "fallback": LLM 실패로 "기타"}
+    """
+    counts = {"memo": 0, "local": 0, "llm": 0, "fallback": 0}
+    if not titles:
+        return [], counts
+
+    hashes = [title_hash(t) for t in titles]
+    try:
+        memo = postgres.lookup_category_memo(sorted(set(hashes)))
+    except Exception as e:
+        logger.warning("category memo lookup failed: %s", e)
+        memo = {}
+
+    cats: List[str] = [memo.get(h, "") for h in hashes]
+    counts["memo"] = sum(1 for c in cats if c)
+
+    # 같은 제목이 여러 번 나와도 LLM 에는 한 번만 보낸다
+    pending: Dict[str, List[int]] = {}
+    for i, c in enumerate(cats):
+        if not c:
+            pending.setdefault(hashes[i], []).append(i)
+
+    new_entries = []
+
+    model = _classifier() if pending else None
+    if model is not None:
+        threshold = settings.NEWS_CLASSIFIER_MIN_CONFIDENCE
+        for h in list(pending):
+            idxs = pending[h]
+            cat, confidence = model.predict(titles[idxs[0]])
+            if cat is None or confidence < threshold:
+                continue
+            for j in idxs:
+                cats[j] = cat
+            counts["local"] += len(idxs)
+            new_entries.append((h, titles[idxs[0]], cat, "local"))
+            del pending[h]
+
+    if pending:
+        first = [idxs[0] for idxs in pending.values()]
+        llm_cats = categorize_news_titles_by_gpt([titles[i] for i in first])
+
+        for (h, idxs), i, cat in zip(pending.items(), first, llm_cats):
+            for j in idxs:
+                cats[j] = cat
+            if cat == FALLBACK_CATEGORY:
+                counts["fallback"] += len(idxs)
+            else:
+                counts["llm"] += len(idxs)
+                new_entries.append((h, titles[i], cat, "llm"))
+
+    if new_entries:
+        try:
+            postgres.save_category_memo(
+                new_entries,
+                retention=timedelta(days=settings.NEWS_CATEGORY_MEMO_RETENTION_DAYS),
+            )
+        except Exception as e:
+            logger.warning("category memo store failed: %s", e)
+
+    for source, n in counts.items():
+        if n:
+            metrics.inc("news_category_titles_total", n, source=source)
+    logger.info("categorized %d titles: %s", len(titles), counts)
+    return cats, counts
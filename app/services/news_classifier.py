@@ -0,0 +1,247 @@
+# app/services/news_classifier.py
+"""
+LLM 이 붙인 카테고리로 학습하는 로컬 뉴스 제목 분류기 (문자 n-gram 다항 나이브 베이즈, 순수 Python).
+
+- 학습 데이터: news_category_memo 의 LLM 라벨(source='llm') + naver_ranking_news 의 카테고리.
+  로컬 분류기가 붙인 라벨(source='local')은 제외해서 스스로 만든 라벨로 다시 학습하지 않게 한다.
+- 모델은 news_category_models 에 JSON 으로 저장되고, 분류 시에는 최신 모델을 주기적으로 다시 읽는다.
+- categorize_titles 는 confidence(사후확률 최댓값)가 NEWS_CLASSIFIER_MIN_CONFIDENCE 이상인 제목만 로컬로 분류한다.
+
+CLI:
+    python -m app.services.news_classifier train      # held-out 평가 후 전체 데이터로 학습해서 저장
+    python -m app.services.news_classifier evaluate   # 평가만 (저장하지 않음)
+"""
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import argparse
+import math
+import random
+import re
+import time
+import unicodedata
+
+import orjson
+
+from app.core.config import settings
+from app.db import postgres
+
+# LLM 분류 프롬프트(NEWS_CATEGORY_SYSTEM_PROMPT)의 카테고리 목록과 동일
+NEWS_CATEGORIES = [
+    "육아", "교육", "경제", "스포츠", "연예", "사회", "생활",
+    "세계", "문화", "IT", "과학", "정치", "오피니언",
+]
+
+# evaluate 에서 coverage/accuracy 를 보여줄 confidence 기준값들
+EVAL_THRESHOLDS = [0.5, 0.7, 0.8, 0.9, 0.95, 0.99]
+
+_WS_RE = re.compile(r"\s+")
+
+
+def _char_ngrams(title: str, n_min: int, n_max: int) -> Counter:
+    text = " " + _WS_RE.sub(" ", unicodedata.normalize("NFKC", title)).strip().lower() + " "
+    grams: Counter = Counter()
+    for n in range(n_min, n_max + 1):
+        for i in range(len(text) - n + 1):
+            grams[text[i : i + n]] += 1
+    return grams
+
+
+class NaiveBayesClassifier:
+    """문자 n-gram 다항 나이브 베이즈 (라플라스 스무딩, 학습에 없던 n-gram 은 무시)."""
+
+    def __init__(self, n_min: int = 1, n_max: int = 3, alpha: float = 0.5, min_count: int = 2):
+        self.n_min = n_min
+        self.n_max = n_max
+        self.alpha = alpha
+        self.min_count = min_count
+        self.classes: List[str] = []
+        self.class_docs: List[int] = []
+        self.counts: Dict[str, List[int]] = {}   # n-gram → 클래스별 출현 수
+        self._prepare()
+
+    def fit(self, titles: Sequence[str], labels: Sequence[str]) -> "NaiveBayesClassifier":
+        self.classes = sorted(set(labels))
+        index = {c: i for i, c in enumerate(self.classes)}
+        self.class_docs = [0] * len(self.classes)
+
+        counts: Dict[str, List[int]] = defaultdict(lambda: [0] * len(self.classes))
+        for title, label in zip(titles, labels):
+            k = index[label]
+            self.class_docs[k] += 1
+            for gram, c in _char_ngrams(title, self.n_min, self.n_max).items():
+                counts[gram][k] += c
+
+        # 드문 n-gram 은 모델 크기만 키우고 일반화에 도움이 안 되므로 제거
+        self.counts = {g: v for g, v in counts.items() if sum(v) >= self.min_count}
+        self._prepare()
+        return self
+
+    def _prepare(self) -> None:
+        """저장된 출현 수에서 로그 확률 테이블을 미리 계산."""
+        k = len(self.classes)
+        total_docs = sum(self.class_docs)
+        self._log_prior = [math.log(d / total_docs) for d in self.class_docs] if total_docs else []
+
+        vocab = len(self.counts)
+        totals = [0] * k
+        for v in self.counts.values():
+            for i in range(k):
+                totals[i] += v[i]
+        denom = [math.log(totals[i] + self.alpha * vocab) for i in range(k)]
+        self._log_prob = {
+            g: [math.log(v[i] + self.alpha) - denom[i] for i in range(k)]
+            for g, v in self.counts.items()
+        }
+
+    def predict(self, title: str) -> Tuple[Optional[str], float]:
+        """(카테고리, confidence) 반환. 모델이 비어 있으면 (None, 0.0)."""
+        if not self.classes:
+            return None, 0.0
+
+        scores = list(self._log_prior)
+        for gram, c in _char_ngrams(title, self.n_min, self.n_max).items():
+            lp = self._log_prob.get(gram)
+            if lp is None:
+                continue
+            for i, p in enumerate(lp):
+                scores[i] += c * p
+
+        best = max(range(len(scores)), key=scores.__getitem__)
+        top = scores[best]
+        z = sum(math.exp(s - top) for s in scores)
+        return self.classes[best], 1.0 / z
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "n_min": self.n_min,
+            "n_max": self.n_max,
+            "alpha": self.alpha,
+            "min_count": self.min_count,
+            "classes": self.classes,
+            "class_docs": self.class_docs,
+            "counts": self.counts,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NaiveBayesClassifier":
+        model = cls(data["n_min"], data["n_max"], data["alpha"], data["min_count"])
+        model.classes = list(data["classes"])
+        model.class_docs = list(data["class_docs"])
+        model.counts = dict(data["counts"])
+        model._prepare()
+        return model
+
+
+# ---------------------------
+# 학습 데이터 / 평가
+# ---------------------------
+
+def load_training_data() -> Tuple[List[str], List[str]]:
+    """
+    (titles, labels). 같은 제목(정규화 해시 기준)은 한 번만 쓰고,
+    메모에 있는 제목은 메모의 라벨을 우선하며 로컬 분류기가 붙인 제목은 제외한다.
+    """
+    # news_category_service 가 이 모듈을 import 하므로 순환 import 를 피해 함수 안에서 import
+    from app.services.news_category_service import title_hash
+
+    rows = postgres.fetch_category_training_rows(NEWS_CATEGORIES)
+
+    seen: Dict[str, Tuple[str, str]] = {}
+    excluded = set()
+    for h, title, category, source in rows["memo"]:
+        if source == "llm":
+            seen[h] = (title, category)
+        else:
+            excluded.add(h)
+
+    for title, category in rows["news"]:
+        h = title_hash(title)
+        if h in seen or h in excluded:
+            continue
+        seen[h] = (title, category)
+
+    titles = [t for t, _ in seen.values()]
+    labels = [c for _, c in seen.values()]
+    return titles, labels
+
+
+def evaluate(
+    titles: Sequence[str],
+    labels: Sequence[str],
+    test_ratio: float = 0.2,
+    seed: int = 42,
+) -> Dict[str, Any]:
+    """held-out 분할로 정확도(LLM 라벨 대비), confidence 기준별 coverage/정확도, 지연 시간 측정."""
+    order = list(range(len(titles)))
+    random.Random(seed).shuffle(order)
+    n_test = max(1, int(len(order) * test_ratio))
+    test_idx, train_idx = order[:n_test], order[n_test:]
+
+    started = time.perf_counter()
+    model = NaiveBayesClassifier().fit([titles[i] for i in train_idx], [labels[i] for i in train_idx])
+    train_seconds = time.perf_counter() - started
+
+    results = []
+    latencies = []
+    for i in test_idx:
+        t0 = time.perf_counter()
+        pred, conf = model.predict(titles[i])
+        latencies.append(time.perf_counter() - t0)
+        results.append((pred == labels[i], conf))
+
+    latencies.sort()
+    thresholds = []
+    for th in EVAL_THRESHOLDS:
+        covered = [ok for ok, conf in results if conf >= th]
+        thresholds.append({
+            "min_confidence": th,
+            "coverage": len(covered) / len(results),
+            "accuracy": (sum(covered) / len(covered)) if covered else None,
+        })
+
+    return {
+        "train_size": len(train_idx),
+        "test_size": len(test_idx),
+        "accuracy": sum(ok for ok, _ in results) / len(results),
+        "thresholds": thresholds,
+        "train_seconds": round(train_seconds, 3),
+        "predict_us_p50": round(latencies[len(latencies) // 2] * 1e6, 1),
+        "predict_us_p95": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1e6, 1),
+        "vocab_size": len(model.counts),
+    }
+
+
+# ---------------------------
+# CLI
+# ---------------------------
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="뉴스 제목 로컬 분류기 학습/평가")
+    parser.add_argument("command", choices=["train", "evaluate"], nargs="?", default="train")
+    parser.add_argument("--test-ratio", type=float, default=0.2)
+    parser.add_argument("--min-samples", type=int, default=200, help="이보다 데이터가 적으면 학습하지 않음")
+    args = parser.parse_args()
+
+    postgres.init_pool()
+    try:
+        titles, labels = load_training_data()
+        print(f"samples: {len(titles)} {dict(Counter(labels).most_common())}")
+        if len(titles) < args.min_samples:
+            raise SystemExit(f"not enough samples (< {args.min_samples})")
+
+        report = evaluate(titles, labels, test_ratio=args.test_ratio)
+        print(orjson.dumps(report, option=orjson.OPT_INDENT_2).decode("utf-8"))
+        print(f"configured min confidence: {settings.NEWS_CLASSIFIER_MIN_CONFIDENCE}")
+
+        if args.command == "train":
+            model = NaiveBayesClassifier().fit(titles, labels)
+            model_id = postgres.save_category_model(model.to_dict(), report)
+            print(f"saved model id={model_id} (vocab {len(model.counts)})")
+    finally:
+        postgres.close_pool()
+
+
+if __name__ == "__main__":
+    main()
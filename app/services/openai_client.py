@@ -0,0 +1,299 @@
+# app/services/openai_client.py
+"""
+OpenAI chat.completions 호출 정책 (llm_service 의 모든 호출이 여기를 거친다).
+
+- 호출 단위 deadline: 재시도/백오프를 포함한 전체 시간 상한. 시도마다 남은 시간만큼만 timeout 을 준다.
+- 재시도: 429 / 5xx / 연결 오류 / 타임아웃만, 지터를 섞은 지수 백오프 (Retry-After 가 있으면 우선).
+  SDK 자체 재시도는 끄고(max_retries=0) 여기서만 재시도한다.
+- hedging(선택): hedge_after 초 안에 응답이 없으면 같은 요청을 하나 더 보내 먼저 끝난 쪽을 쓴다.
+  (토큰을 두 배로 쓸 수 있으므로 긴 생성 호출에만 설정으로 켠다)
+  hedge 실행기는 OPENAI_HEDGE_WORKERS 자리만큼만 받고, 빈 자리가 없으면 대기열에 쌓지 않고
+  hedging 없이(또는 두 번째 요청 없이) 진행한다. 기다리는 동안에도 deadline 을 지킨다.
+- 서킷 브레이커: 일시적 오류가 OPENAI_BREAKER_FAILURES 번 연속되면 OPENAI_BREAKER_RESET_SECONDS 동안
+  호출하지 않고 바로 CircuitOpenError. 이후 한 번 시험 호출이 성공하면 닫힌다.
+- OPENAI_BASE_URL 로 OpenAI 호환 서버(로컬 fake 서버 등)를 가리킬 수 있다.
+"""
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Optional
+import random
+import threading
+import time
+
+from openai import (
+    OpenAI,
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
+)
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.services import llm_usage
+
+# 재시도할 일시적 오류 (429 / 5xx / 연결·타임아웃)
+RETRYABLE_ERRORS = (RateLimitError, InternalServerError, APIConnectionError, APITimeoutError)
+
+# 백오프 상한 (Retry-After 가 이보다 길면 이 값까지만 기다림)
+MAX_BACKOFF_SECONDS = 20.0
+
+
+class CircuitOpenError(RuntimeError):
+    """서킷 브레이커가 열려 있어 호출하지 않음."""
+
+
+class DeadlineExceeded(TimeoutError):
+    """재시도를 포함한 호출 deadline 초과."""
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 브레이커 (closed → open → half-open → closed)."""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                return "half_open"
+            return "open"
+
+    def allow(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if time.monotonic() - self._opened_at < self.reset_timeout or self._probing:
+                raise CircuitOpenError("OpenAI circuit breaker is open")
+            # half-open: 시험 호출 하나만 통과
+            self._probing = True
+
+    def success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def release(self) -> None:
+        """success/failure 없이 끝난 시험 호출의 허가를 반납 (다음 호출이 다시 시험할 수 있게)."""
+        with self._lock:
+            self._probing = False
+
+    def failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                if self._opened_at is None or self._probing:
+                    metrics.inc("openai_circuit_opened_total")
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+
+_client = OpenAI(
+    api_key=settings.OPENAI_API_KEY,
+    base_url=settings.OPENAI_BASE_URL or None,
+    max_retries=0,
+)
+
+breaker = CircuitBreaker(settings.OPENAI_BREAKER_FAILURES, settings.OPENAI_BREAKER_RESET_SECONDS)
+
+# hedged 요청용 (요청 스레드는 결과를 기다리기만 한다). 자리 수 = 스레드 수라 작업이 큐에서 기다리지 않는다
+_hedge_executor = ThreadPoolExecutor(max_workers=settings.OPENAI_HEDGE_WORKERS, thread_name_prefix="openai-hedge")
+_hedge_slots = threading.BoundedSemaphore(settings.OPENAI_HEDGE_WORKERS)
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    if isinstance(error, APIStatusError):
+        value = error.response.headers.get("retry-after")
+        try:
+            return float(value) if value else None
+        except ValueError:
+            return None
+    return None
+
+
+def _backoff(attempt: int, error: BaseException) -> float:
+    hinted = _retry_after(error)
+    if hinted is not None:
+        return min(hinted, MAX_BACKOFF_SECONDS)
+    return random.uniform(0, min(MAX_BACKOFF_SECONDS, settings.OPENAI_RETRY_BASE_SECONDS * 2 ** attempt))
+
+
+class _RecordedStream:
+    """
+    스트리밍 응답 래퍼. 연결에 성공한 시도는 스트림이 끝나거나 닫힐 때 한 번만 기록한다.
+    (usage 는 마지막 청크에 오고, 연결 실패한 시도는 _attempt 가 이미 기록했다)
+    """
+
+    def __init__(self, stream: Any, feature: str, started: float, retries: int):
+        self._stream = stream
+        self._feature = feature
+        self._started = started
+        self._retries = retries
+        self._usage: Any = None
+        self._recorded = False
+
+    def __iter__(self) -> Any:
+        for chunk in self._stream:
+            if getattr(chunk, "usage", None) is not None:
+                self._usage = chunk.usage
+            yield chunk
+
+    def __enter__(self) -> "_RecordedStream":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Optional[BaseException], tb: Any) -> None:
+        self._stream.close()
+        self._record(exc)
+
+    def close(self) -> None:
+        self._stream.close()
+        self._record(None)
+
+    def _record(self, error: Optional[BaseException]) -> None:
+        if self._recorded:
+            return
+        self._recorded = True
+        llm_usage.record(
+            self._feature,
+            settings.OPENAI_MODEL,
+            time.perf_counter() - self._started,
+            usage=self._usage,
+            error=error,
+            retries=self._retries,
+        )
+
+
+def _attempt(feature: str, timeout: float, retries: int, kwargs: dict, hedge: bool = False) -> Any:
+    """한 번의 요청 + 계측."""
+    started = time.perf_counter()
+    try:
+        resp = _client.with_options(timeout=timeout).chat.completions.create(
+            model=settings.OPENAI_MODEL, **kwargs
+        )
+    except Exception as e:
+        llm_usage.record(
+            feature, settings.OPENAI_MODEL, time.perf_counter() - started, error=e, retries=retries, hedge=hedge
+        )
+        raise
+    if kwargs.get("stream"):
+        return _RecordedStream(resp, feature, started, retries)
+    llm_usage.record(
+        feature, settings.OPENAI_MODEL, time.perf_counter() - started, usage=resp.usage, retries=retries, hedge=hedge
+    )
+    return resp
+
+
+def _submit_hedge(feature: str, timeout: float, retries: int, kwargs: dict, hedge: bool = False) -> Optional[Future]:
+    """빈 자리가 있으면 실행기에 제출, 없으면 None (대기열에 쌓지 않는다)."""
+    if not _hedge_slots.acquire(blocking=False):
+        metrics.inc("openai_hedge_saturated_total", feature=feature)
+        return None
+    try:
+        future = _hedge_executor.submit(_attempt, feature, timeout, retries, kwargs, hedge)
+    except BaseException:
+        _hedge_slots.release()
+        raise
+    future.add_done_callback(lambda _: _hedge_slots.release())
+    return future
+
+
+def _hedged_attempt(feature: str, timeout: float, retries: int, hedge_after: float, end: float, kwargs: dict) -> Any:
+    """
+    hedge_after 초 안에 끝나지 않으면 두 번째 요청을 보내고 먼저 성공한 결과를 반환.
+    실행기에 자리가 없으면 이 스레드에서 hedging 없이 호출한다. end(monotonic) 까지 결과가 없으면 DeadlineExceeded.
+    """
+    first = _submit_hedge(feature, timeout, retries, kwargs)
+    if first is None:
+        return _attempt(feature, timeout, retries, kwargs)
+
+    done, _ = wait([first], timeout=hedge_after)
+    if done:
+        return first.result()
+
+    pending = {first}
+    second = _submit_hedge(
+        feature, max(0.1, min(timeout - hedge_after, end - time.monotonic())), retries, kwargs, hedge=True
+    )
+    if second is not None:
+        metrics.inc("openai_hedged_requests_total", feature=feature)
+        pending.add(second)
+
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = wait(pending, timeout=max(0.0, end - time.monotonic()), return_when=FIRST_COMPLETED)
+        if not done:
+            raise DeadlineExceeded(f"{feature} deadline exceeded while waiting for hedged requests")
+        for f in done:
+            if f.exception() is None:
+                return f.result()
+            error = f.exception()
+    raise error
+
+
+def chat_completion(
+    feature: str,
+    deadline: float,
+    hedge_after: Optional[float] = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    deadline 초 안에서 재시도하며 chat.completions.create 호출.
+    stream=True 도 가능 (스트림 연결까지만 재시도, hedging 없음). 반환된 스트림은 with 로 닫으면
+    연결에 성공한 시도가 usage 와 함께 기록된다.
+    실패: 마지막 오류 그대로 / DeadlineExceeded / CircuitOpenError
+    """
+    end = time.monotonic() + deadline
+    attempt = 0
+    while True:
+        # deadline 확인을 먼저: allow() 가 half-open 시험 호출을 허가한 뒤에는 반드시 success/failure 로 끝나야 한다
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"{feature} deadline {deadline}s exceeded")
+        breaker.allow()
+        timeout = min(remaining, settings.OPENAI_REQUEST_TIMEOUT_SECONDS)
+
+        try:
+            if hedge_after and not kwargs.get("stream") and timeout > hedge_after:
+                resp = _hedged_attempt(feature, timeout, attempt, hedge_after, end, kwargs)
+            else:
+                resp = _attempt(feature, timeout, attempt, kwargs)
+        except RETRYABLE_ERRORS as e:
+            breaker.failure()
+            if attempt >= settings.OPENAI_MAX_RETRIES:
+                raise
+            delay = _backoff(attempt, e)
+            if time.monotonic() + delay >= end:
+                raise
+            metrics.inc("openai_retries_total", feature=feature, error=type(e).__name__)
+            time.sleep(delay)
+            attempt += 1
+            continue
+        except DeadlineExceeded:
+            breaker.failure()
+            raise
+        except APIStatusError as e:
+            # 400/401 등 4xx 는 upstream 이 응답했다는 뜻이므로 브레이커 입장에서는 성공
+            if 400 <= e.status_code < 500:
+                breaker.success()
+            else:
+                breaker.release()
+            raise
+        except BaseException:
+            # 로컬 오류(잘못된 인자, 응답 처리 오류)나 인터럽트: upstream 상태를 알 수 없으므로
+            # 실패 수는 그대로 두고 시험 호출 허가만 돌려놓는다
+            breaker.release()
+            raise
+
+        breaker.success()
+        return resp
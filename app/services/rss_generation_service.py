@@ -0,0 +1,94 @@
+# app/services/rss_generation_service.py
+"""
+/rss/generate 의 생성 흐름(뉴스 선택 → LLM 생성 → RSS XML)을 라우터와 백그라운드 작업이 공유하도록 모아 둔 모듈.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, Optional
+import logging
+
+import orjson
+
+from app.db import postgres
+from app.services.feed_service import publish
+from app.services.llm_service import generate_rss_feed_by_gpt, stream_rss_feed_by_gpt
+from app.services.rss_service import build_rss_xml
+
+logger = logging.getLogger(__name__)
+
+CONTRY_TYPE = "대한민국"
+FALLBACK_KEYWORD = "오늘의 주요 뉴스"
+
+
+def persona_inputs(ages: Optional[int], sex: Optional[str], type: Optional[str]) -> Dict[str, Any]:
+    """옵션 파라미터가 비어 있을 때의 기본값 적용."""
+    return {
+        "ages": ages or 30,
+        "contry_type": CONTRY_TYPE,
+        "sex": sex or "여성",
+        "type": type or "신중한",
+    }
+
+
+def persona_key(ages: Optional[int], sex: Optional[str], type: Optional[str]) -> str:
+    """기본값을 적용한 페르소나 문자열 ("30|남성|유쾌한"). feed_articles / 기사 풀에서 사용."""
+    p = persona_inputs(ages, sex, type)
+    return f"{p['ages']}|{p['sex']}|{p['type']}"
+
+
+def generate_rss(
+    keyword: Optional[str] = None,
+    category: Optional[str] = None,
+    ages: Optional[int] = None,
+    sex: Optional[str] = None,
+    type: Optional[str] = None,
+    no_cache: bool = False,
+) -> bytes:
+    """POST /rss/generate 와 같은 흐름의 동기 버전 (작업 워커 스레드용)."""
+    if not keyword:
+        row = postgres.get_top_news(category)
+        keyword = row["title"] if row else FALLBACK_KEYWORD
+        category = row["category"] if row else category
+
+    items = generate_rss_feed_by_gpt(
+        keyword=keyword, use_cache=not no_cache, **persona_inputs(ages, sex, type)
+    )
+    items = publish(items, keyword, category, persona_key(ages, sex, type))
+    return build_rss_xml([items])
+
+
+def _sse_event(event: str, data: Any) -> bytes:
+    # orjson 출력에는 줄바꿈이 없으므로 data 한 줄로 충분
+    return b"event: " + event.encode("ascii") + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+def generation_events(
+    keyword: str,
+    category: Optional[str] = None,
+    ages: Optional[int] = None,
+    sex: Optional[str] = None,
+    type: Optional[str] = None,
+    no_cache: bool = False,
+) -> Iterator[bytes]:
+    """
+    /rss/generate/stream 의 SSE 본문 (동기 generator → StreamingResponse 가 스레드풀에서 순회).
+      event: start  {"keyword"}
+      event: delta  {"field", "index", "text"}   (title/summary/content/tags 조각)
+      event: item   {"item": 완성된 글, "rss": RSS XML 문자열}
+      event: error  {"detail"}
+    """
+    yield _sse_event("start", {"keyword": keyword})
+    try:
+        for event, data in stream_rss_feed_by_gpt(
+            keyword=keyword, use_cache=not no_cache, **persona_inputs(ages, sex, type)
+        ):
+            if event == "item":
+                items = publish({"items": [data]}, keyword, category, persona_key(ages, sex, type))
+                xml_data = build_rss_xml([items])
+                yield _sse_event("item", {"item": data, "rss": xml_data.decode("utf-8")})
+            else:
+                yield _sse_event(event, data)
+    except Exception as e:
+        # 헤더(200)는 이미 나갔으므로 에러도 이벤트로 전달
+        logger.exception("streaming generation failed")
+        yield _sse_event("error", {"detail": f"{e.__class__.__name__}: {e}"})
@@ -0,0 +1,83 @@
+# app/services/rss_job_service.py
+"""
+비동기 RSS 생성 작업.
+
+- POST /rss/jobs 는 rss_jobs 에 queued 로 기록하고 바로 job id 를 돌려준다.
+- 생성은 RSS_JOB_WORKERS 개 스레드의 작업 풀에서 실행되고, 결과/에러는 rss_jobs 에 저장된다.
+- 작업 상태는 Postgres 에만 있으므로 워커가 재시작되면 start_workers() 가
+  멈춘 running 작업을 다시 queued 로 돌리고 queued 작업을 다시 실행한다.
+- 여러 프로세스가 같은 작업을 잡더라도 claim_rss_job(queued → running 원자적 UPDATE)으로 한 번만 실행된다.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Optional
+import logging
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db import postgres
+from app.services.rss_generation_service import generate_rss
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def start_workers() -> None:
+    """작업 풀을 만들고, 이전 프로세스에서 끝나지 못한 작업을 다시 등록한다."""
+    global _executor
+    if _executor is not None:
+        return
+    _executor = ThreadPoolExecutor(
+        max_workers=settings.RSS_JOB_WORKERS, thread_name_prefix="rss-job"
+    )
+
+    job_ids = postgres.recover_rss_jobs(
+        stale_after=timedelta(seconds=settings.RSS_JOB_STALE_SECONDS),
+        max_attempts=settings.RSS_JOB_MAX_ATTEMPTS,
+    )
+    for job_id in job_ids:
+        enqueue(job_id)
+    if job_ids:
+        logger.info("re-queued %d rss jobs", len(job_ids))
+
+
+def shutdown_workers() -> None:
+    """실행 중인 작업은 끝까지 기다리지 않는다 (running 으로 남은 작업은 다음 시작 시 복구)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def enqueue(job_id: str) -> None:
+    if _executor is None:
+        raise RuntimeError("RSS job workers not started")
+    _executor.submit(_run_job, job_id)
+
+
+def _run_job(job_id: str) -> None:
+    job = postgres.claim_rss_job(job_id)
+    if job is None:
+        return  # 다른 워커가 이미 처리 중이거나 완료
+
+    params = job["params"] or {}
+    try:
+        xml_data = generate_rss(
+            keyword=params.get("keyword"),
+            category=params.get("category"),
+            ages=params.get("ages"),
+            sex=params.get("sex"),
+            type=params.get("type"),
+            no_cache=bool(params.get("no_cache")),
+        )
+    except Exception as e:
+        logger.exception("rss job %s failed", job_id)
+        postgres.fail_rss_job(job_id, f"{type(e).__name__}: {e}")
+        metrics.inc("rss_jobs_total", outcome="failed")
+        return
+
+    postgres.finish_rss_job(job_id, xml_data.decode("utf-8"))
+    metrics.inc("rss_jobs_total", outcome="done")
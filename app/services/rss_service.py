@@ -1,15 +1,142 @@
-from xml.etree.ElementTree import Element, SubElement, tostring
 from datetime import datetime, timezone
 from email.utils import format_datetime
-import html
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterator, List
+
+XML_DECLARATION = b"<?xml version='1.0' encoding='utf-8'?>\n"
+
+# 채널 기본값 (RSS / JSON Feed 공용)
+FEED_TITLE = "뉴스 RSS 피드"
+FEED_LINK = "https://example.com"
+FEED_DESCRIPTION = "GPT로 생성된 뉴스 요약 피드"
+
+
+def _esc(text: str) -> str:
+    """
+    XML 텍스트 노드 이스케이프 (&, <, >). 값마다 한 번만 적용한다.
+    해당 문자가 없으면 그대로 반환하고, 있으면 C 구현 str.replace 로 바꾼다. (str.translate 보다 빠름)
+    """
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def flatten_articles(raw_items: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """{"items": [...]} 묶음과 글 dict 가 섞인 입력을 글 dict 단위로 평탄화."""
+    for it in raw_items or []:
+        if not isinstance(it, dict):
+            continue
+
+        # case: {"items": [ {...}, {...} ]}
+        if "items" in it and isinstance(it["items"], list):
+            for inner in it["items"]:
+                if isinstance(inner, dict):
+                    yield inner
+        # case: {"title": "...", "summary": "...", "content": "...", ...}
+        elif "title" in it or "summary" in it or "content" in it or "tags" in it:
+            yield it
+
+
+def split_tags(raw_tags: Any) -> List[str]:
+    """
+    tags 가 list 면 각 항목 trim, str 면 콤마/줄바꿈/| 기준 split 후 trim. 빈 값은 버린다.
+    (생성 프롬프트는 | 구분자를 요청한다)
+    """
+    if isinstance(raw_tags, list):
+        return [str(t).strip() for t in raw_tags if str(t).strip()]
+    if isinstance(raw_tags, str):
+        parts = []
+        for chunk in raw_tags.replace("\r", "\n").replace("|", "\n").split("\n"):
+            for p in chunk.split(","):
+                p = p.strip()
+                if p:
+                    parts.append(p)
+        return parts
+    return []
+
+
+def normalize_article(art: Dict[str, Any], idx: int, now: datetime) -> Dict[str, Any]:
+    """
+    RSS / JSON Feed 공용 글 정규화 (두 형식이 어긋나지 않도록 여기서만 처리).
+    - guid: feed_articles 에 저장된 글은 내용 기반 guid (feed_service.publish), 없으면 None
+    - id: guid, 없으면 "trend:{idx}:{timestamp}"
+    - published_at: 실제 게시 시각, 없으면 now
+    """
+    guid = art.get("guid")
+    published_at = art.get("published_at")
+    return {
+        "title": str(art.get("title") or f"Untitled {idx}"),
+        "summary": str(art.get("summary") or ""),
+        "content": str(art.get("content") or ""),
+        "tags": split_tags(art.get("tags")),
+        "guid": str(guid) if guid else None,
+        "id": str(guid) if guid else f"trend:{idx}:{int(now.timestamp())}",
+        "published_at": published_at if isinstance(published_at, datetime) else now,
+    }
+
+
+def _item_xml(art: Dict[str, Any], idx: int, now: datetime) -> str:
+    a = normalize_article(art, idx, now)
+
+    # summary + content를 description에 합쳐서 넣기
+    description_text = (a["summary"] + "\n\n" + a["content"]).strip()
+
+    parts = [
+        "<item><title>", _esc(a["title"]), "</title>",
+        "<description>", _esc(description_text), "</description>",
+    ]
+
+    tag_list = a["tags"]
+    if tag_list:
+        # <tags> 요소: 클라이언트에서 그대로 읽어서 사용하기 좋게
+        parts += ["<tags>", _esc(",".join(tag_list)), "</tags>"]
+        # <category> 요소: RSS 표준 태그(원하면 RSS 리더에서도 활용 가능)
+        for tg in tag_list:
+            parts += ["<category>", _esc(tg), "</category>"]
+
+    if a["guid"]:
+        parts += ['<guid isPermaLink="false">', _esc(a["guid"]), "</guid>"]
+    else:
+        parts += ["<guid>", a["id"], "</guid>"]
+
+    parts += ["<pubDate>", format_datetime(a["published_at"]), "</pubDate>", "</item>"]
+    return "".join(parts)
+
+
+def iter_rss_xml(
+    raw_items: List[Dict[str, Any]],
+    feed_title: str = FEED_TITLE,
+    feed_link: str = FEED_LINK,
+    feed_description: str = FEED_DESCRIPTION,
+) -> Iterator[bytes]:
+    """
+    build_rss_xml 과 같은 RSS 2.0 XML 을 헤더 → <item> 하나씩 → 닫는 태그 순으로 yield.
+    트리를 만들지 않으므로 StreamingResponse 에 그대로 넘길 수 있다.
+    """
+    now = datetime.now(timezone.utc)
+
+    yield XML_DECLARATION + (
+        '<rss version="2.0"><channel>'
+        f"<title>{_esc(feed_title)}</title>"
+        f"<link>{_esc(feed_link)}</link>"
+        f"<description>{_esc(feed_description)}</description>"
+        f"<lastBuildDate>{format_datetime(now)}</lastBuildDate>"
+    ).encode("utf-8")
+
+    for idx, art in enumerate(flatten_articles(raw_items), start=1):
+        yield _item_xml(art, idx, now).encode("utf-8")
+
+    yield b"</channel></rss>"
 
 
 def build_rss_xml(
     raw_items: List[Dict[str, Any]],
-    feed_title: str = "뉴스 RSS 피드",
-    feed_link: str = "https://example.com",
-    feed_description: str = "GPT로 생성된 뉴스 요약 피드",
+    feed_title: str = FEED_TITLE,
+    feed_link: str = FEED_LINK,
+    feed_description: str = FEED_DESCRIPTION,
 ) -> bytes:
     """
     raw_items 예시 1:
@@ -30,11 +157,11 @@ def build_rss_xml(
         ]
 
     두 경우 모두 처리해서
-    RSS 2.0 XML(bytes)를 리턴한다.
+    RSS 2.0 XML(bytes)를 리턴한다. (iter_rss_xml 의 청크를 이어 붙인 것)
 
     tags 처리 규칙:
       - tags 가 list 면: ["Samsung Family", "Innovation", "Future Vision"]
-      - tags 가 str 면: 콤마/줄바꿈 기준 split 후 trim
+      - tags 가 str 면: 콤마/줄바꿈/| 기준 split 후 trim
       - RSS 상에서는
           <tags>Samsung Family,Innovation,Future Vision</tags>
           <category>Samsung Family</category>
@@ -42,79 +169,4 @@ def build_rss_xml(
           <category>Future Vision</category>
         형태로 내려간다.
     """
-
-    # 1) 먼저 평탄화: 최종적으로 articles = [{title, summary, content, tags, ...}, ...]
-    articles: List[Dict[str, Any]] = []
-
-    for it in raw_items or []:
-        if not isinstance(it, dict):
-            continue
-
-        # case: {"items": [ {...}, {...} ]}
-        if "items" in it and isinstance(it["items"], list):
-            for inner in it["items"]:
-                if isinstance(inner, dict):
-                    articles.append(inner)
-        # case: {"title": "...", "summary": "...", "content": "...", ...}
-        elif "title" in it or "summary" in it or "content" in it or "tags" in it:
-            articles.append(it)
-
-    # 2) RSS XML 생성
-    now = datetime.now(timezone.utc)
-
-    rss = Element("rss", version="2.0")
-    channel = SubElement(rss, "channel")
-
-    SubElement(channel, "title").text = html.escape(feed_title)
-    SubElement(channel, "link").text = feed_link
-    SubElement(channel, "description").text = html.escape(feed_description)
-    SubElement(channel, "lastBuildDate").text = format_datetime(now)
-
-    for idx, art in enumerate(articles, start=1):
-        item_el = SubElement(channel, "item")
-
-        title = str(art.get("title") or f"Untitled {idx}")
-        summary = str(art.get("summary") or "")
-        content = str(art.get("content") or "")
-
-        # summary + content를 description에 합쳐서 넣기
-        description_text = (summary + "\n\n" + content).strip()
-
-        SubElement(item_el, "title").text = html.escape(title)
-        SubElement(item_el, "description").text = html.escape(description_text)
-
-        # ---- tags 처리 시작 ----
-        raw_tags = art.get("tags")
-        tag_list: List[str] = []
-
-        if isinstance(raw_tags, list):
-            # 리스트일 경우
-            tag_list = [str(t).strip() for t in raw_tags if str(t).strip()]
-            tags_text = ",".join(tag_list) if tag_list else ""
-        elif isinstance(raw_tags, str):
-            # 문자열일 경우: 콤마/줄바꿈 기준으로 split
-            parts = []
-            for chunk in raw_tags.replace("\r", "\n").split("\n"):
-                for p in chunk.split(","):
-                    p = p.strip()
-                    if p:
-                        parts.append(p)
-            tag_list = parts
-            tags_text = ",".join(tag_list) if tag_list else ""
-        else:
-            tags_text = ""
-
-        # <tags> 요소: 클라이언트에서 그대로 읽어서 사용하기 좋게
-        if tags_text:
-            SubElement(item_el, "tags").text = html.escape(tags_text)
-
-        # <category> 요소: RSS 표준 태그(원하면 RSS 리더에서도 활용 가능)
-        for tg in tag_list:
-            SubElement(item_el, "category").text = html.escape(tg)
-        # ---- tags 처리 끝 ----
-
-        guid = f"trend:{idx}:{int(now.timestamp())}"
-        SubElement(item_el, "guid").text = guid
-        SubElement(item_el, "pubDate").text = format_datetime(now)
-
-    return tostring(rss, encoding="utf-8", xml_declaration=True)
+    return b"".join(iter_rss_xml(raw_items, feed_title, feed_link, feed_description))
@@ -0,0 +1,86 @@
+# app/services/user_cache.py
+"""
+get_current_user 용 인증 사용자 캐시.
+
+- username → users 행(dict)을 TTL(USER_CACHE_TTL_SECONDS) 동안 보관해서
+  인증된 요청마다 DB 를 조회하지 않도록 한다.
+- create_user(upsert) 는 pg_notify 로 변경을 알리고, 각 워커는 LISTEN 해서 해당 항목을 지운다.
+- 알림을 놓치더라도 TTL 이 지나면 다시 조회하므로 비활성화/만료일 변경은 최대 TTL 안에 반영된다.
+  (expires_at 자체는 요청마다 현재 시각과 비교하므로 만료는 캐시와 무관하게 즉시 적용)
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+import asyncio
+import logging
+
+import psycopg
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.db import postgres_async
+from app.db.postgres import USER_CHANGED_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+_cache = TTLCache(max_size=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
+_listener_task: Optional[asyncio.Task] = None
+
+# LISTEN 연결이 끊겼을 때 재연결 간격(초)
+_RECONNECT_DELAY = 5.0
+
+
+async def get_user(username: str) -> Optional[Dict[str, Any]]:
+    """캐시에 있으면 그대로, 없으면 DB 조회 후 캐시. 없는 사용자는 캐시하지 않는다."""
+    user = _cache.get(username)
+    if user is None:
+        user = await postgres_async.get_user(username)
+        if user is None:
+            return None
+        _cache.set(username, user)
+    # 호출한 쪽에서 dict 를 수정해도 캐시에 영향 없도록 복사본 반환
+    return dict(user)
+
+
+def invalidate(username: str) -> None:
+    _cache.pop(username)
+
+
+def stats() -> Dict[str, int]:
+    return _cache.stats()
+
+
+async def _listen_forever() -> None:
+    while True:
+        try:
+            conn = await psycopg.AsyncConnection.connect(settings.DATABASE_URL, autocommit=True)
+            async with conn:
+                await conn.execute(f"LISTEN {USER_CHANGED_CHANNEL}")
+                # 연결이 끊긴 동안의 변경은 알 수 없으므로 (재)연결 시 전체 비움
+                _cache.clear()
+                async for notify in conn.notifies():
+                    invalidate(notify.payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("user cache listener disconnected: %s", e)
+            _cache.clear()
+        await asyncio.sleep(_RECONNECT_DELAY)
+
+
+def start_listener() -> None:
+    """워커 간 무효화를 위한 LISTEN 태스크 시작 (USER_CACHE_NOTIFY=False 면 TTL 만 사용)."""
+    global _listener_task
+    if settings.USER_CACHE_NOTIFY and _listener_task is None:
+        _listener_task = asyncio.create_task(_listen_forever())
+
+
+async def stop_listener() -> None:
+    global _listener_task
+    if _listener_task is not None:
+        _listener_task.cancel()
+        try:
+            await _listener_task
+        except asyncio.CancelledError:
+            pass
+        _listener_task = None
@@ -0,0 +1,104 @@
+# benchmarks/bench_ingest.py
+"""
+trending_keywords / naver_ranking_news 적재 경로 비교 벤치마크.
+
+    executemany (save_keywords / save_naver_ranking_news)
+        vs
+    COPY + 스테이징 병합 (copy_keywords / copy_naver_ranking_news)
+
+실행 (DATABASE_URL 은 .env 또는 환경변수):
+    python -m benchmarks.bench_ingest
+    python -m benchmarks.bench_ingest --sizes 100 10000 100000
+
+주의: 실제 테이블에 쓴다. 벤치마크 행은 geo/press = '__bench__' 로 표시하고
+각 측정 후 삭제하므로 운영 DB 가 아닌 개발 DB 에서 실행할 것.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+from typing import Any, Callable, Dict, List
+
+from app.db import postgres
+
+BENCH_MARK = "__bench__"
+
+
+def _keyword_items(n: int) -> List[Dict[str, Any]]:
+    run = uuid.uuid4().hex[:8]
+    return [
+        {
+            "query": f"{BENCH_MARK} keyword {run} {i}",
+            "categories": [{"id": 1, "name": "정치"}, {"id": 2, "name": "경제"}],
+            "search_volume": 500 + i % 1000,
+            "increase_percentage": i % 300,
+            "active": True,
+            "start_timestamp": 1_700_000_000 + i,
+            "serpapi_google_trends_link": "https://serpapi.com/search?engine=google_trends",
+            "news_page_token": "token",
+            "serpapi_news_link": "https://serpapi.com/search?engine=google_trends_news",
+        }
+        for i in range(n)
+    ]
+
+
+def _news_items(n: int) -> List[Dict[str, Any]]:
+    run = uuid.uuid4().hex[:8]
+    return [
+        {
+            "press": BENCH_MARK,
+            "category": "정치",
+            "rank": 1 + i % 3,
+            "title": f"{BENCH_MARK} 뉴스 제목 {run} {i}",
+            "link": f"https://n.news.naver.com/article/{run}/{i}",
+        }
+        for i in range(n)
+    ]
+
+
+def _cleanup() -> None:
+    with postgres.pool.connection() as conn:
+        conn.execute("DELETE FROM trending_keywords WHERE geo = %s", (BENCH_MARK,))
+        conn.execute("DELETE FROM naver_ranking_news WHERE press = %s", (BENCH_MARK,))
+        conn.commit()
+
+
+def _timed(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _cleanup()
+    return elapsed
+
+
+def run(sizes: List[int]) -> None:
+    postgres.init_pool()
+    try:
+        _cleanup()
+        print(f"{'table':<20} {'rows':>8} {'executemany(s)':>15} {'copy(s)':>10} {'speedup':>8}")
+        for n in sizes:
+            kw = _keyword_items(n)
+            t_many = _timed(lambda: postgres.save_keywords(BENCH_MARK, "ko", 24, kw))
+            kw = _keyword_items(n)
+            t_copy = _timed(lambda: postgres.copy_keywords(BENCH_MARK, "ko", 24, kw))
+            print(f"{'trending_keywords':<20} {n:>8} {t_many:>15.3f} {t_copy:>10.3f} {t_many / t_copy:>7.1f}x")
+
+            news = _news_items(n)
+            t_many = _timed(lambda: postgres.save_naver_ranking_news(news))
+            news = _news_items(n)
+            t_copy = _timed(lambda: postgres.copy_naver_ranking_news(news))
+            print(f"{'naver_ranking_news':<20} {n:>8} {t_many:>15.3f} {t_copy:>10.3f} {t_many / t_copy:>7.1f}x")
+    finally:
+        postgres.close_pool()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="executemany vs COPY 적재 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 100_000])
+    args = parser.parse_args()
+    run(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# benchmarks/bench_rss.py
+"""
+RSS 직렬화 비교 벤치마크 (DB/네트워크 불필요).
+
+    이전 build_rss_xml (ElementTree 트리 + html.escape 후 ET 이스케이프 = 이중 이스케이프)
+        vs
+    현재 build_rss_xml / iter_rss_xml (문자열 청크, 값마다 &, <, > 가 있을 때만 str.replace 로 한 번 이스케이프)
+
+실행:
+    python -m benchmarks.bench_rss
+    python -m benchmarks.bench_rss --sizes 1 50 500 --repeat 20
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, Dict, List
+from xml.etree.ElementTree import Element, SubElement, tostring
+import argparse
+import html
+import time
+
+from app.services.rss_service import build_rss_xml, iter_rss_xml
+
+
+def build_rss_xml_elementtree(
+    raw_items: List[Dict[str, Any]],
+    feed_title: str = "뉴스 RSS 피드",
+    feed_link: str = "https://example.com",
+    feed_description: str = "GPT로 생성된 뉴스 요약 피드",
+) -> bytes:
+    """비교용: 교체 전 build_rss_xml 구현 그대로."""
+    articles: List[Dict[str, Any]] = []
+    for it in raw_items or []:
+        if not isinstance(it, dict):
+            continue
+        if "items" in it and isinstance(it["items"], list):
+            for inner in it["items"]:
+                if isinstance(inner, dict):
+                    articles.append(inner)
+        elif "title" in it or "summary" in it or "content" in it or "tags" in it:
+            articles.append(it)
+
+    now = datetime.now(timezone.utc)
+    rss = Element("rss", version="2.0")
+    channel = SubElement(rss, "channel")
+    SubElement(channel, "title").text = html.escape(feed_title)
+    SubElement(channel, "link").text = feed_link
+    SubElement(channel, "description").text = html.escape(feed_description)
+    SubElement(channel, "lastBuildDate").text = format_datetime(now)
+
+    for idx, art in enumerate(articles, start=1):
+        item_el = SubElement(channel, "item")
+        title = str(art.get("title") or f"Untitled {idx}")
+        summary = str(art.get("summary") or "")
+        content = str(art.get("content") or "")
+        description_text = (summary + "\n\n" + content).strip()
+        SubElement(item_el, "title").text = html.escape(title)
+        SubElement(item_el, "description").text = html.escape(description_text)
+
+        raw_tags = art.get("tags")
+        tag_list: List[str] = []
+        if isinstance(raw_tags, list):
+            tag_list = [str(t).strip() for t in raw_tags if str(t).strip()]
+        elif isinstance(raw_tags, str):
+            for chunk in raw_tags.replace("\r", "\n").split("\n"):
+                for p in chunk.split(","):
+                    p = p.strip()
+                    if p:
+                        tag_list.append(p)
+        tags_text = ",".join(tag_list)
+        if tags_text:
+            SubElement(item_el, "tags").text = html.escape(tags_text)
+        for tg in tag_list:
+            SubElement(item_el, "category").text = html.escape(tg)
+
+        SubElement(item_el, "guid").text = f"trend:{idx}:{int(now.timestamp())}"
+        SubElement(item_el, "pubDate").text = format_datetime(now)
+
+    return tostring(rss, encoding="utf-8", xml_declaration=True)
+
+
+def _article(i: int) -> Dict[str, Any]:
+    # 실제 생성 글과 비슷하게: 섹션 5개 × 문장 10개, 따옴표/&/< 포함
+    sections = []
+    for s in range(5):
+        sentences = " ".join(
+            f"\"{i}-{s}-{k}\" 관련 소식 & 전망, 지수 <상승> 여부가 관심입니다." for k in range(10)
+        )
+        sections.append(f"### 섹션 {s + 1}\n[[News]]\n{sentences}")
+    return {
+        "title": f"오늘의 이슈 {i}: 시장 & 정책 <분석>",
+        "summary": "핵심 요약 " * 10,
+        "content": "\n\n".join(sections),
+        "tags": "경제|정책, 시장\n금리, 환율",
+    }
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _first_item(items: List[Dict[str, Any]]) -> None:
+    # 헤더 + 첫 <item> 까지 (StreamingResponse 의 첫 바이트까지 걸리는 직렬화 시간)
+    chunks = iter_rss_xml(items)
+    next(chunks)
+    next(chunks)
+
+
+def run(sizes: List[int], repeat: int) -> None:
+    print(f"{'items':>6} {'elementtree(ms)':>16} {'build(ms)':>10} {'first chunk(ms)':>16} {'speedup':>8} {'bytes':>10}")
+    for n in sizes:
+        items = [{"items": [_article(i)]} for i in range(n)]
+        t_old = _best(lambda: build_rss_xml_elementtree(items), repeat)
+        t_new = _best(lambda: build_rss_xml(items), repeat)
+        t_first = _best(lambda: _first_item(items), repeat)
+        size = len(build_rss_xml(items))
+        print(f"{n:>6} {t_old * 1e3:>16.2f} {t_new * 1e3:>10.2f} {t_first * 1e3:>16.3f} {t_old / t_new:>7.1f}x {size:>10}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="RSS 직렬화 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 50, 500])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+# benchmarks/fake_openai.py
+"""
+로컬 OpenAI 호환 fake 서버 (POST /v1/chat/completions, stream 포함) + openai_client 동작 확인.
+
+서버만 띄우기 (앱은 OPENAI_BASE_URL=http://127.0.0.1:8765/v1 로 실행):
+    python -m benchmarks.fake_openai serve --port 8765 --latency 0.2 --error-rate 0.1 --rate-limit-rate 0.1
+
+재시도/hedging/서킷 브레이커/스트리밍 시나리오 확인 (DB 불필요):
+    python -m benchmarks.fake_openai check
+"""
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+import argparse
+import json
+import logging
+import os
+import random
+import threading
+import time
+
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    """
+    script: 앞에서부터 하나씩 꺼내 쓰는 응답 동작 목록 ("429", "500", "401", "slow", "ok").
+    비어 있으면 latency / error_rate / rate_limit_rate 에 따라 응답한다.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port: int, latency: float = 0.0, error_rate: float = 0.0, rate_limit_rate: float = 0.0):
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.latency = latency
+        self.slow_latency = 2.0
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.script: List[str] = []
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def next_action(self) -> str:
+        with self._lock:
+            self.requests += 1
+            if self.script:
+                return self.script.pop(0)
+        r = random.random()
+        if r < self.rate_limit_rate:
+            return "429"
+        if r < self.rate_limit_rate + self.error_rate:
+            return "500"
+        return "ok"
+
+
+def _answer(body: Dict[str, Any]) -> str:
+    """분류 요청이면 제목 수만큼 카테고리, 아니면 기사 JSON."""
+    user = body["messages"][-1]["content"]
+    try:
+        titles = json.loads(user)["titles"]
+        return json.dumps({"categories": ["사회"] * len(titles)}, ensure_ascii=False)
+    except (ValueError, KeyError, TypeError):
+        return json.dumps(
+            {
+                "title": "fake 제목",
+                "summary": "fake 요약",
+                "content": "### 섹션\n" + "본문 " * 50,
+                "tags": "fake|test",
+            },
+            ensure_ascii=False,
+        )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: FakeOpenAIServer
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+    def _json(self, status: int, payload: Dict[str, Any], headers: Dict[str, str] | None = None) -> None:
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self) -> None:
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._json(404, {"error": {"message": "not found"}})
+            return
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+
+        action = self.server.next_action()
+        time.sleep(self.server.slow_latency if action == "slow" else self.server.latency)
+        if action == "429":
+            self._json(429, {"error": {"message": "rate limited", "type": "rate_limit"}}, {"retry-after": "0"})
+            return
+        if action == "500":
+            self._json(500, {"error": {"message": "upstream error", "type": "server_error"}})
+            return
+        if action == "401":
+            self._json(401, {"error": {"message": "invalid api key", "type": "invalid_request_error"}})
+            return
+
+        text = _answer(body)
+        base = {"id": "chatcmpl-fake", "created": int(time.time()), "model": body.get("model", "fake")}
+        usage = {"prompt_tokens": 100, "completion_tokens": len(text), "total_tokens": 100 + len(text)}
+
+        if not body.get("stream"):
+            self._json(200, {
+                **base,
+                "object": "chat.completion",
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": text}}],
+                "usage": usage,
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        for i in range(0, len(text), 16):
+            chunk = {**base, "object": "chat.completion.chunk",
+                     "choices": [{"index": 0, "delta": {"content": text[i:i + 16]}, "finish_reason": None}]}
+            self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+        final = {**base, "object": "chat.completion.chunk", "choices": [], "usage": usage}
+        self.wfile.write(f"data: {json.dumps(final)}\n\ndata: [DONE]\n\n".encode("utf-8"))
+
+
+# ---------------------------
+# 시나리오 확인
+# ---------------------------
+
+def check() -> int:
+    server = FakeOpenAIServer(0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    os.environ.setdefault("OPENAI_API_KEY", "fake")
+    logging.disable(logging.WARNING)  # DB 없이 실행하므로 캐시/기록 경고는 숨김
+
+    # OPENAI_BASE_URL 을 설정한 뒤에 import 해야 fake 서버를 가리킨다
+    from app.core.config import settings
+    from app.services import llm_service, openai_client
+
+    settings.OPENAI_RETRY_BASE_SECONDS = 0.05
+    failures = 0
+
+    def report(name: str, ok: bool, detail: str = "") -> None:
+        nonlocal failures
+        failures += 0 if ok else 1
+        print(f"{'PASS' if ok else 'FAIL'}  {name}  {detail}")
+
+    def generate() -> Dict[str, Any]:
+        return llm_service.generate_rss_feed_by_gpt("테스트", 30, "대한민국", "남성", "유쾌한", use_cache=False)
+
+    server.script = []
+    report("generation", generate()["items"][0]["title"] == "fake 제목")
+
+    server.script, before = ["429", "500"], server.requests
+    out = generate()
+    report("retry on 429/5xx", bool(out["items"]) and server.requests - before == 3,
+           f"requests={server.requests - before}")
+
+    server.script = ["slow"]
+    settings.OPENAI_GENERATION_HEDGE_SECONDS = 0.3
+    started = time.perf_counter()
+    generate()
+    elapsed = time.perf_counter() - started
+    settings.OPENAI_GENERATION_HEDGE_SECONDS = 0.0
+    report("hedged request", elapsed < server.slow_latency, f"{elapsed:.2f}s")
+
+    cats = llm_service.categorize_news_titles_by_gpt([f"제목 {i}" for i in range(12)])
+    report("categorization", cats == ["사회"] * 12)
+
+    server.script, before = ["401"] * 40, server.requests
+    batch_before = llm_service._category_batch_size.value
+    cats = llm_service.categorize_news_titles_by_gpt([f"제목 {i}" for i in range(40)])
+    server.script = []
+    report("no bisection on 401", cats == ["기타"] * 40 and llm_service._category_batch_size.value == batch_before,
+           f"requests={server.requests - before}")
+
+    events = list(llm_service.stream_rss_feed_by_gpt("스트림", 30, "대한민국", "남성", "유쾌한", use_cache=False))
+    report("streaming", events[-1][0] == "item" and sum(e == "delta" for e, _ in events) > 1,
+           f"events={len(events)}")
+
+    # 스트림 기록: 연결 실패 시도 1행 + 연결된 스트림 1행(retries=1), 클라이언트가 끊으면 cancelled
+    from app.services import llm_usage
+    recorded: List[tuple] = []
+    original_record = llm_usage.record
+
+    def capture(feature, model, seconds, usage=None, error=None, retries=0, hedge=False):
+        recorded.append((feature, type(error).__name__ if error else "ok", retries, usage is not None))
+        original_record(feature, model, seconds, usage=usage, error=error, retries=retries, hedge=hedge)
+
+    llm_usage.record = capture
+    try:
+        server.script = ["500"]
+        list(llm_service.stream_rss_feed_by_gpt("스트림", 30, "대한민국", "남성", "유쾌한", use_cache=False))
+        report("stream recorded once per attempt",
+               recorded == [("generation_stream", "InternalServerError", 0, False),
+                            ("generation_stream", "ok", 1, True)], f"{recorded}")
+
+        recorded.clear()
+        gen = llm_service.stream_rss_feed_by_gpt("스트림", 30, "대한민국", "남성", "유쾌한", use_cache=False)
+        next(gen)
+        gen.close()
+        report("client disconnect is cancelled", [r[1] for r in recorded] == ["GeneratorExit"], f"{recorded}")
+
+        # 로컬 오류는 브레이커 실패 수를 초기화하지 않는다
+        openai_client.breaker.failure()
+        failures_before = openai_client.breaker._failures
+        try:
+            openai_client.chat_completion("local", deadline=5, messages=[], bogus_kwarg=True)
+        except TypeError:
+            pass
+        report("local error leaves breaker alone", openai_client.breaker._failures == failures_before)
+        openai_client.breaker.success()
+    finally:
+        llm_usage.record = original_record
+
+    openai_client.breaker.failure_threshold = 3
+    openai_client.breaker.reset_timeout = 0.5
+    settings.OPENAI_MAX_RETRIES = 5
+    server.script = ["500"] * 20
+    try:
+        generate()
+        report("circuit opens", False)
+    except openai_client.CircuitOpenError:
+        report("circuit opens", True, f"state={openai_client.breaker.state}")
+    started = time.perf_counter()
+    cats = llm_service.categorize_news_titles_by_gpt(["제목"])
+    report("fail fast while open", cats == ["기타"] and time.perf_counter() - started < 0.1)
+
+    # half-open 시험 호출 허가 뒤 deadline 이 이미 지난 경우에도 브레이커가 막힌 채로 남지 않아야 함
+    time.sleep(0.6)
+    try:
+        openai_client.chat_completion("probe", deadline=0, messages=[{"role": "user", "content": "x"}])
+    except openai_client.DeadlineExceeded:
+        pass
+    server.script = []
+    report("circuit closes after probe", bool(generate()["items"]), f"state={openai_client.breaker.state}")
+
+    # hedge 실행기가 가득 차면 대기열에 쌓지 않고 hedging 없이 호출, 기다리는 동안에도 deadline 을 지킨다
+    server.script = ["slow"]
+    settings.OPENAI_GENERATION_HEDGE_SECONDS = 0.3
+    held = [openai_client._hedge_slots.acquire(blocking=False) for _ in range(settings.OPENAI_HEDGE_WORKERS)]
+    out = generate()
+    for ok in held:
+        if ok:
+            openai_client._hedge_slots.release()
+    report("no hedge when saturated", bool(out["items"]))
+
+    server.script = ["slow", "slow"]
+    started = time.perf_counter()
+    try:
+        openai_client.chat_completion("generation", deadline=0.8, hedge_after=0.3,
+                                      messages=[{"role": "user", "content": "x"}])
+        report("hedged wait honours deadline", False)
+    except openai_client.DeadlineExceeded:
+        elapsed = time.perf_counter() - started
+        report("hedged wait honours deadline", elapsed < 1.2, f"{elapsed:.2f}s")
+    settings.OPENAI_GENERATION_HEDGE_SECONDS = 0.0
+    openai_client.breaker.success()
+
+    server.shutdown()
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 OpenAI 호환 fake 서버")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve = sub.add_parser("serve")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--latency", type=float, default=0.0)
+    serve.add_argument("--error-rate", type=float, default=0.0)
+    serve.add_argument("--rate-limit-rate", type=float, default=0.0)
+    sub.add_parser("check")
+    args = parser.parse_args()
+
+    if args.command == "check":
+        raise SystemExit(1 if check() else 0)
+
+    server = FakeOpenAIServer(args.port, args.latency, args.error_rate, args.rate_limit_rate)
+    print(f"fake OpenAI server on http://127.0.0.1:{args.port}/v1")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()